@@ -80,6 +80,7 @@ from stageflow.events import (
     NoOpEventSink,
     clear_event_sink,
     get_event_sink,
+    reset_event_sink,
     set_event_sink,
 )
 
@@ -284,6 +285,7 @@ __all__ = [
     "BackpressureAwareEventSink",
     "get_event_sink",
     "set_event_sink",
+    "reset_event_sink",
     "clear_event_sink",
     # Protocols
     "RunStore",
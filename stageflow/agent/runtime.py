@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 from dataclasses import dataclass
+from functools import cache
 from typing import Any
 from uuid import uuid4
+from weakref import WeakKeyDictionary
 
 from pydantic import BaseModel, Field, model_validator
 
@@ -33,6 +36,9 @@ class AgentConfig:
     max_validation_retries: int = 2
     temperature: float = 0.0
     max_tokens: int | None = None
+    # Tool calls in one turn may depend on each other (e.g. write then read),
+    # so they run in order unless the caller opts in to concurrent dispatch.
+    parallel_tool_calls: bool = False
 
 
 @dataclass(frozen=True, slots=True)
@@ -88,6 +94,38 @@ class AgentRunResult(BaseModel):
     security: list[dict[str, Any]] = Field(default_factory=list)
 
 
+# Shared default policy; PromptSecurityPolicy holds no per-run state, so agents
+# constructed without an explicit policy reuse one instead of rebuilding it.
+_default_security_policy: PromptSecurityPolicy | None = None
+
+
+def _get_default_security_policy() -> PromptSecurityPolicy:
+    """Get the shared default prompt security policy."""
+    global _default_security_policy
+    if _default_security_policy is None:
+        _default_security_policy = PromptSecurityPolicy()
+    return _default_security_policy
+
+
+# Default prompt libraries are likewise shared per Agent class; the runtime only
+# reads from them, so rebuilding and re-registering templates per agent is waste.
+_default_prompt_libraries: WeakKeyDictionary[type[Agent], PromptLibrary] = WeakKeyDictionary()
+
+
+def _get_default_prompt_library(agent_cls: type[Agent]) -> PromptLibrary:
+    """Get the shared default prompt library for ``agent_cls``."""
+    library = _default_prompt_libraries.get(agent_cls)
+    if library is None:
+        library = _default_prompt_libraries[agent_cls] = agent_cls._default_prompt_library()
+    return library
+
+
+@cache
+def _agent_turn_schema_json() -> str:
+    """Render the AgentTurn JSON schema once; it is identical for every prompt."""
+    return json.dumps(AgentTurn.model_json_schema(), indent=2, sort_keys=True)
+
+
 class Agent:
     """LLM-backed agent runtime with a functional tool loop."""
 
@@ -107,11 +145,11 @@ class Agent:
     ) -> None:
         self._llm_client = llm_client
         self._config = config or AgentConfig()
-        self._prompt_library = prompt_library or self._default_prompt_library()
+        self._prompt_library = prompt_library or _get_default_prompt_library(type(self))
         self._prompt_name = prompt_name or self.DEFAULT_PROMPT_NAME
         self._prompt_version = prompt_version
         self._tool_registry = tool_registry or get_tool_registry()
-        self._security_policy = security_policy or PromptSecurityPolicy()
+        self._security_policy = security_policy or _get_default_security_policy()
         self._turn_output = TypedLLMOutput(AgentTurn, strict=False)
 
     async def run(
@@ -171,7 +209,7 @@ class Agent:
     def _render_prompt(self, prompt_variables: dict[str, Any] | None) -> RenderedPrompt:
         variables = {
             "tool_descriptions": self._format_tools(),
-            "response_schema": json.dumps(AgentTurn.model_json_schema(), indent=2, sort_keys=True),
+            "response_schema": _agent_turn_schema_json(),
             "max_turns": self._config.max_turns,
             **(prompt_variables or {}),
         }
@@ -204,12 +242,16 @@ class Agent:
         results: list[AgentToolResult] = []
         reports: list[PromptSecurityReport] = []
         ctx_dict = stage_context.to_dict() if stage_context is not None else {}
+        parallel = self._config.parallel_tool_calls
 
-        for call in tool_calls:
+        async def run_call(call: AgentToolCall) -> tuple[str, AgentToolResult]:
             resolved_call_id = call.call_id or str(uuid4())
             action = _AgentAction(id=uuid4(), type=call.name, payload=call.arguments)
             try:
-                output = await self._tool_registry.execute(action, ctx_dict)
+                # Sequential calls share one context dict so state can pass between
+                # them; concurrent calls each get a copy so they cannot race on it.
+                call_ctx = dict(ctx_dict) if parallel else ctx_dict
+                output = await self._tool_registry.execute(action, call_ctx)
                 if output is None:
                     tool_result = AgentToolResult(
                         call_id=resolved_call_id,
@@ -232,7 +274,15 @@ class Agent:
                     success=False,
                     error=str(exc),
                 )
+            return resolved_call_id, tool_result
+
+        # Results are reinjected in the order the model requested them either way.
+        if self._config.parallel_tool_calls:
+            executed = await asyncio.gather(*(run_call(call) for call in tool_calls))
+        else:
+            executed = [await run_call(call) for call in tool_calls]
 
+        for call, (resolved_call_id, tool_result) in zip(tool_calls, executed, strict=True):
             message, report = self._security_policy.build_tool_message(
                 tool_name=call.name,
                 call_id=resolved_call_id,
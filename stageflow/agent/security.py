@@ -9,6 +9,16 @@ from typing import Any
 
 from stageflow.helpers.guardrails import GuardrailResult, InjectionDetector
 
+_CONTROL_TOKEN_REPLACEMENTS = tuple(
+    (re.compile(pattern, re.IGNORECASE), replacement)
+    for pattern, replacement in (
+        (r"<\s*/?\s*system\s*>", "‹system›"),
+        (r"<\s*/?\s*developer\s*>", "‹developer›"),
+        (r"\[\s*SYSTEM\s*\]", "［SYSTEM］"),
+        (r"\[\s*DEVELOPER\s*\]", "［DEVELOPER］"),
+    )
+)
+
 
 class PromptSecurityError(ValueError):
     """Raised when prompt security policy blocks content."""
@@ -146,16 +156,9 @@ class PromptSecurityPolicy:
 
     @staticmethod
     def _neutralize_control_tokens(text: str) -> str:
-        replacements = {
-            r"<\s*/?\s*system\s*>": "‹system›",
-            r"<\s*/?\s*developer\s*>": "‹developer›",
-            r"\[\s*SYSTEM\s*\]": "［SYSTEM］",
-            r"\[\s*DEVELOPER\s*\]": "［DEVELOPER］",
-        }
-
         sanitized = text
-        for pattern, replacement in replacements.items():
-            sanitized = re.sub(pattern, replacement, sanitized, flags=re.IGNORECASE)
+        for pattern, replacement in _CONTROL_TOKEN_REPLACEMENTS:
+            sanitized = pattern.sub(replacement, sanitized)
         return sanitized
 
 
@@ -6,6 +6,7 @@ import json
 import re
 from collections.abc import Sequence
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any, Generic, TypeVar
 
 from pydantic import BaseModel
@@ -16,6 +17,12 @@ _ModelT = TypeVar("_ModelT", bound=BaseModel)
 _MISSING = object()
 
 
+@lru_cache(maxsize=64)
+def _model_schema_json(model: type[BaseModel]) -> str:
+    """Serialize ``model``'s JSON schema, cached per model class for retry prompts."""
+    return json.dumps(model.model_json_schema(), sort_keys=True)
+
+
 class LLMOutputValidationError(ValueError):
     """Raised when LLM output cannot be validated after retries."""
 
@@ -132,7 +139,7 @@ class TypedLLMOutput(Generic[_ModelT]):
         raise LLMOutputValidationError(self._model, errors, last_response)
 
     def _retry_prompt(self, error: str) -> str:
-        schema = json.dumps(self._model.model_json_schema(), sort_keys=True)
+        schema = _model_schema_json(self._model)
         return (
             "Your previous response was invalid. Return ONLY a valid JSON object, with no markdown, "
             f"that matches this schema: {schema}. Validation error: {error}"
@@ -26,7 +26,7 @@ from stageflow.context.enrichments import (
     ProfileEnrichment,
 )
 from stageflow.context.extensions import ExtensionBundle
-from stageflow.context.identity import RunIdentity
+from stageflow.context.identity import RunIdentity, _parse_uuid
 from stageflow.context.types import Message, RoutingDecision
 
 # Type variable for user-defined extensions
@@ -266,12 +266,12 @@ class ContextSnapshot(Generic[T]):
         else:
             # Legacy flat format
             run_id = RunIdentity(
-                pipeline_run_id=UUID(data["pipeline_run_id"]) if data.get("pipeline_run_id") else None,
-                request_id=UUID(data["request_id"]) if data.get("request_id") else None,
-                session_id=UUID(data["session_id"]) if data.get("session_id") else None,
-                user_id=UUID(data["user_id"]) if data.get("user_id") else None,
-                org_id=UUID(data["org_id"]) if data.get("org_id") else None,
-                interaction_id=UUID(data["interaction_id"]) if data.get("interaction_id") else None,
+                pipeline_run_id=_parse_uuid(data.get("pipeline_run_id")),
+                request_id=_parse_uuid(data.get("request_id")),
+                session_id=_parse_uuid(data.get("session_id")),
+                user_id=_parse_uuid(data.get("user_id")),
+                org_id=_parse_uuid(data.get("org_id")),
+                interaction_id=_parse_uuid(data.get("interaction_id")),
             )
 
         # Parse enrichments - prefer new composed format, allow new canonical bundles, fall back to flat legacy fields
@@ -24,11 +24,18 @@ Example:
 from __future__ import annotations
 
 from dataclasses import dataclass, fields, is_dataclass
+from functools import cache
 from typing import Any, TypeVar
 
 T = TypeVar("T", bound="ExtensionBundle")
 
 
+@cache
+def _field_names(cls: type) -> tuple[str, ...]:
+    """Return the dataclass field names of ``cls``, computed once per class."""
+    return tuple(f.name for f in fields(cls))
+
+
 @dataclass(frozen=True)
 class ExtensionBundle:
     """Base class for user-defined context extensions.
@@ -56,11 +63,7 @@ class ExtensionBundle:
         Returns:
             Dictionary representation of the extension bundle.
         """
-        result: dict[str, Any] = {}
-        for f in fields(self):
-            value = getattr(self, f.name)
-            result[f.name] = _serialize_value(value)
-        return result
+        return {name: _serialize_value(getattr(self, name)) for name in _field_names(type(self))}
 
     @classmethod
     def from_dict(cls: type[T], data: dict[str, Any]) -> T:
@@ -96,10 +99,9 @@ def _serialize_value(value: Any) -> Any:
         if hasattr(value, "to_dict"):
             return value.to_dict()
         # Fallback for dataclasses without to_dict
-        result = {}
-        for f in fields(value):
-            result[f.name] = _serialize_value(getattr(value, f.name))
-        return result
+        return {
+            name: _serialize_value(getattr(value, name)) for name in _field_names(type(value))
+        }
 
     # Handle lists
     if isinstance(value, list):
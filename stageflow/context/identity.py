@@ -17,6 +17,11 @@ def _utc_now() -> datetime:
     return datetime.now(UTC)
 
 
+def _parse_uuid(value: Any) -> UUID | None:
+    """Parse a serialized UUID, treating missing or empty values as None."""
+    return UUID(value) if value else None
+
+
 @dataclass(frozen=True, slots=True)
 class RunIdentity:
     """Grouped run identification fields.
@@ -75,18 +80,16 @@ class RunIdentity:
         Returns:
             RunIdentity instance.
         """
-        created_at = _utc_now()
-        if data.get("created_at"):
-            created_at = datetime.fromisoformat(data["created_at"])
+        created_at = data.get("created_at")
 
         return cls(
-            pipeline_run_id=UUID(data["pipeline_run_id"]) if data.get("pipeline_run_id") else None,
-            request_id=UUID(data["request_id"]) if data.get("request_id") else None,
-            session_id=UUID(data["session_id"]) if data.get("session_id") else None,
-            user_id=UUID(data["user_id"]) if data.get("user_id") else None,
-            org_id=UUID(data["org_id"]) if data.get("org_id") else None,
-            interaction_id=UUID(data["interaction_id"]) if data.get("interaction_id") else None,
-            created_at=created_at,
+            pipeline_run_id=_parse_uuid(data.get("pipeline_run_id")),
+            request_id=_parse_uuid(data.get("request_id")),
+            session_id=_parse_uuid(data.get("session_id")),
+            user_id=_parse_uuid(data.get("user_id")),
+            org_id=_parse_uuid(data.get("org_id")),
+            interaction_id=_parse_uuid(data.get("interaction_id")),
+            created_at=datetime.fromisoformat(created_at) if created_at else _utc_now(),
         )
 
     def with_pipeline_run_id(self, pipeline_run_id: UUID) -> RunIdentity:
@@ -16,9 +16,11 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import sys
 from collections.abc import Callable
 from dataclasses import dataclass
 from datetime import UTC, datetime
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any
 from uuid import UUID
 from warnings import warn
@@ -34,6 +36,12 @@ if TYPE_CHECKING:
 logger = logging.getLogger("stageflow.core.stage_context")
 
 
+@lru_cache(maxsize=32)
+def _status_event_type(status: str) -> str:
+    """Return the interned ``stage.<status>`` event type for a lifecycle status."""
+    return sys.intern(f"stage.{status}")
+
+
 class StageCancellationRequested(Exception):
     """Raised when cooperative stage cancellation has been requested."""
 
@@ -122,13 +130,25 @@ class StageContext:
             type: Event type string (e.g., "tool.completed")
             data: Event payload data
         """
-        enriched_data = {
-            "pipeline_run_id": str(self.pipeline_run_id) if self.pipeline_run_id else None,
-            "request_id": str(self.request_id) if self.request_id else None,
-            "execution_mode": self.execution_mode,
-            **data,
+        enriched_data = self._correlation_fields()
+        enriched_data.update(data)
+        self._emit_enriched(type, enriched_data)
+
+    def _correlation_fields(self) -> dict[str, Any]:
+        """Correlation fields prepended to every event emitted from this context."""
+        # Read the identity once rather than hopping through the compat properties per field.
+        snapshot = self.snapshot
+        run_id = snapshot.run_id
+        pipeline_run_id = run_id.pipeline_run_id
+        request_id = run_id.request_id
+        return {
+            "pipeline_run_id": str(pipeline_run_id) if pipeline_run_id else None,
+            "request_id": str(request_id) if request_id else None,
+            "execution_mode": snapshot.execution_mode,
         }
 
+    def _emit_enriched(self, type: str, enriched_data: dict[str, Any]) -> None:
+        """Emit an already-enriched event payload through the sink (or log it)."""
         if self.event_sink is not None:
             try:
                 self.event_sink.try_emit(type=type, data=enriched_data)
@@ -164,13 +184,13 @@ class StageContext:
             status: Event status (e.g., "started", "completed", "failed")
             **kwargs: Additional event data
         """
-        event_data = {
-            "stage": stage,
-            "status": status,
-            "stage_name": self.stage_name,
-            **kwargs,
-        }
-        self.try_emit_event(f"stage.{status}", event_data)
+        event_data = self._correlation_fields()
+        event_data["stage"] = stage
+        event_data["status"] = status
+        event_data["stage_name"] = self.stage_name
+        if kwargs:
+            event_data.update(kwargs)
+        self._emit_enriched(_status_event_type(status), event_data)
 
     def as_pipeline_context(
         self,
@@ -134,27 +134,28 @@ class StageOutput:
         Returns:
             New StageOutput instance with duration_ms set.
         """
+        # Positional in field order: runs once per stage, and avoids keyword binding.
         return StageOutput(
-            status=self.status,
-            data=self.data,
-            artifacts=self.artifacts,
-            events=self.events,
-            error=self.error,
-            duration_ms=duration_ms,
-            version=self.version,
+            self.status,
+            self.data,
+            self.artifacts,
+            self.events,
+            self.error,
+            duration_ms,
+            self.version,
         )
 
     def with_version(self, version: str) -> StageOutput:
         """Return a copy with an explicit schema version tag."""
 
         return StageOutput(
-            status=self.status,
-            data=self.data,
-            artifacts=self.artifacts,
-            events=self.events,
-            error=self.error,
-            duration_ms=self.duration_ms,
-            version=version,
+            self.status,
+            self.data,
+            self.artifacts,
+            self.events,
+            self.error,
+            self.duration_ms,
+            version,
         )
 
 
@@ -12,6 +12,7 @@ from stageflow.events.sink import (
     NoOpEventSink,
     clear_event_sink,
     get_event_sink,
+    reset_event_sink,
     set_event_sink,
     wait_for_event_sink_tasks,
 )
@@ -35,6 +36,7 @@ __all__ = [
     "NoOpEventSink",
     "clear_event_sink",
     "get_event_sink",
+    "reset_event_sink",
     "set_event_sink",
     "wait_for_event_sink_tasks",
     "emit_event",
@@ -13,7 +13,7 @@ import contextlib
 import logging
 import time
 from collections.abc import Callable
-from contextvars import ContextVar
+from contextvars import ContextVar, Token
 from dataclasses import dataclass
 from typing import Any, Protocol, runtime_checkable
 
@@ -169,6 +169,10 @@ class BackpressureAwareEventSink:
 
     async def start(self) -> None:
         """Start the background worker."""
+        self._start_worker()
+
+    def _start_worker(self) -> None:
+        """Spawn the worker task on the running loop if it is not already running."""
         if self._running:
             return
         self._running = True
@@ -190,7 +194,7 @@ class BackpressureAwareEventSink:
 
         self._running = False
 
-        if drain and not self._queue.empty():
+        if drain:
             try:
                 await asyncio.wait_for(self._drain(), timeout=timeout)
             except TimeoutError:
@@ -211,40 +215,62 @@ class BackpressureAwareEventSink:
         )
 
     async def _drain(self) -> None:
-        """Process all remaining events in the queue."""
-        while not self._queue.empty():
-            try:
-                event_type, data = self._queue.get_nowait()
-                await self._downstream.emit(type=event_type, data=data)
-                self._queue.task_done()
-            except asyncio.QueueEmpty:
-                break
+        """Wait until every queued event, including the worker's batch, is forwarded."""
+        if self._worker_task is None or self._worker_task.done():
+            # No worker left to empty the queue, so forward what remains here.
+            while True:
+                try:
+                    event_type, data = self._queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    break
+                try:
+                    await self._forward(event_type, data)
+                finally:
+                    self._queue.task_done()
+        await self._queue.join()
 
     async def _worker(self) -> None:
-        """Background worker that processes events from the queue."""
-        while self._running:
+        """Background worker that processes events from the queue.
+
+        Each wakeup takes everything already queued and forwards it as one
+        batch, so a burst of events pays for a single wait instead of one per
+        event. An idle worker stays parked in ``get()`` until stop() cancels it;
+        after stop() it keeps going until the queue is empty so a drain can
+        wait on ``join()``.
+        """
+        while self._running or not self._queue.empty():
             try:
-                event_type, data = await asyncio.wait_for(
-                    self._queue.get(), timeout=0.1
-                )
+                batch = [await self._queue.get()]
+            except asyncio.CancelledError:
+                break
+            while True:
                 try:
-                    await self._downstream.emit(type=event_type, data=data)
-                except Exception as e:
-                    self._logger.error(
-                        f"Failed to emit event to downstream: {e}",
-                        extra={"event_type": event_type, "error": str(e)},
-                    )
-                finally:
-                    self._queue.task_done()
-            except TimeoutError:
-                continue
+                    batch.append(self._queue.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+            try:
+                for event_type, data in batch:
+                    await self._forward(event_type, data)
             except asyncio.CancelledError:
                 break
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    async def _forward(self, event_type: str, data: dict[str, Any] | None) -> None:
+        """Emit a dequeued event downstream, logging rather than raising failures."""
+        try:
+            await self._downstream.emit(type=event_type, data=data)
+        except Exception as e:
+            self._logger.error(
+                f"Failed to emit event to downstream: {e}",
+                extra={"event_type": event_type, "error": str(e)},
+            )
 
     async def emit(self, *, type: str, data: dict[str, Any] | None) -> None:
         """Emit an event asynchronously, blocking if queue is full."""
         if not self._running:
-            await self.start()
+            self._start_worker()
         await self._queue.put((type, data))
         self._metrics.record_emit()
 
@@ -255,7 +281,7 @@ class BackpressureAwareEventSink:
             True if event was queued, False if dropped due to backpressure.
         """
         if not self._running:
-            asyncio.create_task(self.start())
+            self._start_worker()
 
         try:
             self._queue.put_nowait((type, data))
@@ -280,8 +306,19 @@ _event_sink_var: ContextVar[EventSink | None] = ContextVar("event_sink", default
 _pending_emit_tasks: set[asyncio.Task[Any]] = set()
 
 
-def set_event_sink(sink: EventSink) -> None:
-    _event_sink_var.set(sink)
+def set_event_sink(sink: EventSink) -> Token[EventSink | None]:
+    """Install ``sink`` for the current context.
+
+    Returns a token that can be passed to ``reset_event_sink`` to restore
+    whichever sink was active before, so a run can scope its sink without
+    clobbering the caller's.
+    """
+    return _event_sink_var.set(sink)
+
+
+def reset_event_sink(token: Token[EventSink | None]) -> None:
+    """Restore the event sink that was active before ``set_event_sink``."""
+    _event_sink_var.reset(token)
 
 
 def clear_event_sink() -> None:
@@ -315,5 +352,6 @@ __all__ = [
     "set_event_sink",
     "clear_event_sink",
     "get_event_sink",
+    "reset_event_sink",
     "wait_for_event_sink_tasks",
 ]
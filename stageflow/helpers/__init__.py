@@ -11,6 +11,7 @@ This package provides reusable helpers for common pipeline patterns:
 - uuid_utils: UUID collision detection and telemetry
 - memory_tracker: Runtime memory growth tracking
 - compression: Delta compression utilities for context payloads
+- llm_cache: Response caching for chat LLM clients
 """
 
 from stageflow.helpers.analytics import (
@@ -33,6 +34,7 @@ from stageflow.helpers.guardrails import (
     PolicyViolation,
     ViolationType,
 )
+from stageflow.helpers.llm_cache import CachingLLMClient
 from stageflow.helpers.memory import (
     InMemoryStore,
     MemoryConfig,
@@ -82,6 +84,7 @@ from stageflow.helpers.uuid_utils import (
     UuidCollisionMonitor,
     UuidEvent,
     UuidEventListener,
+    generate_uuid4,
     generate_uuid7,
 )
 
@@ -137,6 +140,7 @@ __all__ = [
     "LLMResponse",
     "STTResponse",
     "TTSResponse",
+    "CachingLLMClient",
     # Timestamp helpers
     "parse_timestamp",
     "detect_unix_precision",
@@ -146,6 +150,7 @@ __all__ = [
     "UuidEvent",
     "UuidEventListener",
     "ClockSkewDetector",
+    "generate_uuid4",
     "generate_uuid7",
     "MemoryTracker",
     "MemorySample",
@@ -29,13 +29,18 @@ from __future__ import annotations
 import asyncio
 import contextlib
 import json
+import logging
+import re
 from collections.abc import Callable
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Protocol
 from uuid import UUID
 
+logger = logging.getLogger("stageflow.helpers.analytics")
+
 # Type alias for overflow callback
 OverflowCallback = Callable[[int, int], None]  # (dropped_count, buffer_size) -> None
 
@@ -167,9 +172,10 @@ class JSONFileExporter:
         """Export multiple events."""
         async with self._lock:
             await self._ensure_open()
-            for event in events:
-                line = json.dumps(event.to_dict(), default=str)
-                self._file.write(line + "\n")
+            # Encode the whole batch into one buffer and hand it to the file once.
+            self._file.write(
+                "".join(json.dumps(event.to_dict(), default=str) + "\n" for event in events)
+            )
             self._event_count += len(events)
 
     async def flush(self) -> None:
@@ -191,6 +197,27 @@ class JSONFileExporter:
         return self._event_count
 
 
+@lru_cache(maxsize=256)
+def _console_header_parts(event_type: str, colorize: bool) -> tuple[str, str]:
+    """Return the text before and after the timestamp in a console header line.
+
+    Event types repeat heavily, so the color choice and the formatted suffix are
+    computed once per type instead of on every exported event.
+    """
+    if not colorize:
+        return "[", f"] {event_type}"
+
+    if "error" in event_type or "fail" in event_type:
+        color = "\033[91m"  # Red
+    elif "complete" in event_type or "success" in event_type:
+        color = "\033[92m"  # Green
+    elif "start" in event_type:
+        color = "\033[94m"  # Blue
+    else:
+        color = "\033[96m"  # Cyan
+    return f"{color}[", f"] {event_type}\033[0m"
+
+
 class ConsoleExporter:
     """Exports analytics events to console for debugging.
 
@@ -219,25 +246,13 @@ class ConsoleExporter:
 
     def _format_event(self, event: AnalyticsEvent) -> str:
         """Format event for display."""
-        # Color codes
-        if self._colorize:
-            reset = "\033[0m"
-            if "error" in event.event_type or "fail" in event.event_type:
-                color = "\033[91m"  # Red
-            elif "complete" in event.event_type or "success" in event.event_type:
-                color = "\033[92m"  # Green
-            elif "start" in event.event_type:
-                color = "\033[94m"  # Blue
-            else:
-                color = "\033[96m"  # Cyan
-        else:
-            reset = color = ""
+        prefix, suffix = _console_header_parts(event.event_type, self._colorize)
 
         # Format timestamp
         ts = event.timestamp.strftime("%H:%M:%S.%f")[:-3]
 
         # Build output
-        parts = [f"{color}[{ts}] {event.event_type}{reset}"]
+        parts = [prefix + ts + suffix]
 
         if event.stage_name:
             parts.append(f"  stage: {event.stage_name}")
@@ -256,8 +271,11 @@ class ConsoleExporter:
 
     async def export_batch(self, events: list[AnalyticsEvent]) -> None:
         """Export multiple events."""
-        for event in events:
-            await self.export(event)
+        if not events:
+            return
+        # Format the whole batch into one string and write it with a single print.
+        print("\n".join(map(self._format_event, events)))
+        self._event_count += len(events)
 
     async def flush(self) -> None:
         """No-op for console."""
@@ -483,6 +501,9 @@ class AnalyticsSink:
 
         # Use as event sink
         ctx.event_sink = sink
+
+        # Before shutdown, wait for events queued by try_emit()
+        await sink.close()
     """
 
     def __init__(
@@ -491,6 +512,7 @@ class AnalyticsSink:
         *,
         include_patterns: list[str] | None = None,
         exclude_patterns: list[str] | None = None,
+        max_pending: int = 10000,
     ) -> None:
         """Initialize sink.
 
@@ -498,52 +520,127 @@ class AnalyticsSink:
             exporter: Exporter to write to.
             include_patterns: Event type patterns to include (default: all).
             exclude_patterns: Event type patterns to exclude.
+            max_pending: Maximum events queued by try_emit() awaiting export;
+                further events are dropped until the drainer catches up.
         """
         self._exporter = exporter
         self._include = include_patterns
         self._exclude = exclude_patterns or []
+        # Patterns are plain substrings; one escaped alternation checks them all
+        # in a single scan of the event type.
+        self._include_re = self._substring_regex(include_patterns)
+        self._exclude_re = self._substring_regex(self._exclude)
+        self._max_pending = max_pending
+        self._pending: asyncio.Queue[AnalyticsEvent] | None = None
+        self._drain_task: asyncio.Task[None] | None = None
+        self._dropped_count = 0
+
+    @property
+    def dropped_count(self) -> int:
+        """Number of try_emit() events dropped because the pending queue was full."""
+        return self._dropped_count
+
+    @staticmethod
+    def _substring_regex(patterns: list[str] | None) -> re.Pattern[str] | None:
+        if not patterns:
+            return None
+        return re.compile("|".join(map(re.escape, patterns)))
 
     def _should_export(self, event_type: str) -> bool:
         """Check if event should be exported."""
         # Check excludes first
-        for pattern in self._exclude:
-            if pattern in event_type:
-                return False
+        if self._exclude_re is not None and self._exclude_re.search(event_type):
+            return False
 
         # If includes specified, check them
-        if self._include:
-            return any(pattern in event_type for pattern in self._include)
+        if self._include_re is not None:
+            return self._include_re.search(event_type) is not None
 
         return True
 
-    async def emit(self, *, type: str, data: dict[str, Any] | None) -> None:
-        """Emit an event asynchronously."""
-        if not self._should_export(type):
-            return
-
-        event = AnalyticsEvent(
+    @staticmethod
+    def _to_event(type: str, data: dict[str, Any] | None) -> AnalyticsEvent:
+        return AnalyticsEvent(
             event_type=type,
             data=data or {},
             pipeline_run_id=data.get("pipeline_run_id") if data else None,
             stage_name=data.get("stage") if data else None,
             duration_ms=data.get("duration_ms") if data else None,
         )
-        await self._exporter.export(event)
+
+    async def emit(self, *, type: str, data: dict[str, Any] | None) -> None:
+        """Emit an event asynchronously."""
+        if not self._should_export(type):
+            return
+
+        await self._exporter.export(self._to_event(type, data))
 
     def try_emit(self, *, type: str, data: dict[str, Any] | None) -> None:
-        """Emit an event synchronously (fire-and-forget)."""
+        """Emit an event synchronously (fire-and-forget).
+
+        The event is queued and exported by a single background drainer, so
+        callers never wait on the exporter and export order matches emit order.
+        """
         if not self._should_export(type):
             return
 
-        event = AnalyticsEvent(
-            event_type=type,
-            data=data or {},
-            pipeline_run_id=data.get("pipeline_run_id") if data else None,
-            stage_name=data.get("stage") if data else None,
-            duration_ms=data.get("duration_ms") if data else None,
+        queue = self._ensure_drainer()
+        try:
+            queue.put_nowait(self._to_event(type, data))
+        except asyncio.QueueFull:
+            self._dropped_count += 1
+            logger.warning("Analytics queue full; dropping event %s", type)
+
+    def _ensure_drainer(self) -> asyncio.Queue[AnalyticsEvent]:
+        """Return the pending queue, starting a drainer on the running loop if needed."""
+        if self._pending is None or not self._drainer_is_live(self._drain_task):
+            self._pending = asyncio.Queue(maxsize=self._max_pending)
+            self._drain_task = asyncio.create_task(self._drain(self._pending))
+        return self._pending
+
+    async def _drain(self, queue: asyncio.Queue[AnalyticsEvent]) -> None:
+        """Export queued events, handing everything already waiting over as one batch."""
+        while True:
+            batch = [await queue.get()]
+            while True:
+                try:
+                    batch.append(queue.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+            try:
+                if len(batch) == 1:
+                    await self._exporter.export(batch[0])
+                else:
+                    await self._exporter.export_batch(batch)
+            except Exception:
+                logger.exception("Failed to export %d analytics event(s)", len(batch))
+            finally:
+                for _ in batch:
+                    queue.task_done()
+
+    async def flush(self) -> None:
+        """Wait for events queued by try_emit() to be exported, then flush the exporter."""
+        task = self._drain_task
+        if self._pending is not None and self._drainer_is_live(task):
+            await self._pending.join()
+        await self._exporter.flush()
+
+    async def close(self) -> None:
+        """Flush pending events, stop the drainer and close the exporter."""
+        await self.flush()
+        task, self._drain_task, self._pending = self._drain_task, None, None
+        if self._drainer_is_live(task):
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+        await self._exporter.close()
+
+    @staticmethod
+    def _drainer_is_live(task: asyncio.Task[None] | None) -> bool:
+        """Whether ``task`` is a running drainer on the current event loop."""
+        return (
+            task is not None and not task.done() and task.get_loop() is asyncio.get_running_loop()
         )
-        # Schedule async export
-        asyncio.create_task(self._exporter.export(event))
 
 
 __all__ = [
@@ -26,6 +26,7 @@ Usage:
 
 from __future__ import annotations
 
+import contextlib
 import logging
 import re
 from dataclasses import dataclass, field
@@ -36,6 +37,8 @@ from stageflow.core import StageContext, StageKind, StageOutput
 
 logger = logging.getLogger("stageflow.helpers.guardrails")
 
+_WORD_RE = re.compile(r"\b\w+\b")
+
 
 _LEET_TRANSLATION = str.maketrans(
     {
@@ -224,17 +227,19 @@ class PIIDetector:
         self._redact = redact
         self._redaction_char = redaction_char
         self._detect_types = detect_types or set(self.PATTERNS.keys())
+        self._compiled = tuple(
+            (pii_type, re.compile(pattern, re.IGNORECASE), message)
+            for pii_type, (pattern, message) in self.PATTERNS.items()
+            if pii_type in self._detect_types
+        )
 
     def check(self, content: str, _context: dict[str, Any] | None = None) -> GuardrailResult:
         """Check content for PII."""
         violations: list[PolicyViolation] = []
         transformed = content
 
-        for pii_type, (pattern, message) in self.PATTERNS.items():
-            if pii_type not in self._detect_types:
-                continue
-
-            for match in re.finditer(pattern, content, re.IGNORECASE):
+        for pii_type, compiled, message in self._compiled:
+            for match in compiled.finditer(content):
                 violations.append(
                     PolicyViolation(
                         type=ViolationType.PII_DETECTED,
@@ -295,19 +300,38 @@ class ContentFilter:
         """
         self._block_profanity = block_profanity
         self._profanity = profanity_list or self.DEFAULT_PROFANITY
+        # One case-insensitive whole-word sweep replaces lowercasing and tokenizing
+        # the content; entries that can never equal a lowercase word are skipped.
+        matchable = sorted(
+            word for word in self._profanity if word == word.lower() and _WORD_RE.fullmatch(word)
+        )
+        self._profanity_re = (
+            re.compile(
+                r"(?<!\w)(?:" + "|".join(map(re.escape, matchable)) + r")(?!\w)",
+                re.IGNORECASE,
+            )
+            if matchable
+            else None
+        )
         self._blocked_patterns = blocked_patterns or []
+        self._compiled_blocked = tuple(
+            (pattern, re.compile(pattern, re.IGNORECASE)) for pattern in self._blocked_patterns
+        )
         self._max_severity = max_severity
 
     def check(self, content: str, _context: dict[str, Any] | None = None) -> GuardrailResult:
         """Check content for blocked patterns and profanity."""
         violations: list[PolicyViolation] = []
         normalized_content = _normalize_leetspeak(content)
-        words = set(re.findall(r"\b\w+\b", content.lower()))
-        normalized_words = set(re.findall(r"\b\w+\b", normalized_content.lower()))
 
         # Check profanity
-        if self._block_profanity:
-            found_profanity = (words | normalized_words) & self._profanity
+        if self._block_profanity and self._profanity_re is not None:
+            matched = (
+                match.group(0).lower()
+                for text in dict.fromkeys((content, normalized_content))
+                for match in self._profanity_re.finditer(text)
+            )
+            found_profanity = dict.fromkeys(word for word in matched if word in self._profanity)
             for word in found_profanity:
                 violations.append(
                     PolicyViolation(
@@ -319,10 +343,10 @@ class ContentFilter:
                 )
 
         # Check blocked patterns
-        for pattern in self._blocked_patterns:
-            original_match = re.search(pattern, content, re.IGNORECASE)
+        for pattern, compiled in self._compiled_blocked:
+            original_match = compiled.search(content)
             normalized_match = (
-                re.search(pattern, normalized_content, re.IGNORECASE)
+                compiled.search(normalized_content)
                 if normalized_content != content
                 else None
             )
@@ -386,13 +410,31 @@ class InjectionDetector:
         self._patterns = self.INJECTION_PATTERNS.copy()
         if additional_patterns:
             self._patterns.extend(additional_patterns)
+        self._compiled = tuple(
+            (pattern, re.compile(pattern, re.IGNORECASE)) for pattern in self._patterns
+        )
+        # One alternation lets clean content (the common case) pass in a single
+        # scan; per-pattern searches only run once something has matched. Patterns
+        # with groups are left uncombined since joining them renumbers backreferences.
+        self._any_pattern: re.Pattern[str] | None = None
+        if all(compiled.groups == 0 for _, compiled in self._compiled):
+            with contextlib.suppress(re.error):
+                self._any_pattern = re.compile(
+                    "|".join(f"(?:{pattern})" for pattern in self._patterns), re.IGNORECASE
+                )
 
     def check(self, content: str, _context: dict[str, Any] | None = None) -> GuardrailResult:
         """Check for injection attempts."""
         violations: list[PolicyViolation] = []
+        if self._any_pattern is not None and self._any_pattern.search(content) is None:
+            return GuardrailResult(
+                passed=True,
+                violations=violations,
+                metadata={"patterns_checked": len(self._patterns)},
+            )
 
-        for pattern in self._patterns:
-            match = re.search(pattern, content, re.IGNORECASE)
+        for pattern, compiled in self._compiled:
+            match = compiled.search(content)
             if match:
                 violations.append(
                     PolicyViolation(
@@ -516,11 +558,13 @@ class GuardrailStage:
 
     async def execute(self, ctx: StageContext) -> StageOutput:
         """Run all guardrail checks."""
+        snapshot = ctx.snapshot
+
         # Get content to check
         if self._content_key and ctx.inputs:
             content = ctx.inputs.get(self._content_key)
         else:
-            content = ctx.snapshot.input_text
+            content = snapshot.input_text
 
         if not content:
             return StageOutput.skip(reason="No content to check")
@@ -528,14 +572,16 @@ class GuardrailStage:
         all_violations: list[PolicyViolation] = []
         transformed = content
         check_metadata: list[dict[str, Any]] = []
+        user_id = snapshot.user_id
+        session_id = snapshot.session_id
+        base_check_ctx = {
+            "user_id": str(user_id) if user_id else None,
+            "session_id": str(session_id) if session_id else None,
+        }
 
-        # Run all checks
+        # Run all checks (each gets its own copy of the check context)
         for check in self._checks:
-            check_ctx = {
-                "user_id": str(ctx.snapshot.user_id) if ctx.snapshot.user_id else None,
-                "session_id": str(ctx.snapshot.session_id) if ctx.snapshot.session_id else None,
-            }
-            result = check.check(transformed, check_ctx)
+            result = check.check(transformed, dict(base_check_ctx))
 
             # Filter by severity threshold
             significant_violations = [
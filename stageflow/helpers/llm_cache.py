@@ -0,0 +1,159 @@
+"""Response caching for chat-style LLM clients.
+
+Wraps any client exposing ``async chat(*, messages, model, **kwargs)`` (the
+shape used by :class:`stageflow.agent.Agent` and
+:class:`stageflow.agent.TypedLLMOutput`) so identical deterministic requests
+are answered from memory instead of another provider round trip.
+
+Usage:
+    from stageflow.helpers import CachingLLMClient
+
+    client = CachingLLMClient(groq_client, maxsize=1024)
+    agent = Agent(llm_client=client, ...)
+
+Only requests with ``temperature`` unset or ``0`` are cached by default, since
+sampled responses are not reproducible. Concurrent identical requests share
+one in-flight provider call. Failed calls are never cached.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import hashlib
+import json
+import logging
+from collections import OrderedDict
+from collections.abc import Sequence
+from typing import Any
+
+logger = logging.getLogger("stageflow.helpers.llm_cache")
+
+_CacheKey = tuple[str, str]
+
+
+class CachingLLMClient:
+    """LRU, single-flight cache in front of an async chat LLM client.
+
+    Attributes that the wrapper does not define are forwarded to the wrapped
+    client, so provider-specific helpers keep working.
+
+    Example:
+        client = CachingLLMClient(provider_client)
+        first = await client.chat(messages=msgs, model="m")   # provider call
+        second = await client.chat(messages=msgs, model="m")  # cache hit
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        *,
+        maxsize: int = 1024,
+        cache_nondeterministic: bool = False,
+    ) -> None:
+        """Initialize the caching wrapper.
+
+        Args:
+            client: Client exposing ``async chat(*, messages, model, **kwargs)``.
+            maxsize: Maximum cached responses; least recently used are evicted.
+            cache_nondeterministic: Also cache requests with ``temperature > 0``.
+        """
+        if maxsize < 1:
+            raise ValueError("maxsize must be >= 1")
+        self._client = client
+        self._maxsize = maxsize
+        self._cache_nondeterministic = cache_nondeterministic
+        self._responses: OrderedDict[_CacheKey, Any] = OrderedDict()
+        self._in_flight: dict[_CacheKey, asyncio.Future[Any]] = {}
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def hits(self) -> int:
+        """Requests answered from the cache or a shared in-flight call."""
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """Requests that reached the wrapped client."""
+        return self._misses
+
+    def __getattr__(self, name: str) -> Any:
+        # Private names are never forwarded, which also prevents recursion when
+        # ``_client`` is looked up before __init__ has set it (e.g. unpickling).
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self._client, name)
+
+    async def chat(
+        self,
+        *,
+        messages: Sequence[dict[str, Any]],
+        model: str,
+        **kwargs: Any,
+    ) -> Any:
+        """Return the wrapped client's response, reusing cached results when possible.
+
+        Cached responses are shared between callers and should be treated as
+        read-only.
+        """
+        key = self._cache_key(messages, model, kwargs)
+        if key is None:
+            self._misses += 1
+            return await self._client.chat(messages=messages, model=model, **kwargs)
+
+        if key in self._responses:
+            self._responses.move_to_end(key)
+            self._hits += 1
+            return self._responses[key]
+
+        pending = self._in_flight.get(key)
+        if pending is None:
+            self._misses += 1
+            # The upstream call runs in its own task so cancelling any one
+            # caller, including the one that started it, leaves the others waiting.
+            pending = asyncio.ensure_future(
+                self._client.chat(messages=messages, model=model, **kwargs)
+            )
+            self._in_flight[key] = pending
+            pending.add_done_callback(functools.partial(self._settle, key))
+        else:
+            self._hits += 1
+        return await asyncio.shield(pending)
+
+    def clear(self) -> None:
+        """Drop all cached responses (in-flight calls are unaffected)."""
+        self._responses.clear()
+
+    def _cache_key(
+        self,
+        messages: Sequence[dict[str, Any]],
+        model: str,
+        kwargs: dict[str, Any],
+    ) -> _CacheKey | None:
+        temperature = kwargs.get("temperature")
+        if temperature and not self._cache_nondeterministic:
+            return None
+        try:
+            encoded = json.dumps([list(messages), kwargs], sort_keys=True).encode()
+        except (TypeError, ValueError):
+            logger.debug("Skipping LLM cache for request with non-JSON arguments")
+            return None
+        digest = hashlib.blake2b(encoded, digest_size=16).hexdigest()
+        return model, digest
+
+    def _settle(self, key: _CacheKey, task: asyncio.Future[Any]) -> None:
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        # exception() also marks a failure as retrieved when every caller was cancelled.
+        if not task.cancelled() and task.exception() is None:
+            self._store(key, task.result())
+
+    def _store(self, key: _CacheKey, response: Any) -> None:
+        self._responses[key] = response
+        self._responses.move_to_end(key)
+        while len(self._responses) > self._maxsize:
+            self._responses.popitem(last=False)
+
+
+__all__ = ["CachingLLMClient"]
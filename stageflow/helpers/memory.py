@@ -20,7 +20,7 @@ Usage:
 
 from __future__ import annotations
 
-import asyncio
+import threading
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from typing import Any, Protocol
@@ -141,13 +141,16 @@ class MemoryStore(Protocol):
 class InMemoryStore:
     """In-memory implementation of MemoryStore for testing and prototyping.
 
-    Thread-safe and async-compatible. Data is lost when the process exits.
-    Use a persistent store (Redis, PostgreSQL) for production.
+    Thread-safe and async-compatible: a ``threading.Lock`` guards the session
+    map, so one store can be shared by pipelines running on different event
+    loops or threads. No ``await`` happens while the lock is held. Data is lost
+    when the process exits. Use a persistent store (Redis, PostgreSQL) for
+    production.
     """
 
     def __init__(self) -> None:
         self._entries: dict[UUID, list[MemoryEntry]] = {}
-        self._lock = asyncio.Lock()
+        self._lock = threading.Lock()
 
     async def fetch(
         self,
@@ -155,56 +158,53 @@ class InMemoryStore:
         config: MemoryConfig,
     ) -> list[MemoryEntry]:
         """Fetch memory entries for a session."""
-        async with self._lock:
-            entries = self._entries.get(session_id, [])
-
-            # Filter by recency if configured
-            if config.recency_window_seconds > 0:
-                cutoff = datetime.now(UTC).timestamp() - config.recency_window_seconds
-                entries = [
-                    e for e in entries
-                    if e.timestamp.timestamp() > cutoff
-                ]
-
-            # Filter system messages if configured
-            if not config.include_system:
-                entries = [e for e in entries if e.role != "system"]
-
-            # Limit by max_entries
-            if config.max_entries > 0:
-                entries = entries[-config.max_entries:]
-
-            # Limit by approximate token count (4 chars ~= 1 token)
-            if config.max_tokens > 0:
-                total_tokens = 0
-                limited: list[MemoryEntry] = []
-                for entry in reversed(entries):
-                    entry_tokens = len(entry.content) // 4
-                    if total_tokens + entry_tokens > config.max_tokens:
-                        break
-                    limited.insert(0, entry)
-                    total_tokens += entry_tokens
-                entries = limited
-
-            return entries
+        with self._lock:
+            entries = list(self._entries.get(session_id, ()))
+
+        # Filter by recency if configured
+        if config.recency_window_seconds > 0:
+            cutoff = datetime.now(UTC).timestamp() - config.recency_window_seconds
+            entries = [
+                e for e in entries
+                if e.timestamp.timestamp() > cutoff
+            ]
+
+        # Filter system messages if configured
+        if not config.include_system:
+            entries = [e for e in entries if e.role != "system"]
+
+        # Limit by max_entries
+        if config.max_entries > 0:
+            entries = entries[-config.max_entries:]
+
+        # Limit by approximate token count (4 chars ~= 1 token)
+        if config.max_tokens > 0:
+            total_tokens = 0
+            limited: list[MemoryEntry] = []
+            for entry in reversed(entries):
+                entry_tokens = len(entry.content) // 4
+                if total_tokens + entry_tokens > config.max_tokens:
+                    break
+                limited.insert(0, entry)
+                total_tokens += entry_tokens
+            entries = limited
+
+        return entries
 
     async def write(self, entry: MemoryEntry) -> None:
         """Write a memory entry."""
-        async with self._lock:
-            if entry.session_id not in self._entries:
-                self._entries[entry.session_id] = []
-            self._entries[entry.session_id].append(entry)
+        with self._lock:
+            self._entries.setdefault(entry.session_id, []).append(entry)
 
     async def clear(self, session_id: UUID) -> int:
         """Clear all memory for a session."""
-        async with self._lock:
-            count = len(self._entries.get(session_id, []))
-            self._entries.pop(session_id, None)
-            return count
+        with self._lock:
+            return len(self._entries.pop(session_id, ()))
 
     def get_all_sessions(self) -> list[UUID]:
         """Get all session IDs (for testing/debugging)."""
-        return list(self._entries.keys())
+        with self._lock:
+            return list(self._entries.keys())
 
 
 class MemoryFetchStage:
@@ -18,12 +18,17 @@ Usage:
 
     # Use in stages
     response = await llm.complete("What is 2+2?")
+
+Set ``STAGEFLOW_FAST_MOCKS=1`` to collapse every simulated delay to a bare
+event-loop yield, keeping the async code paths while dropping the wall-clock
+cost (useful for CI; leave unset when measuring latency behavior).
 """
 
 from __future__ import annotations
 
 import asyncio
 import hashlib
+import os
 import random
 import re
 from collections.abc import AsyncIterator, Callable
@@ -32,6 +37,13 @@ from datetime import UTC, datetime, timedelta
 from typing import Any
 from uuid import uuid4
 
+_FAST_MOCKS = os.getenv("STAGEFLOW_FAST_MOCKS") == "1"
+
+
+async def _mock_sleep(seconds: float) -> None:
+    """Sleep for a simulated delay, or just yield when fast mocks are enabled."""
+    await asyncio.sleep(0 if _FAST_MOCKS else seconds)
+
 
 @dataclass
 class MockMessage:
@@ -114,6 +126,7 @@ class MockLLMProvider:
         echo: bool = False,
         latency_ms: float = 0,
         latency_jitter_ms: float = 0,
+        chunk_delay_ms: float = 0,
         fail_rate: float = 0.0,
         fail_error: str = "Mock LLM error",
         tool_responses: dict[str, Any] | None = None,
@@ -127,6 +140,7 @@ class MockLLMProvider:
             echo: If True, echo back the input.
             latency_ms: Simulated latency in milliseconds.
             latency_jitter_ms: Random jitter added to latency.
+            chunk_delay_ms: Simulated delay between streamed chunks.
             fail_rate: Probability of simulated failure (0-1).
             fail_error: Error message for failures.
             tool_responses: Tool name to response mapping.
@@ -134,9 +148,14 @@ class MockLLMProvider:
         """
         self._responses = responses or ["Mock response"]
         self._patterns = patterns or {}
+        self._compiled_patterns = tuple(
+            (re.compile(pattern, re.IGNORECASE), response)
+            for pattern, response in self._patterns.items()
+        )
         self._echo = echo
         self._latency_ms = latency_ms
         self._latency_jitter_ms = latency_jitter_ms
+        self._chunk_delay_ms = chunk_delay_ms
         self._fail_rate = fail_rate
         self._fail_error = fail_error
         self._tool_responses = tool_responses or {}
@@ -150,7 +169,7 @@ class MockLLMProvider:
         if self._latency_ms > 0:
             jitter = random.uniform(-self._latency_jitter_ms, self._latency_jitter_ms)
             delay = max(0, self._latency_ms + jitter) / 1000
-            await asyncio.sleep(delay)
+            await _mock_sleep(delay)
 
     def _should_fail(self) -> bool:
         """Check if this call should fail."""
@@ -159,8 +178,8 @@ class MockLLMProvider:
     def _get_response(self, prompt: str) -> str:
         """Get response for a prompt."""
         # Check patterns first
-        for pattern, response in self._patterns.items():
-            if re.search(pattern, prompt, re.IGNORECASE):
+        for compiled, response in self._compiled_patterns:
+            if compiled.search(prompt):
                 return response
 
         # Echo mode
@@ -251,7 +270,8 @@ class MockLLMProvider:
         for i in range(0, len(content), chunk_size):
             chunk = content[i : i + chunk_size]
             yield chunk
-            await asyncio.sleep(0.01)  # Small delay between chunks
+            if self._chunk_delay_ms > 0:
+                await _mock_sleep(self._chunk_delay_ms / 1000)
 
     @property
     def call_count(self) -> int:
@@ -339,7 +359,7 @@ class MockSTTProvider:
         if self._latency_ms > 0:
             jitter = random.uniform(-self._latency_jitter_ms, self._latency_jitter_ms)
             delay = max(0, self._latency_ms + jitter) / 1000
-            await asyncio.sleep(delay)
+            await _mock_sleep(delay)
 
     def _hash_audio(self, audio: bytes) -> str:
         """Get deterministic hash of audio."""
@@ -451,7 +471,7 @@ class MockTTSProvider:
     async def _simulate_latency(self) -> None:
         """Simulate processing latency."""
         if self._latency_ms > 0:
-            await asyncio.sleep(self._latency_ms / 1000)
+            await _mock_sleep(self._latency_ms / 1000)
 
     def _generate_audio(self, text: str) -> bytes:
         """Generate deterministic audio bytes from text."""
@@ -522,7 +542,7 @@ class MockTTSProvider:
                 data=chunk_data,
                 sample_rate=self._sample_rate,
             )
-            await asyncio.sleep(chunk_duration_ms / 1000)
+            await _mock_sleep(chunk_duration_ms / 1000)
 
     @property
     def call_count(self) -> int:
@@ -768,7 +788,7 @@ class MockToolExecutor:
 
         # Simulate latency
         if self._latency_ms > 0:
-            await asyncio.sleep(self._latency_ms / 1000)
+            await _mock_sleep(self._latency_ms / 1000)
 
         # Check failure
         if random.random() < self._fail_rate:
@@ -32,22 +32,36 @@ Usage:
 
 from __future__ import annotations
 
+import contextlib
+import itertools
 import json
 import logging
 import sys
+import time
+from collections import deque
 from dataclasses import dataclass, field
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
+from functools import lru_cache
 from typing import Any
-from uuid import UUID, uuid4
+from uuid import UUID
 
 from stageflow.context import ContextSnapshot
 from stageflow.context.identity import RunIdentity
-from stageflow.events import set_event_sink
+from stageflow.events import reset_event_sink, set_event_sink
 from stageflow.helpers.memory_tracker import MemoryTracker
-from stageflow.helpers.uuid_utils import UuidCollisionMonitor
+from stageflow.helpers.uuid_utils import UuidCollisionMonitor, generate_uuid4
 from stageflow.pipeline.dag import UnifiedPipelineCancelled, UnifiedStageGraph
 from stageflow.stages.context import PipelineContext
 
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+logger = logging.getLogger("stageflow.helpers.run_utils")
+
 
 def setup_logging(
     *,
@@ -103,10 +117,20 @@ def setup_logging(
     logging.getLogger("urllib3").setLevel(logging.WARNING)
 
 
+def _dumps_json(data: dict[str, Any]) -> str:
+    """Serialize a log payload, using orjson when it is installed."""
+    if HAS_ORJSON:
+        # orjson rejects a few values json accepts (e.g. ints beyond 64 bits).
+        with contextlib.suppress(orjson.JSONEncodeError):
+            return orjson.dumps(data, default=str).decode()
+    return json.dumps(data, default=str)
+
+
 class JsonLogFormatter(logging.Formatter):
     """JSON-structured log formatter.
 
-    Produces JSON lines for easy parsing by log aggregators.
+    Produces JSON lines for easy parsing by log aggregators. Uses orjson for
+    serialization when it is installed, falling back to the stdlib json module.
     """
 
     def format(self, record: logging.LogRecord) -> str:
@@ -129,7 +153,46 @@ class JsonLogFormatter(logging.Formatter):
         if record.exc_info:
             log_data["exception"] = self.formatException(record.exc_info)
 
-        return json.dumps(log_data, default=str)
+        return _dumps_json(log_data)
+
+
+# Event data keys echoed under each printed ObservableEventSink event.
+_OBSERVABLE_DATA_KEYS = (
+    "stage",
+    "action_type",
+    "tool_name",
+    "error",
+    "result",
+    "duration_ms",
+    "execution_mode",
+    "behavior",
+    "reason",
+)
+
+
+@lru_cache(maxsize=256)
+def _observable_header_parts(event_type: str, colorize: bool) -> tuple[str, str]:
+    """Return the color prefix and ``" <type><reset>"`` suffix for a printed event.
+
+    Event types repeat across runs, so the substring-based color choice is made
+    once per type rather than on every printed event.
+    """
+    if not colorize:
+        return "", f" {event_type}"
+
+    if "error" in event_type or "failed" in event_type:
+        color = "\033[91m"  # Red
+    elif "completed" in event_type or "success" in event_type:
+        color = "\033[92m"  # Green
+    elif "started" in event_type:
+        color = "\033[94m"  # Blue
+    elif "tool" in event_type:
+        color = "\033[93m"  # Yellow
+    elif "skip" in event_type:
+        color = "\033[90m"  # Gray
+    else:
+        color = "\033[96m"  # Cyan
+    return color, f" {event_type}\033[0m"
 
 
 class ObservableEventSink:
@@ -147,6 +210,13 @@ class ObservableEventSink:
         # After run
         sink.print_summary()
         events = sink.events  # Access captured events
+
+    ``events`` is a ``collections.deque``. Copy it with ``list(sink.events)``
+    before slicing. Pass ``max_events`` to keep only the most recent events on
+    long runs; ``dropped_count`` reports how many were evicted.
+
+    Captured events carry ``elapsed_ms`` and an ISO-8601 UTC ``timestamp``
+    derived from it, so the wall clock is only read when the sink starts.
     """
 
     def __init__(
@@ -155,6 +225,7 @@ class ObservableEventSink:
         verbose: bool = True,
         colorize: bool = True,
         capture: bool = True,
+        max_events: int | None = None,
     ) -> None:
         """Initialize event sink.
 
@@ -162,16 +233,25 @@ class ObservableEventSink:
             verbose: Print events as they occur.
             colorize: Use ANSI colors in output.
             capture: Store events for later access.
+            max_events: Maximum captured events retained; once reached, the
+                oldest events are dropped. None (default) keeps every event.
         """
         self.verbose = verbose
         self.colorize = colorize
         self.capture = capture
-        self.events: list[dict[str, Any]] = []
-        self._start_time = datetime.now(UTC)
+        self.events: deque[dict[str, Any]] = deque(maxlen=max_events)
+        self._dropped_count = 0
+        self._start_utc = datetime.now(UTC)
+        self._start_ns = time.perf_counter_ns()
+
+    @property
+    def dropped_count(self) -> int:
+        """Number of captured events evicted because ``max_events`` was reached."""
+        return self._dropped_count
 
     def _elapsed_ms(self) -> float:
-        """Get milliseconds since sink creation."""
-        return (datetime.now(UTC) - self._start_time).total_seconds() * 1000
+        """Get milliseconds since sink creation (monotonic clock)."""
+        return (time.perf_counter_ns() - self._start_ns) / 1_000_000
 
     async def emit(self, *, type: str, data: dict[str, Any] | None) -> None:
         """Emit an event asynchronously."""
@@ -183,57 +263,54 @@ class ObservableEventSink:
 
     def _record_event(self, event_type: str, data: dict[str, Any] | None) -> None:
         """Record and optionally print an event."""
-        event = {
-            "type": event_type,
-            "data": data or {},
-            "timestamp": datetime.now(UTC).isoformat(),
-            "elapsed_ms": self._elapsed_ms(),
-        }
+        if not self.capture:
+            # Nothing is retained, so print straight from the arguments instead
+            # of boxing the event into a dict that is immediately discarded.
+            if self.verbose:
+                self._print_event(event_type, data, self._elapsed_ms())
+            return
 
-        if self.capture:
-            self.events.append(event)
+        # Derive the wall-clock time from the monotonic offset instead of
+        # reading the clock per event.
+        elapsed_ns = time.perf_counter_ns() - self._start_ns
+        elapsed = elapsed_ns / 1_000_000
+        if len(self.events) == self.events.maxlen:
+            self._dropped_count += 1
+            if self._dropped_count == 1:
+                logger.warning(
+                    "ObservableEventSink reached max_events=%d; dropping oldest events",
+                    self.events.maxlen,
+                )
+        self.events.append(
+            {
+                "type": event_type,
+                "data": data or {},
+                "timestamp": (
+                    self._start_utc + timedelta(microseconds=elapsed_ns // 1000)
+                ).isoformat(),
+                "elapsed_ms": elapsed,
+            }
+        )
 
         if self.verbose:
-            self._print_event(event)
+            self._print_event(event_type, data, elapsed)
 
-    def _print_event(self, event: dict[str, Any]) -> None:
+    def _print_event(self, event_type: str, data: dict[str, Any] | None, elapsed: float) -> None:
         """Print event with formatting."""
-        elapsed = event["elapsed_ms"]
-        event_type = event["type"]
-
-        # Color coding based on event type
-        if self.colorize:
-            if "error" in event_type or "failed" in event_type:
-                color = "\033[91m"  # Red
-            elif "completed" in event_type or "success" in event_type:
-                color = "\033[92m"  # Green
-            elif "started" in event_type:
-                color = "\033[94m"  # Blue
-            elif "tool" in event_type:
-                color = "\033[93m"  # Yellow
-            elif "skip" in event_type:
-                color = "\033[90m"  # Gray
-            else:
-                color = "\033[96m"  # Cyan
-            reset = "\033[0m"
-        else:
-            color = reset = ""
-
-        print(f"{color}[{elapsed:8.2f}ms] {event_type}{reset}")
+        color, suffix = _observable_header_parts(event_type, self.colorize)
+        lines = [f"{color}[{elapsed:8.2f}ms]{suffix}"]
 
-        # Print relevant data
-        data = event.get("data", {})
+        # Include relevant data
         if data:
-            relevant_keys = [
-                "stage", "action_type", "tool_name", "error", "result",
-                "duration_ms", "execution_mode", "behavior", "reason",
-            ]
-            for key in relevant_keys:
+            for key in _OBSERVABLE_DATA_KEYS:
                 if key in data:
                     value = data[key]
                     if isinstance(value, str) and len(value) > 80:
                         value = value[:80] + "..."
-                    print(f"           {key}: {value}")
+                    lines.append(f"           {key}: {value}")
+
+        # One write per event rather than one per line.
+        print("\n".join(lines))
 
     def print_summary(self) -> None:
         """Print summary of captured events."""
@@ -259,7 +336,7 @@ class ObservableEventSink:
 
         # Show timeline (last 10 events)
         print("\nRecent events:")
-        for event in self.events[-10:]:
+        for event in itertools.islice(self.events, max(len(self.events) - 10, 0), None):
             elapsed = event["elapsed_ms"]
             event_type = event["type"]
             print(f"  [{elapsed:8.2f}ms] {event_type}")
@@ -267,7 +344,9 @@ class ObservableEventSink:
     def clear(self) -> None:
         """Clear captured events."""
         self.events.clear()
-        self._start_time = datetime.now(UTC)
+        self._dropped_count = 0
+        self._start_utc = datetime.now(UTC)
+        self._start_ns = time.perf_counter_ns()
 
     def get_events_by_type(self, event_type: str) -> list[dict[str, Any]]:
         """Get events matching a type pattern."""
@@ -369,6 +448,8 @@ class PipelineRunner:
         memory_tracker_auto_start: bool = True,
         enable_immutability_check: bool = False,
         enable_context_size_monitor: bool = False,
+        session_id: UUID | None = None,
+        user_id: UUID | None = None,
     ) -> None:
         """Initialize runner.
 
@@ -382,12 +463,20 @@ class PipelineRunner:
             memory_tracker_auto_start: Whether to auto-start the memory tracker.
             enable_immutability_check: Enable deep context immutability validation (slow).
             enable_context_size_monitor: Enable context payload size warnings.
+            session_id: Session ID shared by every run of this runner
+                (default: one new UUID per runner).
+            user_id: User ID shared by every run of this runner
+                (default: one new UUID per runner).
         """
         self._verbose = verbose
         self._colorize = colorize
         self._capture_events = capture_events
         self._enable_immutability_check = enable_immutability_check
         self._enable_context_size_monitor = enable_context_size_monitor
+        # Runs from one runner are turns of one conversation, so session-scoped
+        # stages (memory, profile) see the same identity on every turn.
+        self._session_id = session_id or generate_uuid4()
+        self._user_id = user_id or generate_uuid4()
         self._uuid_monitor = (
             UuidCollisionMonitor(ttl_seconds=uuid_monitor_ttl_seconds, category="pipeline")
             if enable_uuid_monitor
@@ -422,8 +511,8 @@ class PipelineRunner:
             topology: Pipeline topology name.
             pipeline_run_id: Pipeline run ID (default: new UUID).
             request_id: Request ID (default: new UUID).
-            session_id: Session ID (default: new UUID).
-            user_id: User ID (default: new UUID).
+            session_id: Session ID (default: the runner's session ID).
+            user_id: User ID (default: the runner's user ID).
             org_id: Organization ID.
             interaction_id: Interaction ID (default: new UUID).
             channel: Channel identifier.
@@ -433,12 +522,12 @@ class PipelineRunner:
             ContextSnapshot ready for pipeline execution.
         """
         run_id = RunIdentity(
-            pipeline_run_id=pipeline_run_id or uuid4(),
-            request_id=request_id or uuid4(),
-            session_id=session_id or uuid4(),
-            user_id=user_id or uuid4(),
+            pipeline_run_id=pipeline_run_id or generate_uuid4(),
+            request_id=request_id or generate_uuid4(),
+            session_id=session_id or self._session_id,
+            user_id=user_id or self._user_id,
             org_id=org_id,
-            interaction_id=interaction_id or uuid4(),
+            interaction_id=interaction_id or generate_uuid4(),
         )
 
         return ContextSnapshot(
@@ -483,7 +572,6 @@ class PipelineRunner:
             colorize=self._colorize,
             capture=self._capture_events,
         )
-        set_event_sink(event_sink)
 
         if pipeline_ctx is not None and snapshot is not None:
             raise ValueError("Pass either pipeline_ctx or snapshot, not both")
@@ -565,6 +653,9 @@ class PipelineRunner:
             print(f"Mode: {pipeline_ctx.execution_mode}")
             print("-" * 60)
 
+        # Scope the sink to this run so concurrent or nested runs keep their own.
+        sink_token = set_event_sink(event_sink)
+
         # Run pipeline from canonical PipelineContext.
         try:
             results = await graph.run(pipeline_ctx)
@@ -577,7 +668,7 @@ class PipelineRunner:
                 success=True,
                 stages={name: output.data for name, output in results.items()},
                 duration_ms=duration_ms,
-                events=event_sink.events if self._capture_events else [],
+                events=list(event_sink.events) if self._capture_events else [],
                 pipeline_run_id=pipeline_ctx.pipeline_run_id,
             )
 
@@ -593,7 +684,7 @@ class PipelineRunner:
                 duration_ms=duration_ms,
                 cancelled=True,
                 cancel_reason=e.reason,
-                events=event_sink.events if self._capture_events else [],
+                events=list(event_sink.events) if self._capture_events else [],
                 pipeline_run_id=pipeline_ctx.pipeline_run_id,
             )
 
@@ -608,10 +699,13 @@ class PipelineRunner:
                 duration_ms=duration_ms,
                 error=str(e),
                 error_type=type(e).__name__,
-                events=event_sink.events if self._capture_events else [],
+                events=list(event_sink.events) if self._capture_events else [],
                 pipeline_run_id=pipeline_ctx.pipeline_run_id,
             )
 
+        finally:
+            reset_event_sink(sink_token)
+
     def print_result(self, result: RunResult, *, show_data: bool = True) -> None:
         """Print a formatted result summary.
 
@@ -35,6 +35,12 @@ _HUMAN_READABLE_FORMATS: Iterable[str] = (
     "%Y-%m-%d %H:%M:%S",
 )
 
+_UNIX_PRECISION_DIVISORS: dict[UnixPrecision, int] = {
+    "seconds": 1,
+    "milliseconds": 1_000,
+    "microseconds": 1_000_000,
+}
+
 
 def detect_unix_precision(timestamp: int | float) -> UnixPrecision:
     """Detect the precision of a Unix timestamp by digit count.
@@ -141,13 +147,7 @@ def _parse_unix_timestamp(value: int | float) -> datetime:
     if isinstance(value, float) and not value.is_integer():
         seconds = float(value)
     else:
-        precision = detect_unix_precision(value)
-        if precision == "seconds":
-            divisor = 1
-        elif precision == "milliseconds":
-            divisor = 1_000
-        else:
-            divisor = 1_000_000
+        divisor = _UNIX_PRECISION_DIVISORS[detect_unix_precision(value)]
         seconds = int(value) / divisor
 
     return datetime.fromtimestamp(seconds, tz=UTC)
@@ -46,7 +46,7 @@ def _stage_result_summary(result: StageResult) -> dict[str, Any]:
         "ended_at": result.ended_at.isoformat(),
         "duration_ms": _duration_ms(result.started_at, result.ended_at),
         "error": result.error,
-        "data_keys": sorted(result.data.keys()),
+        "data_keys": sorted(result.data),
     }
 
 
@@ -135,14 +135,15 @@ class WideEventEmitter:
             duration_ms = _duration_ms(started_at, datetime.now(UTC))
 
         details = [_stage_result_summary(result) for result in stage_results.values()]
-        status = status or ("failed" if any(r["status"] == "failed" for r in details) else "completed")
+        stage_counts = _stage_counts(stage_results)
+        status = status or ("failed" if stage_counts.get("failed") else "completed")
 
         payload: dict[str, Any] = {
             **_context_metadata(ctx),
             "pipeline_name": pipeline_name,
             "status": status,
             "duration_ms": duration_ms,
-            "stage_counts": _stage_counts(stage_results),
+            "stage_counts": stage_counts,
             "stage_details": details,
         }
         if extra:
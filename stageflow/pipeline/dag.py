@@ -35,11 +35,12 @@ from stageflow.pipeline.interceptors import (
     run_with_interceptors,
 )
 from stageflow.pipeline.results import PipelineResults
-from stageflow.stages.context import PipelineContext
+from stageflow.pipeline.validation import downstream_stage_counts, stage_dependents
+from stageflow.stages.context import PipelineContext, stage_event_type
+from stageflow.stages.inputs import create_stage_inputs
 from stageflow.stages.result import StageError, StageResult
 
 logger = logging.getLogger("pipeline_dag")
-DEBUG_LOG_PATH = "/tmp/debug_pipeline_dag.log"
 
 StageRunner = Callable[[PipelineContext], Awaitable[StageResult | dict | None]]
 StageRunnerNew = Callable[[StageContext], Awaitable[StageReturn]]
@@ -64,6 +65,47 @@ class UnifiedStageSpec:
     conditional: bool = False
 
 
+@dataclass(frozen=True, slots=True)
+class StageGraphLayout:
+    """Run-invariant DAG structure derived from a set of unified stage specs.
+
+    Building a layout validates nothing; it only precomputes the adjacency and
+    ordering that ``UnifiedStageGraph`` needs, so callers that build many graphs
+    from the same specs (such as ``Pipeline.build()``) can compute it once.
+    """
+
+    specs: dict[str, UnifiedStageSpec]
+    declared_deps: dict[str, frozenset[str]]
+    in_degree: dict[str, int]
+    dependents: dict[str, tuple[str, ...]]
+    root_stages: tuple[str, ...]
+
+    @classmethod
+    def from_specs(cls, specs: Iterable[UnifiedStageSpec]) -> StageGraphLayout:
+        stage_specs = {spec.name: spec for spec in specs}
+        declared_deps = {name: frozenset(spec.dependencies) for name, spec in stage_specs.items()}
+        # When several stages become ready together, start the ones with the most
+        # downstream work first so long dependency chains are not queued behind leaves.
+        dependents = stage_dependents(stage_specs)
+        downstream = downstream_stage_counts(dependents).__getitem__
+        return cls(
+            specs=stage_specs,
+            declared_deps=declared_deps,
+            in_degree={name: len(deps) for name, deps in declared_deps.items()},
+            dependents={
+                name: tuple(sorted(children, key=downstream, reverse=True))
+                for name, children in dependents.items()
+            },
+            root_stages=tuple(
+                sorted(
+                    (name for name, deps in declared_deps.items() if not deps),
+                    key=downstream,
+                    reverse=True,
+                )
+            ),
+        )
+
+
 @dataclass(slots=True)
 class GuardRetryRuntimeState:
     attempts: int = 0
@@ -129,6 +171,8 @@ class StageGraph:
         self._specs = {spec.name: spec for spec in specs}
         if len(self._specs) == 0:
             raise ValueError("StageGraph requires at least one StageSpec")
+        self._dependents = stage_dependents(self._specs)
+        self._in_degree = {name: len(set(spec.dependencies)) for name, spec in self._specs.items()}
         self._interceptors = interceptors or get_default_interceptors()
         if wide_event_emitter is None and (emit_stage_wide_events or emit_pipeline_wide_event):
             wide_event_emitter = WideEventEmitter()
@@ -144,37 +188,19 @@ class StageGraph:
     def _duration_ms(self, started_at: datetime, ended_at: datetime) -> int:
         return int((ended_at - started_at).total_seconds() * 1000)
 
-    @staticmethod
-    def _debug_log(message: str) -> None:  # pragma: no cover - debug utility
-        try:
-            with open(DEBUG_LOG_PATH, "a") as f:
-                f.write(f"{message}\n")
-        except Exception:
-            pass
-
     async def run(self, ctx: PipelineContext) -> dict[str, StageResult]:
         graph_started_at = datetime.now(UTC)
-        try:
-            with open("/tmp/debug_voice_handler.log", "a") as f:
-                f.write(
-                    f"\n[{datetime.now(UTC)}] StageGraph.run starting with specs: {list(self._specs.keys())}\n"
-                )
-        except Exception as exc:  # pragma: no cover - defensive logging path
-            logger.error(f"Failed to write debug log: {exc}", exc_info=True)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("StageGraph.run starting with specs: %s", list(self._specs))
 
         completed: dict[str, StageResult] = {}
-        in_degree = {name: len(set(spec.dependencies)) for name, spec in self._specs.items()}
+        in_degree = self._in_degree.copy()
         active_tasks: set[asyncio.Task[tuple[str, StageResult]]] = set()
 
         def schedule_stage(name: str) -> None:
             task = asyncio.create_task(self._execute_node(name, ctx))
             active_tasks.add(task)
-
-            try:
-                with open("/tmp/debug_voice_handler.log", "a") as f:
-                    f.write(f"  Stage {name} scheduled/started.\n")
-            except Exception as exc:  # pragma: no cover - defensive logging path
-                logger.error(f"Failed to write debug log: {exc}", exc_info=True)
+            logger.debug("Stage %s scheduled", name)
 
         ready_nodes = [name for name, count in in_degree.items() if count == 0]
         for name in ready_nodes:
@@ -215,11 +241,10 @@ class StageGraph:
                 stage_name, stage_result = task.result()
                 completed[stage_name] = stage_result
 
-                for potential_child, spec in self._specs.items():
-                    if stage_name in spec.dependencies:
-                        in_degree[potential_child] -= 1
-                        if in_degree[potential_child] == 0:
-                            schedule_stage(potential_child)
+                for child in self._dependents[stage_name]:
+                    in_degree[child] -= 1
+                    if in_degree[child] == 0:
+                        schedule_stage(child)
 
         if self._emit_pipeline_wide_event and self._wide_event_emitter is not None:
             duration_ms = int((datetime.now(UTC) - graph_started_at).total_seconds() * 1000)
@@ -242,7 +267,7 @@ class StageGraph:
     async def _run_stage(self, spec: StageSpec, ctx: PipelineContext) -> StageResult:
         started_at = datetime.now(UTC)
 
-        logger.info(f"[DEBUG] Running stage: {spec.name}")
+        logger.debug("Running stage: %s", spec.name)
         ctx.record_stage_event(stage=spec.name, status="started")
 
         async def run_stage() -> StageResult:
@@ -268,9 +293,7 @@ class StageGraph:
                 interceptors=self._interceptors,
             )
 
-            self._debug_log(
-                f"[{datetime.now(UTC)}] Stage {spec.name} completed with status={result.status}"
-            )
+            logger.debug("Stage %s completed with status=%s", spec.name, result.status)
 
             duration_ms = self._duration_ms(started_at, result.ended_at)
             if result.status == "failed":
@@ -294,7 +317,7 @@ class StageGraph:
             return result
         except Exception as exc:  # pragma: no cover - defensive
             ended_at = datetime.now(UTC)
-            self._debug_log(f"[{ended_at}] Stage {spec.name} failed with error={exc!r}")
+            logger.debug("Stage %s failed with error=%r", spec.name, exc)
             ctx.record_stage_event(
                 stage=spec.name,
                 status="failed",
@@ -373,7 +396,7 @@ class UnifiedStageGraph:
 
     def __init__(
         self,
-        specs: Iterable[UnifiedStageSpec],
+        specs: Iterable[UnifiedStageSpec] | StageGraphLayout,
         *,
         pipeline_name: str | None = None,
         interceptors: list[BaseInterceptor] | None = None,
@@ -383,9 +406,19 @@ class UnifiedStageGraph:
         emit_stage_wide_events: bool = False,
         emit_pipeline_wide_event: bool = False,
     ) -> None:
-        self._specs = {spec.name: spec for spec in specs}
+        layout = (
+            specs if isinstance(specs, StageGraphLayout) else StageGraphLayout.from_specs(specs)
+        )
+        self._specs = layout.specs
         if len(self._specs) == 0:
             raise ValueError("UnifiedStageGraph requires at least one UnifiedStageSpec")
+        self._stage_names: tuple[str, ...] = tuple(self._specs)
+        self._declared_deps = layout.declared_deps
+        # Per-run scheduling state starts from a copy of this map rather than
+        # recounting every stage's dependencies on each run.
+        self._in_degree = layout.in_degree
+        self._dependents = layout.dependents
+        self._root_stages = layout.root_stages
         self._interceptors = interceptors or get_default_interceptors()
         self._cleanup_timeout = cleanup_timeout
         self._cleanup_registry: CleanupRegistry | None = None
@@ -470,8 +503,8 @@ class UnifiedStageGraph:
             "UnifiedStageGraph execution started",
             extra={
                 "event": "graph_started",
-                "stage_count": len(self._specs),
-                "stages": list(self._specs.keys()),
+                "stage_count": len(self._stage_names),
+                "stages": self._stage_names,
             },
         )
 
@@ -500,10 +533,14 @@ class UnifiedStageGraph:
         pending_guard_retries: dict[str, list[str]] = defaultdict(list)
         finalized: set[str] = set()
         active_retry_targets: set[str] = set()
-        in_degree: dict[str, int] = {
-            name: len(set(spec.dependencies)) for name, spec in self._specs.items()
-        }
-        active_tasks: set[asyncio.Task[tuple[str, StageOutput, StageResult]]] = set()
+        in_degree = self._in_degree.copy()
+        # Stage tasks report outcomes here instead of raising so the scheduling loop
+        # keeps control of failure handling; the TaskGroup owns sibling cancellation.
+        completions: asyncio.Queue[tuple[str, StageOutput, StageResult] | BaseException] = (
+            asyncio.Queue()
+        )
+        in_flight = 0
+        task_group: asyncio.TaskGroup | None = None
 
         def emit_guard_retry_event(event: str, **payload: Any) -> None:
             try:
@@ -533,263 +570,277 @@ class UnifiedStageGraph:
                     },
                 )
 
-        def schedule_stage(name: str) -> None:
-            task = asyncio.create_task(
-                self._execute_node(
+        async def run_node(name: str) -> None:
+            outcome: tuple[str, StageOutput, StageResult] | Exception
+            try:
+                outcome = await self._execute_node(
                     name,
                     stage_ctx,
                     completed,
                     shared_timer,
                     interceptor_ctx,
                 )
-            )
-            active_tasks.add(task)
+            except Exception as exc:
+                outcome = exc
+            except asyncio.CancelledError as exc:
+                # Post cancellation too, or the scheduler would wait on completions forever.
+                completions.put_nowait(exc)
+                raise
+            completions.put_nowait(outcome)
 
-        try:
-            ready_nodes = [name for name, count in in_degree.items() if count == 0]
-            for name in ready_nodes:
-                schedule_stage(name)
-
-            while len(finalized) < len(self._specs):
-                # Check for cooperative cancellation
-                if interceptor_ctx.is_canceled or (
-                    self._cancel_token and self._cancel_token.is_cancelled
-                ):
-                    reason = (
-                        interceptor_ctx.cancellation_reason
-                        or (self._cancel_token.reason if self._cancel_token else None)
-                        or "Cancelled"
-                    )
-                    logger.info(
-                        f"Pipeline cancelled via token: {reason}",
-                        extra={
-                            "event": "pipeline_cancelled_token",
-                            "reason": reason,
-                        },
-                    )
-                    for t in active_tasks:
-                        t.cancel()
-                    if active_tasks:
-                        await asyncio.gather(*active_tasks, return_exceptions=True)
-                    raise UnifiedPipelineCancelled(
-                        stage="<external>",
-                        reason=reason,
-                        results=PipelineResults(completed),
-                    )
+        def schedule_stage(name: str) -> None:
+            nonlocal in_flight
+            assert task_group is not None
+            in_flight += 1
+            task_group.create_task(run_node(name), name=f"stage:{name}")
 
-                if not active_tasks:
-                    pending = sorted(set(self._specs) - set(completed))
-                    error_msg = f"Deadlocked stage graph; remaining stages: {pending}"
-                    logger.error(
-                        "Deadlock detected in stage graph",
-                        extra={
-                            "event": "deadlock",
-                            "pending_stages": pending,
-                        },
-                    )
-                    raise RuntimeError(error_msg)
-
-                done, _ = await asyncio.wait(active_tasks, return_when=asyncio.FIRST_COMPLETED)
-
-                for task in done:
-                    active_tasks.remove(task)
-
-                    if task.exception():
-                        # Cancel remaining tasks
-                        if self._cancel_token:
-                            self._cancel_token.cancel("Stage failed")
-                        for t in active_tasks:
-                            t.cancel()
-                        if active_tasks:
-                            await asyncio.gather(*active_tasks, return_exceptions=True)
-
-                        exc = task.exception()
-                        logger.error(
-                            f"Stage task execution failed: {exc}",
-                            extra={
-                                "event": "stage_failed",
-                                "error": str(exc),
-                            },
-                            exc_info=True,
-                        )
-                        raise exc  # type: ignore[misc]
-
-                    stage_name, stage_output, stage_result = task.result()
-
-                    policy: GuardRetryPolicy | None = None
-                    spec = self._specs[stage_name]
-                    if self._guard_retry_strategy is not None and spec.kind == StageKind.GUARD:
-                        policy = self._guard_retry_strategy.get_policy(stage_name)
-
-                    # Always record latest output; finalized guard result may change if retry completes
-                    completed[stage_name] = stage_output
-                    completed_results[stage_name] = stage_result
-                    self._publish_stage_wide_event(interceptor_ctx, stage_result)
-
-                    if policy and stage_output.status == StageStatus.FAIL:
-                        retry_state = guard_retry_state.setdefault(
-                            stage_name, GuardRetryRuntimeState()
-                        )
-                        if retry_state.started_at is None:
-                            retry_state.started_at = time.monotonic()
-
-                        retry_state.attempts += 1
-
-                        retry_hash = hash_retry_payload(stage_output, policy.hash_fields)
-                        if retry_hash and retry_hash == retry_state.last_hash:
-                            retry_state.stagnation_hits += 1
-                        else:
-                            retry_state.stagnation_hits = 0
-                        retry_state.last_hash = retry_hash
-
-                        emit_guard_retry_event(
-                            "attempt",
-                            guard=stage_name,
-                            attempt=retry_state.attempts,
-                            retry_stage=policy.retry_stage,
-                            max_attempts=policy.max_attempts,
-                            stagnation_hits=retry_state.stagnation_hits,
-                            timeout_seconds=policy.timeout_seconds,
-                        )
-
-                        exceeded_attempts = retry_state.attempts >= policy.max_attempts
-                        exceeded_stagnation = (
-                            policy.stagnation_limit is not None
-                            and retry_state.stagnation_hits >= policy.stagnation_limit
-                        )
-                        exceeded_timeout = False
-                        if policy.timeout_seconds is not None and retry_state.started_at:
-                            exceeded_timeout = (
-                                time.monotonic() - retry_state.started_at >= policy.timeout_seconds
+        try:
+            try:
+                async with asyncio.TaskGroup() as task_group:
+                    stage_count = len(self._stage_names)
+                    for name in self._root_stages:
+                        schedule_stage(name)
+
+                    while len(finalized) < stage_count:
+                        # Check for cooperative cancellation
+                        if interceptor_ctx.is_canceled or (
+                            self._cancel_token and self._cancel_token.is_cancelled
+                        ):
+                            reason = (
+                                interceptor_ctx.cancellation_reason
+                                or (self._cancel_token.reason if self._cancel_token else None)
+                                or "Cancelled"
+                            )
+                            logger.info(
+                                f"Pipeline cancelled via token: {reason}",
+                                extra={
+                                    "event": "pipeline_cancelled_token",
+                                    "reason": reason,
+                                },
+                            )
+                            raise UnifiedPipelineCancelled(
+                                stage="<external>",
+                                reason=reason,
+                                results=PipelineResults(completed),
                             )
 
-                        if exceeded_attempts or exceeded_stagnation or exceeded_timeout:
+                        if in_flight == 0:
+                            pending = sorted(set(self._specs) - set(completed))
+                            error_msg = f"Deadlocked stage graph; remaining stages: {pending}"
                             logger.error(
-                                "Guard retry limits exceeded",
+                                "Deadlock detected in stage graph",
                                 extra={
-                                    "event": "guard_retry_exhausted",
-                                    "guard": stage_name,
-                                    "attempts": retry_state.attempts,
-                                    "stagnation_hits": retry_state.stagnation_hits,
-                                    "timeout": exceeded_timeout,
+                                    "event": "deadlock",
+                                    "pending_stages": pending,
                                 },
                             )
-                            emit_guard_retry_event(
-                                "exhausted",
-                                guard=stage_name,
-                                attempts=retry_state.attempts,
-                                stagnation_hits=retry_state.stagnation_hits,
-                                retry_stage=policy.retry_stage,
-                                timeout_seconds=policy.timeout_seconds,
-                                reason="timeout"
-                                if exceeded_timeout
-                                else "stagnation"
-                                if exceeded_stagnation
-                                else "max_attempts",
-                            )
-                            finalized.add(stage_name)
-                        else:
-                            logger.info(
-                                "Scheduling guard retry",
+                            raise RuntimeError(error_msg)
+
+                        outcome = await completions.get()
+                        in_flight -= 1
+
+                        if isinstance(outcome, asyncio.CancelledError):
+                            raise outcome
+
+                        if isinstance(outcome, Exception):
+                            # Raising out of the TaskGroup cancels the remaining stages
+                            if self._cancel_token:
+                                self._cancel_token.cancel("Stage failed")
+
+                            logger.error(
+                                f"Stage task execution failed: {outcome}",
                                 extra={
-                                    "event": "guard_retry",
-                                    "guard": stage_name,
-                                    "attempt": retry_state.attempts,
-                                    "retry_stage": policy.retry_stage,
+                                    "event": "stage_failed",
+                                    "error": str(outcome),
                                 },
+                                exc_info=outcome,
                             )
+                            raise outcome
+
+                        stage_name, stage_output, stage_result = outcome
+
+                        policy: GuardRetryPolicy | None = None
+                        spec = self._specs[stage_name]
+                        if self._guard_retry_strategy is not None and spec.kind == StageKind.GUARD:
+                            policy = self._guard_retry_strategy.get_policy(stage_name)
+
+                        # Always record latest output; finalized guard result may change if retry completes
+                        completed[stage_name] = stage_output
+                        completed_results[stage_name] = stage_result
+                        self._publish_stage_wide_event(interceptor_ctx, stage_result)
+
+                        if policy and stage_output.status == StageStatus.FAIL:
+                            retry_state = guard_retry_state.setdefault(
+                                stage_name, GuardRetryRuntimeState()
+                            )
+                            if retry_state.started_at is None:
+                                retry_state.started_at = time.monotonic()
+
+                            retry_state.attempts += 1
+
+                            retry_hash = hash_retry_payload(stage_output, policy.hash_fields)
+                            if retry_hash and retry_hash == retry_state.last_hash:
+                                retry_state.stagnation_hits += 1
+                            else:
+                                retry_state.stagnation_hits = 0
+                            retry_state.last_hash = retry_hash
+
                             emit_guard_retry_event(
-                                "scheduled",
+                                "attempt",
                                 guard=stage_name,
                                 attempt=retry_state.attempts,
                                 retry_stage=policy.retry_stage,
+                                max_attempts=policy.max_attempts,
                                 stagnation_hits=retry_state.stagnation_hits,
                                 timeout_seconds=policy.timeout_seconds,
                             )
-                            pending_guard_retries[policy.retry_stage].append(stage_name)
-                            if policy.retry_stage not in active_retry_targets:
-                                active_retry_targets.add(policy.retry_stage)
-                                schedule_stage(policy.retry_stage)
+
+                            exceeded_attempts = retry_state.attempts >= policy.max_attempts
+                            exceeded_stagnation = (
+                                policy.stagnation_limit is not None
+                                and retry_state.stagnation_hits >= policy.stagnation_limit
+                            )
+                            exceeded_timeout = False
+                            if policy.timeout_seconds is not None and retry_state.started_at:
+                                exceeded_timeout = (
+                                    time.monotonic() - retry_state.started_at >= policy.timeout_seconds
+                                )
+
+                            if exceeded_attempts or exceeded_stagnation or exceeded_timeout:
+                                logger.error(
+                                    "Guard retry limits exceeded",
+                                    extra={
+                                        "event": "guard_retry_exhausted",
+                                        "guard": stage_name,
+                                        "attempts": retry_state.attempts,
+                                        "stagnation_hits": retry_state.stagnation_hits,
+                                        "timeout": exceeded_timeout,
+                                    },
+                                )
+                                emit_guard_retry_event(
+                                    "exhausted",
+                                    guard=stage_name,
+                                    attempts=retry_state.attempts,
+                                    stagnation_hits=retry_state.stagnation_hits,
+                                    retry_stage=policy.retry_stage,
+                                    timeout_seconds=policy.timeout_seconds,
+                                    reason="timeout"
+                                    if exceeded_timeout
+                                    else "stagnation"
+                                    if exceeded_stagnation
+                                    else "max_attempts",
+                                )
+                                finalized.add(stage_name)
                             else:
-                                logger.debug(
-                                    "Retry stage already active",
+                                logger.info(
+                                    "Scheduling guard retry",
                                     extra={
-                                        "event": "guard_retry_stage_active",
-                                        "retry_stage": policy.retry_stage,
+                                        "event": "guard_retry",
                                         "guard": stage_name,
+                                        "attempt": retry_state.attempts,
+                                        "retry_stage": policy.retry_stage,
                                     },
                                 )
-                            continue
-
-                    if stage_output.status == StageStatus.CANCEL:
-                        logger.info(
-                            f"Pipeline cancelled by stage {stage_name}: {stage_output.data.get('cancel_reason', 'no reason')}",
-                            extra={
-                                "event": "pipeline_cancelled",
-                                "stage": stage_name,
-                                "reason": stage_output.data.get("cancel_reason", ""),
-                                "stages_completed": list(finalized),
-                            },
-                        )
-                        if self._cancel_token:
-                            self._cancel_token.cancel(f"Cancelled by stage {stage_name}")
-                        for t in active_tasks:
-                            t.cancel()
-                        if active_tasks:
-                            await asyncio.gather(*active_tasks, return_exceptions=True)
-                        raise UnifiedPipelineCancelled(
-                            stage=stage_name,
-                            reason=stage_output.data.get("cancel_reason", "Pipeline cancelled"),
-                            results=PipelineResults(completed),
-                        )
-
-                    if stage_output.status == StageStatus.FAIL:
-                        raise UnifiedStageExecutionError(
-                            stage=stage_name,
-                            original=RuntimeError(stage_output.error or "Stage failed"),
-                        )
-
-                    if stage_name in guard_retry_state and stage_output.status != StageStatus.FAIL:
-                        recovered_state = guard_retry_state.pop(stage_name, None)
-                        if recovered_state and recovered_state.attempts:
-                            emit_guard_retry_event(
-                                "recovered",
-                                guard=stage_name,
-                                attempts=recovered_state.attempts,
+                                emit_guard_retry_event(
+                                    "scheduled",
+                                    guard=stage_name,
+                                    attempt=retry_state.attempts,
+                                    retry_stage=policy.retry_stage,
+                                    stagnation_hits=retry_state.stagnation_hits,
+                                    timeout_seconds=policy.timeout_seconds,
+                                )
+                                pending_guard_retries[policy.retry_stage].append(stage_name)
+                                if policy.retry_stage not in active_retry_targets:
+                                    active_retry_targets.add(policy.retry_stage)
+                                    schedule_stage(policy.retry_stage)
+                                else:
+                                    logger.debug(
+                                        "Retry stage already active",
+                                        extra={
+                                            "event": "guard_retry_stage_active",
+                                            "retry_stage": policy.retry_stage,
+                                            "guard": stage_name,
+                                        },
+                                    )
+                                continue
+
+                        if stage_output.status == StageStatus.CANCEL:
+                            cancel_reason = stage_output.data.get("cancel_reason")
+                            has_reason = cancel_reason is not None
+                            logger.info(
+                                f"Pipeline cancelled by stage {stage_name}: "
+                                f"{cancel_reason if has_reason else 'no reason'}",
+                                extra={
+                                    "event": "pipeline_cancelled",
+                                    "stage": stage_name,
+                                    "reason": cancel_reason if has_reason else "",
+                                    "stages_completed": list(finalized),
+                                },
+                            )
+                            if self._cancel_token:
+                                self._cancel_token.cancel(f"Cancelled by stage {stage_name}")
+                            raise UnifiedPipelineCancelled(
+                                stage=stage_name,
+                                reason=cancel_reason if has_reason else "Pipeline cancelled",
+                                results=PipelineResults(completed),
                             )
 
-                    pending_guards = pending_guard_retries.pop(stage_name, [])
-                    if stage_name in active_retry_targets:
-                        active_retry_targets.discard(stage_name)
-                    if pending_guards:
-                        for guard_name in pending_guards:
-                            logger.debug(
-                                "Scheduling guard after retry stage completion",
+                        if stage_output.status == StageStatus.FAIL:
+                            raise UnifiedStageExecutionError(
+                                stage=stage_name,
+                                original=RuntimeError(stage_output.error or "Stage failed"),
+                            )
+
+                        if stage_name in guard_retry_state and stage_output.status != StageStatus.FAIL:
+                            recovered_state = guard_retry_state.pop(stage_name, None)
+                            if recovered_state and recovered_state.attempts:
+                                emit_guard_retry_event(
+                                    "recovered",
+                                    guard=stage_name,
+                                    attempts=recovered_state.attempts,
+                                )
+
+                        pending_guards = pending_guard_retries.pop(stage_name, [])
+                        if stage_name in active_retry_targets:
+                            active_retry_targets.discard(stage_name)
+                        if pending_guards:
+                            for guard_name in pending_guards:
+                                logger.debug(
+                                    "Scheduling guard after retry stage completion",
+                                    extra={
+                                        "event": "guard_retry_after_stage",
+                                        "retry_stage": stage_name,
+                                        "guard": guard_name,
+                                    },
+                                )
+                                schedule_stage(guard_name)
+
+                        if logger.isEnabledFor(logging.INFO):
+                            data_keys = list(stage_output.data)
+                            logger.info(
+                                "Stage %s completed with status=%s, data_keys=%s",
+                                stage_name,
+                                stage_output.status.value,
+                                data_keys,
                                 extra={
-                                    "event": "guard_retry_after_stage",
-                                    "retry_stage": stage_name,
-                                    "guard": guard_name,
+                                    "event": "stage_completed",
+                                    "stage": stage_name,
+                                    "status": stage_output.status.value,
+                                    "data_keys": data_keys,
                                 },
                             )
-                            schedule_stage(guard_name)
-
-                    logger.info(
-                        f"Stage {stage_name} completed with status={stage_output.status.value}, data_keys={list(stage_output.data.keys())}",
-                        extra={
-                            "event": "stage_completed",
-                            "stage": stage_name,
-                            "status": stage_output.status.value,
-                            "data_keys": list(stage_output.data.keys()),
-                        },
-                    )
 
-                    if stage_name not in finalized:
-                        finalized.add(stage_name)
-                        for potential_child, spec in self._specs.items():
-                            if stage_name in spec.dependencies:
-                                in_degree[potential_child] -= 1
-                                if in_degree[potential_child] == 0:
-                                    schedule_stage(potential_child)
+                        if stage_name not in finalized:
+                            finalized.add(stage_name)
+                            for child in self._dependents[stage_name]:
+                                in_degree[child] -= 1
+                                if in_degree[child] == 0:
+                                    schedule_stage(child)
+            except BaseExceptionGroup as group:
+                # Only the scheduling loop raises inside the group (stage tasks report
+                # failures through the queue), so unwrap to keep the original exception.
+                exc = group.exceptions[0]
+                raise exc from exc.__cause__
 
             logger.info(
                 "UnifiedStageGraph execution completed",
@@ -842,23 +893,25 @@ class UnifiedStageGraph:
     ) -> tuple[str, StageOutput, StageResult]:
         """Execute a single stage and return its output."""
         spec = self._specs[name]
+        declared_deps = self._declared_deps[name]
 
-        prior_outputs = {
-            dep_name: output
-            for dep_name, output in completed.items()
-            if dep_name in spec.dependencies
-        }
+        # Root stages have no outputs to collect, so skip scanning completed.
+        prior_outputs: dict[str, StageOutput] = {}
+        if declared_deps:
+            prior_outputs = {
+                dep_name: output
+                for dep_name, output in completed.items()
+                if dep_name in declared_deps
+            }
 
         inputs = ctx.inputs
         ports = inputs.ports if inputs else None
 
-        from stageflow.stages.inputs import create_stage_inputs
-
         new_inputs = create_stage_inputs(
             snapshot=ctx.snapshot,
             prior_outputs=prior_outputs,
             ports=ports,
-            declared_deps=spec.dependencies,
+            declared_deps=declared_deps,
             stage_name=name,
         )
 
@@ -886,21 +939,27 @@ class UnifiedStageGraph:
         """Run a stage with normalization and structured logging."""
         started_at = datetime.now(UTC)
 
-        logger.info(
-            f"Running stage: {spec.name}",
-            extra={
-                "event": "stage_started",
-                "stage": spec.name,
-                "kind": spec.kind.value if spec.kind else None,
-            },
-        )
+        # Per-stage logs are guarded so disabled INFO pays no formatting/extra cost.
+        log_info = logger.isEnabledFor(logging.INFO)
+        if log_info:
+            logger.info(
+                "Running stage: %s",
+                spec.name,
+                extra={
+                    "event": "stage_started",
+                    "stage": spec.name,
+                    "kind": spec.kind.value if spec.kind else None,
+                },
+            )
 
         try:
-            await interceptor_ctx.run_before_stage_start_hooks(
-                stage_name=spec.name,
-                stage_kind=spec.kind,
-                stage_ctx=ctx,
-            )
+            # Most runs register no hooks; skip creating the coroutine entirely.
+            if interceptor_ctx.has_before_stage_start_hooks:
+                await interceptor_ctx.run_before_stage_start_hooks(
+                    stage_name=spec.name,
+                    stage_kind=spec.kind,
+                    stage_ctx=ctx,
+                )
             ctx.raise_if_cancelled()
         except StageCancellationRequested as exc:
             ended_at = datetime.now(UTC)
@@ -925,7 +984,7 @@ class UnifiedStageGraph:
                 # Emit stage.skipped event for observability
                 if ctx.event_sink:
                     ctx.event_sink.try_emit(
-                        type=f"stage.{spec.name}.skipped",
+                        type=stage_event_type(spec.name, "skipped"),
                         data={
                             "stage": spec.name,
                             "reason": skip_reason,
@@ -1001,20 +1060,23 @@ class UnifiedStageGraph:
 
             duration_ms = result.duration_ms or 0
 
-            logger.info(
-                f"Stage {spec.name} completed with status={result.status.value}",
-                extra={
-                    "event": "stage_completed",
-                    "stage": spec.name,
-                    "status": result.status.value,
-                    "duration_ms": duration_ms,
-                },
-            )
+            if log_info:
+                logger.info(
+                    "Stage %s completed with status=%s",
+                    spec.name,
+                    result.status.value,
+                    extra={
+                        "event": "stage_completed",
+                        "stage": spec.name,
+                        "status": result.status.value,
+                        "duration_ms": duration_ms,
+                    },
+                )
 
             # Emit stage.skipped event if stage returned SKIP status
             if result.status == StageStatus.SKIP and ctx.event_sink:
                 ctx.event_sink.try_emit(
-                    type=f"stage.{spec.name}.skipped",
+                    type=stage_event_type(spec.name, "skipped"),
                     data={
                         "stage": spec.name,
                         "reason": result.data.get("reason", "Stage returned skip"),
@@ -1120,6 +1182,7 @@ class UnifiedStageGraph:
 __all__ = [
     "StageExecutionError",
     "StageGraph",
+    "StageGraphLayout",
     "StageSpec",
     "UnifiedStageGraph",
     "UnifiedStageSpec",
@@ -9,12 +9,15 @@ from __future__ import annotations
 import asyncio
 import logging
 import time
+from collections import deque
 from dataclasses import dataclass, field
 from enum import Enum, auto
 from typing import Any
 
 logger = logging.getLogger("stageflow.pipeline.failure_tolerance")
 
+_MAX_LATENCY_SAMPLES = 1000
+
 
 class FailureMode(Enum):
     """How to handle stage failures."""
@@ -186,7 +189,8 @@ class BackpressureMonitor:
         self._semaphore = asyncio.Semaphore(self.config.max_active_stages)
         self._active_count = 0
         self._queued_count = 0
-        self._latencies: list[float] = []
+        # Keep only the most recent latency samples
+        self._latencies: deque[float] = deque(maxlen=_MAX_LATENCY_SAMPLES)
         self._paused = False
         self._shed_count = 0
 
@@ -250,9 +254,6 @@ class BackpressureMonitor:
 
         if latency_ms is not None:
             self._latencies.append(latency_ms)
-            # Keep only last 1000 samples
-            if len(self._latencies) > 1000:
-                self._latencies = self._latencies[-1000:]
 
     def get_metrics(self) -> dict[str, Any]:
         """Get current backpressure metrics."""
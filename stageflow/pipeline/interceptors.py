@@ -10,9 +10,13 @@ Interceptors wrap stage execution to provide cross-cutting concerns:
 
 from __future__ import annotations
 
+import asyncio
+import logging
+import time
 from abc import ABC, abstractmethod
 from collections.abc import Callable
 from dataclasses import dataclass, field
+from datetime import UTC, datetime
 from enum import Enum, auto
 from typing import TYPE_CHECKING, Any
 
@@ -22,6 +26,10 @@ if TYPE_CHECKING:  # pragma: no cover
 from stageflow.stages.context import PipelineContext
 from stageflow.stages.result import StageResult
 
+logger = logging.getLogger("interceptors")
+_stage_logger = logging.getLogger("stage_interceptor")
+_metrics_logger = logging.getLogger("stage_metrics")
+
 
 class ErrorAction(Enum):
     """Action to take when a stage errors."""
@@ -172,8 +180,6 @@ class ChildTrackerMetricsInterceptor(BaseInterceptor):
 
     async def after(self, _stage_name: str, _result: StageResult, ctx: PipelineContext) -> None:
         """Log ChildRunTracker metrics after stage execution."""
-        import logging
-
         # Only log metrics for stages that might spawn children
         if hasattr(ctx, 'is_child_run') and ctx.is_child_run:
             logger = logging.getLogger("stageflow.child_tracker_metrics")
@@ -204,10 +210,7 @@ class LoggingInterceptor(BaseInterceptor):
     priority: int = 50
 
     async def before(self, stage_name: str, ctx: PipelineContext) -> None:
-        import logging
-
-        logger = logging.getLogger("stage_interceptor")
-        logger.info(
+        _stage_logger.info(
             f"Stage starting: {stage_name}",
             extra={
                 "stage": stage_name,
@@ -217,10 +220,7 @@ class LoggingInterceptor(BaseInterceptor):
         )
 
     async def after(self, _stage_name: str, _result: StageResult, _ctx: PipelineContext) -> None:
-        import logging
-
-        logger = logging.getLogger("stage_interceptor")
-        logger.info(
+        _stage_logger.info(
             f"Stage completed: {_stage_name} - {_result.status}",
             extra={
                 "stage": _stage_name,
@@ -240,15 +240,12 @@ class MetricsInterceptor(BaseInterceptor):
         ctx.data["_metrics.stage_start_time"] = ctx.now()
 
     async def after(self, _stage_name: str, result: StageResult, ctx: PipelineContext) -> None:
-        import logging
-
-        logger = logging.getLogger("stage_metrics")
         duration_ms = int((result.ended_at - result.started_at).total_seconds() * 1000)
 
         # Remove timing key if present
         ctx.data.pop("_metrics.stage_start_time", None)
 
-        logger.info(
+        _metrics_logger.info(
             f"Stage metrics: {_stage_name}",
             extra={
                 "stage": _stage_name,
@@ -293,8 +290,6 @@ class CircuitBreakerInterceptor(BaseInterceptor):
 
         if state == "open":
             # Check if we should try again (reset timeout)
-            import time
-
             last_failure = self._last_failure.get(stage_name, 0)
             if time.time() - last_failure > 30:  # 30 second reset
                 self._breaker_states[stage_name] = "half_open"
@@ -320,8 +315,6 @@ class CircuitBreakerInterceptor(BaseInterceptor):
         return ErrorAction.FAIL
 
     def _record_failure(self, stage_name: str) -> None:
-        import time
-
         self._failure_counts[stage_name] = self._failure_counts.get(stage_name, 0) + 1
         self._last_failure[stage_name] = time.time()
 
@@ -419,10 +412,6 @@ async def run_with_interceptors(
     Returns:
         StageResult from the stage execution
     """
-    import logging
-    from datetime import UTC, datetime
-
-    logger = logging.getLogger("interceptors")
     started_at = datetime.now(UTC)
 
     # Sort by priority (lower = outer = runs first)
@@ -480,8 +469,6 @@ async def run_with_interceptors(
 
             if timeout_seconds > 0:
                 # Wrap with timeout using asyncio.wait_for
-                import asyncio
-
                 result = await asyncio.wait_for(stage_run(), timeout=timeout_seconds)
             else:
                 # No timeout (0 or negative)
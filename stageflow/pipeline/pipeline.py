@@ -29,6 +29,7 @@ from stageflow.pipeline.validation import (
 
 if TYPE_CHECKING:
     from stageflow.core import StageKind
+    from stageflow.pipeline.dag import StageGraphLayout
     from stageflow.pipeline.guard_retry import GuardRetryStrategy
     from stageflow.pipeline.interceptors import BaseInterceptor
     from stageflow.stages.context import PipelineContext
@@ -138,6 +139,9 @@ class Pipeline:
 
     name: str = "pipeline"
     stages: dict[str, UnifiedStageSpec] = field(default_factory=dict)
+    _graph_layout: tuple[tuple[UnifiedStageSpec, ...], StageGraphLayout] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     @classmethod
     def from_stages(cls, *specs: UnifiedStageSpec, name: str = "pipeline") -> Pipeline:
@@ -189,10 +193,14 @@ class Pipeline:
         return new_pipeline
 
     def with_stages(self, *specs: UnifiedStageSpec) -> Pipeline:
-        """Add multiple declarative stage specs to this pipeline."""
-        result = self
+        """Add multiple declarative stage specs to this pipeline.
+
+        Equivalent to chaining ``with_stage`` per spec, but the stage mapping is
+        copied once rather than once per spec.
+        """
+        stages = dict(self.stages)
         for spec in specs:
-            result = result.with_stage(
+            stages[spec.name] = stage(
                 spec.name,
                 spec.runner,
                 spec.kind,
@@ -200,7 +208,7 @@ class Pipeline:
                 conditional=spec.conditional,
                 config=spec.config,
             )
-        return result
+        return Pipeline(name=self.name, stages=stages)
 
     def compose(self, other: Pipeline) -> Pipeline:
         """Merge stages and dependencies from another pipeline.
@@ -266,6 +274,33 @@ class Pipeline:
         Raises:
             PipelineValidationError: If pipeline is empty or dependencies are invalid
         """
+        # Import here to avoid circular imports
+        from stageflow.pipeline.dag import UnifiedStageGraph
+
+        return UnifiedStageGraph(  # type: ignore
+            specs=self._stage_graph_layout(),
+            pipeline_name=self.name,
+            interceptors=interceptors,
+            guard_retry_strategy=guard_retry_strategy,
+            wide_event_emitter=wide_event_emitter,
+            emit_stage_wide_events=emit_stage_wide_events,
+            emit_pipeline_wide_event=emit_pipeline_wide_event,
+        )
+
+    def _stage_graph_layout(self) -> StageGraphLayout:
+        """Return the validated graph layout, reusing it while ``stages`` is unchanged.
+
+        Graphs themselves hold per-run state, so each ``build()`` still returns a
+        fresh ``UnifiedStageGraph``; only validation, runner wrapping and the
+        derived DAG structure are cached.
+        """
+        from stageflow.pipeline.dag import StageGraphLayout
+
+        current = tuple(self.stages.values())
+        cached = self._graph_layout
+        if cached is not None and cached[0] == current:
+            return cached[1]
+
         ensure_non_empty(self.stages, message="Cannot build empty pipeline")
         validated_stages = self._validated_stages()
 
@@ -306,18 +341,9 @@ class Pipeline:
             )
             specs_for_graph.append(graph_spec)
 
-        # Import here to avoid circular imports
-        from stageflow.pipeline.dag import UnifiedStageGraph
-
-        return UnifiedStageGraph(  # type: ignore
-            specs=specs_for_graph,
-            pipeline_name=self.name,
-            interceptors=interceptors,
-            guard_retry_strategy=guard_retry_strategy,
-            wide_event_emitter=wide_event_emitter,
-            emit_stage_wide_events=emit_stage_wide_events,
-            emit_pipeline_wide_event=emit_pipeline_wide_event,
-        )
+        layout = StageGraphLayout.from_specs(specs_for_graph)
+        self._graph_layout = (current, layout)
+        return layout
 
     async def run(
         self,
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from typing import Any
+
 from stageflow.core import StageOutput, StageStatus
 
 
@@ -26,7 +28,8 @@ class PipelineResults(dict[str, StageOutput]):
         """Return a stage output only when it finished with OK status."""
         output = self.require(stage_name)
         if output.status != StageStatus.OK:
-            detail = output.error or output.data.get("reason") or output.data.get("cancel_reason")
+            data = output.data
+            detail = output.error or data.get("reason") or data.get("cancel_reason")
             suffix = f": {detail}" if detail else ""
             raise RuntimeError(
                 f"Stage {stage_name!r} did not complete with OK status "
@@ -43,6 +46,13 @@ class PipelineResults(dict[str, StageOutput]):
             raise KeyError(stage_name)
         return output.data
 
+    def value(self, stage_name: str, key: str, default: Any = None) -> Any:
+        """Return a single `.data` field for a stage, or `default` if absent."""
+        output = self.get(stage_name)
+        if output is None:
+            return default
+        return output.data.get(key, default)
+
     def ok(self, stage_name: str) -> bool:
         """Return True when the stage finished successfully."""
         output = self.get(stage_name)
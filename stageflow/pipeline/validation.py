@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from collections import deque
-from collections.abc import Mapping
+from collections.abc import Mapping, Sequence
 from typing import Any, Protocol
 
 from stageflow.contracts import ContractErrorInfo
@@ -75,20 +75,55 @@ def ensure_compatible_stage_specs(
     )
 
 
+def stage_dependents(stages: Mapping[str, DependencySpec]) -> dict[str, tuple[str, ...]]:
+    """Map each stage name to the stages that depend on it, in declaration order.
+
+    Dependencies on names outside ``stages`` are ignored, and duplicate
+    dependency entries count once, matching ``len(set(spec.dependencies))``
+    in-degree bookkeeping.
+    """
+    dependents: dict[str, list[str]] = {name: [] for name in stages}
+    for name, spec in stages.items():
+        for dep in dict.fromkeys(spec.dependencies):
+            children = dependents.get(dep)
+            if children is not None:
+                children.append(name)
+    return {name: tuple(children) for name, children in dependents.items()}
+
+
+def downstream_stage_counts(dependents: Mapping[str, Sequence[str]]) -> dict[str, int]:
+    """Count the stages transitively reachable from each stage via ``dependents``.
+
+    Cycles are tolerated: every stage is visited at most once per start node.
+    """
+    counts: dict[str, int] = {}
+    for start in dependents:
+        seen: set[str] = set()
+        stack = list(dependents[start])
+        while stack:
+            name = stack.pop()
+            if name in seen:
+                continue
+            seen.add(name)
+            stack.extend(dependents.get(name, ()))
+        seen.discard(start)
+        counts[start] = len(seen)
+    return counts
+
+
 def topologically_sorted_stage_names(stages: Mapping[str, DependencySpec]) -> list[str]:
     """Return stage names in topological order."""
     if not stages:
         return []
     in_degree = {name: len(set(spec.dependencies)) for name, spec in stages.items()}
+    dependents = stage_dependents(stages)
     queue: deque[str] = deque(name for name, count in in_degree.items() if count == 0)
     ordered: list[str] = []
 
     while queue:
         node = queue.popleft()
         ordered.append(node)
-        for name, spec in stages.items():
-            if node not in spec.dependencies:
-                continue
+        for name in dependents[node]:
             in_degree[name] -= 1
             if in_degree[name] == 0:
                 queue.append(name)
@@ -129,8 +164,10 @@ def _detect_cycles(stages: Mapping[str, DependencySpec]) -> None:
 
 __all__ = [
     "DependencySpec",
+    "downstream_stage_counts",
     "ensure_compatible_stage_specs",
     "ensure_non_empty",
+    "stage_dependents",
     "topologically_sorted_stage_names",
     "validate_stage_dependencies",
 ]
@@ -91,13 +91,13 @@ class WSMessageProjector:
 
         org_id = _coerce_uuid_str(connection_org_id)
 
-        projected = dict(message)
-        projected["metadata"] = {
+        projected_metadata = {
             "pipeline_run_id": run_id,
             "request_id": req_id,
         }
         if org_id:
-            projected["metadata"]["org_id"] = org_id
+            projected_metadata["org_id"] = org_id
+        projected = {**message, "metadata": projected_metadata}
 
         if msg_type == "status.update":
             if not isinstance(payload, dict):
@@ -8,25 +8,29 @@ from __future__ import annotations
 
 import asyncio
 import inspect
+import sys
 from collections.abc import Awaitable, Callable, Iterable
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
-from typing import TYPE_CHECKING, Any
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, NamedTuple
 from uuid import UUID
 
+from stageflow.context.context_snapshot import ContextSnapshot
+from stageflow.context.identity import RunIdentity
+from stageflow.core import PipelineTimer, StageCancellationRequested, StageContext
 from stageflow.core import StageArtifact as Artifact
-from stageflow.core import StageCancellationRequested, StageContext
 from stageflow.events import EventSink, get_event_sink
+from stageflow.stages.inputs import _NO_DECLARED_DEPS, StageInputs, create_stage_inputs
+from stageflow.stages.ports import create_core_ports
+from stageflow.utils.frozen import FrozenDict
 
 if TYPE_CHECKING:
-    from stageflow.context import ContextSnapshot
     from stageflow.context.conversation import Conversation
     from stageflow.context.enrichments import Enrichments
     from stageflow.context.extensions import ExtensionBundle
     from stageflow.context.output_bag import OutputBag
-    from stageflow.core import StageContext
     from stageflow.stages.ports import AudioPorts, CorePorts, LLMPorts
-    from stageflow.utils.frozen import FrozenDict
 
 
 def extract_service(topology: str | None) -> str | None:
@@ -43,13 +47,46 @@ def extract_service(topology: str | None) -> str | None:
     """
     if topology is None:
         return None
+    return _parse_service(topology)
+
+
+@lru_cache(maxsize=64)
+def _parse_service(topology: str) -> str | None:
+    """Parse the service prefix of a topology; cached since topologies form a small set."""
     # Kernel names don't encode service
     if topology.endswith("_kernel"):
         return None
     # Handle pipeline names like "chat_fast", "voice_accurate"
     # Return everything before the last underscore
-    parts = topology.rsplit("_", 1)
-    return parts[0] if parts[0] else topology
+    head, _, _ = topology.rpartition("_")
+    return head or topology
+
+
+@lru_cache(maxsize=1024)
+def stage_event_type(stage: str, status: str) -> str:
+    """Return the interned ``stage.<name>.<status>`` event type.
+
+    Stage names and statuses repeat on every run, so the formatted type is cached
+    and interned rather than rebuilt (and rehashed by sinks) on each emit.
+    """
+    return sys.intern(f"stage.{stage}.{status}")
+
+
+class IdBundle(NamedTuple):
+    """Immutable bundle of the correlation identifiers carried by a context."""
+
+    pipeline_run_id: UUID | None
+    request_id: UUID | None
+    session_id: UUID | None
+    user_id: UUID | None
+    org_id: UUID | None
+
+    def as_dict(self) -> dict[str, str | None]:
+        """Render identifiers as strings (``None`` preserved) for event payloads."""
+        return {
+            name: str(value) if value else None
+            for name, value in zip(self._fields, self, strict=True)
+        }
 
 
 @dataclass(slots=True, kw_only=True)
@@ -105,6 +142,35 @@ class PipelineContext:
     _before_stage_start_hooks: list[
         Callable[[str, Any, StageContext, PipelineContext], Awaitable[None] | None]
     ] = field(default_factory=list)
+    # Cached (IdBundle, rendered dict) pair; invalidated when any identifier changes
+    _id_cache: tuple[IdBundle, dict[str, str | None]] | None = field(
+        default=None, repr=False, compare=False
+    )
+    # CorePorts wrapping the legacy db slot; rebuilt only when db is reassigned
+    _db_ports: CorePorts | None = field(default=None, repr=False, compare=False)
+
+    @property
+    def id_bundle(self) -> IdBundle:
+        """Return the correlation identifiers as an immutable bundle."""
+        return IdBundle(
+            self.pipeline_run_id,
+            self.request_id,
+            self.session_id,
+            self.user_id,
+            self.org_id,
+        )
+
+    def _rendered_ids(self) -> dict[str, str | None]:
+        """Return the stringified identifier dict, reusing it while IDs are unchanged.
+
+        The returned dict is shared; callers must copy it before mutating.
+        """
+        bundle = self.id_bundle
+        cached = self._id_cache
+        if cached is None or cached[0] != bundle:
+            cached = (bundle, bundle.as_dict())
+            self._id_cache = cached
+        return cached[1]
 
     def record_stage_event(
         self,
@@ -114,29 +180,27 @@ class PipelineContext:
         payload: dict[str, Any] | None = None,
     ) -> None:
         """Emit a timestamped stage event for observability."""
-        timestamp = datetime.now(UTC).isoformat()
-        event_payload = {
+        ids = self._rendered_ids()
+        run_id = ids["pipeline_run_id"]
+        # Build the event in a single literal; payload keys may override defaults.
+        data = {
+            "request_id": ids["request_id"],
+            "session_id": ids["session_id"],
+            "user_id": ids["user_id"],
+            "org_id": ids["org_id"],
+            "service": self.service,
             "stage": stage,
             "status": status,
-            "timestamp": timestamp,
+            "timestamp": datetime.now(UTC).isoformat(),
             "topology": self.topology,
             "execution_mode": self.execution_mode,
         }
         if payload:
-            event_payload.update(payload)
+            data.update(payload)
+        if run_id is not None:
+            data["pipeline_run_id"] = run_id
 
-        data = {
-            "request_id": str(self.request_id) if self.request_id else None,
-            "session_id": str(self.session_id) if self.session_id else None,
-            "user_id": str(self.user_id) if self.user_id else None,
-            "org_id": str(self.org_id) if self.org_id else None,
-            "service": self.service,
-            **event_payload,
-        }
-        if self.pipeline_run_id:
-            data["pipeline_run_id"] = str(self.pipeline_run_id)
-
-        self.event_sink.try_emit(type=f"stage.{stage}.{status}", data=data)
+        self.event_sink.try_emit(type=stage_event_type(stage, status), data=data)
 
     def set_stage_metadata(self, stage: str, metadata: dict[str, Any]) -> None:
         """Set metadata for a stage."""
@@ -149,11 +213,7 @@ class PipelineContext:
     def to_dict(self) -> dict[str, Any]:
         """Convert context to a dict for tool execution."""
         result = {
-            "pipeline_run_id": str(self.pipeline_run_id) if self.pipeline_run_id else None,
-            "request_id": str(self.request_id) if self.request_id else None,
-            "session_id": str(self.session_id) if self.session_id else None,
-            "user_id": str(self.user_id) if self.user_id else None,
-            "org_id": str(self.org_id) if self.org_id else None,
+            **self._rendered_ids(),
             "interaction_id": str(self.interaction_id) if self.interaction_id else None,
             "topology": self.topology,
             "execution_mode": self.execution_mode,
@@ -177,9 +237,6 @@ class PipelineContext:
 
     def to_snapshot(self) -> ContextSnapshot:
         """Derive immutable snapshot view from the canonical PipelineContext."""
-        from stageflow.context import ContextSnapshot
-        from stageflow.context.identity import RunIdentity
-
         run_id = RunIdentity(
             pipeline_run_id=self.pipeline_run_id,
             request_id=self.request_id,
@@ -341,11 +398,15 @@ class PipelineContext:
         """Resolve stage ports for derived StageContext instances."""
         if self.ports is not None:
             return self.ports
-        if self.db is None:
+        db = self.db
+        if db is None:
             return None
-        from stageflow.stages.ports import create_core_ports
 
-        return create_core_ports(db=self.db)
+        db_ports = self._db_ports
+        if db_ports is None or db_ports.db is not db:
+            db_ports = create_core_ports(db=db)
+            self._db_ports = db_ports
+        return db_ports
 
     def fork(
         self,
@@ -377,7 +438,6 @@ class PipelineContext:
         Returns:
             New PipelineContext for the child run
         """
-        from stageflow.utils.frozen import FrozenDict
 
         if isinstance(inherit_data, str):
             raise TypeError("inherit_data must be a bool or iterable of keys")
@@ -454,6 +514,11 @@ class PipelineContext:
         """Register a hook that runs before each stage begins execution."""
         self._before_stage_start_hooks.append(hook)
 
+    @property
+    def has_before_stage_start_hooks(self) -> bool:
+        """Whether any before-stage-start hooks are registered."""
+        return bool(self._before_stage_start_hooks)
+
     async def run_before_stage_start_hooks(
         self,
         *,
@@ -480,9 +545,10 @@ class PipelineContext:
             data: Event payload data
         """
         # Add correlation IDs to event data
+        ids = self._rendered_ids()
         enriched_data = {
-            "pipeline_run_id": str(self.pipeline_run_id) if self.pipeline_run_id else None,
-            "request_id": str(self.request_id) if self.request_id else None,
+            "pipeline_run_id": ids["pipeline_run_id"],
+            "request_id": ids["request_id"],
             "execution_mode": self.execution_mode,
             "topology": self.topology,
             "service": self.service,
@@ -518,17 +584,14 @@ class PipelineContext:
         Returns:
             StageContext ready for stage execution.
         """
-        from stageflow.core import StageContext
-        from stageflow.core.timer import PipelineTimer
-        from stageflow.stages.inputs import StageInputs
 
         if snapshot is None:
             snapshot = self.to_snapshot()
 
         # Convert deps to frozenset if provided
         deps: frozenset[str]
-        if declared_deps is None:
-            deps = frozenset()
+        if not declared_deps:
+            deps = _NO_DECLARED_DEPS
         elif isinstance(declared_deps, frozenset):
             deps = declared_deps
         else:
@@ -560,8 +623,6 @@ class PipelineContext:
 
     def derive_root_stage_context(self, *, stage_name: str = "__pipeline_root__") -> StageContext:
         """Create the root StageContext derived from this PipelineContext."""
-        from stageflow.core import PipelineTimer, StageContext
-        from stageflow.stages.inputs import create_stage_inputs
 
         snapshot = self.to_snapshot()
         root_inputs = create_stage_inputs(
@@ -583,7 +644,9 @@ class PipelineContext:
 
 
 __all__ = [
+    "IdBundle",
     "StageContext",
     "PipelineContext",
     "extract_service",
+    "stage_event_type",
 ]
@@ -7,15 +7,37 @@ for pipeline stages.
 from __future__ import annotations
 
 import logging
+import re
+import time
 from collections.abc import Callable
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING, Any
 
+from stageflow.stages.result import StageError, StageResult
+
 if TYPE_CHECKING:
+    from stageflow.pipeline.dag import StageExecutionError
     from stageflow.stages.context import PipelineContext
 
 logger = logging.getLogger("stage_errors")
 
+# Network errors are typically recoverable
+_RECOVERABLE_MESSAGE_RE = re.compile(r"connection|timeout|network|disconnected", re.IGNORECASE)
+_RECOVERABLE_ERROR_TYPES = frozenset({"connectionerror", "timeouterror", "httperror"})
+
+# Resolved on first use: stageflow.pipeline.dag imports the stages package.
+_stage_execution_error_cls: type[StageExecutionError] | None = None
+
+
+def _get_stage_execution_error_cls() -> type[StageExecutionError]:
+    """Return StageExecutionError, importing it the first time it is needed."""
+    global _stage_execution_error_cls
+    if _stage_execution_error_cls is None:
+        from stageflow.pipeline.dag import StageExecutionError
+
+        _stage_execution_error_cls = StageExecutionError
+    return _stage_execution_error_cls
+
 
 def log_stage_error(
     stage_name: str,
@@ -126,16 +148,7 @@ def handle_async_task_error(
 
 def create_error_context(**kwargs: Any) -> dict[str, Any]:
     """Create an error context with timestamp."""
-    record = logging.LogRecord(
-        name="",
-        level=0,
-        pathname="",
-        lineno=0,
-        msg="",
-        args=(),
-        exc_info=None,
-    )
-    return {"error_timestamp": record.created, **kwargs}
+    return {"error_timestamp": time.time(), **kwargs}
 
 
 def with_error_handling(
@@ -159,9 +172,9 @@ def with_error_handling(
             # Stage work here
             return StageResult(...)
     """
-    from stageflow.pipeline.dag import StageExecutionError
     from stageflow.stages.context import PipelineContext
-    from stageflow.stages.result import StageError, StageResult
+
+    stage_execution_error = _get_stage_execution_error_cls()
 
     def decorator(func: Callable) -> Callable:
         async def wrapper(*args: Any, **kwargs: Any) -> StageResult:
@@ -238,7 +251,7 @@ def with_error_handling(
                     )
 
                 # Wrap in StageExecutionError for clarity
-                raise StageExecutionError(
+                raise stage_execution_error(
                     stage=stage_name,
                     original=e,
                     recoverable=_is_recoverable_error(e),
@@ -251,27 +264,9 @@ def with_error_handling(
 
 def _is_recoverable_error(error: Exception) -> bool:
     """Determine if an error is recoverable (pipeline can continue)."""
-    error_str = str(error).lower()
-    error_type = type(error).__name__.lower()
-
-    # Network errors are typically recoverable
-    recoverable_keywords = [
-        "connection",
-        "timeout",
-        "network",
-        "disconnected",
-        "server disconnected",
-    ]
-
-    recoverable_types = [
-        "connectionerror",
-        "timeouterror",
-        "httperror",
-    ]
-
     return (
-        any(keyword in error_str for keyword in recoverable_keywords)
-        or error_type in recoverable_types
+        type(error).__name__.lower() in _RECOVERABLE_ERROR_TYPES
+        or _RECOVERABLE_MESSAGE_RE.search(str(error)) is not None
     )
 
 
@@ -313,9 +308,6 @@ class StageRunner:
         Returns:
             StageResult with status and data
         """
-        from stageflow.pipeline.dag import StageExecutionError
-        from stageflow.stages.result import StageResult
-
         started_at = datetime.now(UTC)
 
         try:
@@ -364,7 +356,7 @@ class StageRunner:
                 payload=error_payload,
             )
 
-            raise StageExecutionError(
+            raise _get_stage_execution_error_cls()(
                 stage=self.stage_name,
                 original=e,
                 recoverable=_is_recoverable_error(e),
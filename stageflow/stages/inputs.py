@@ -1,11 +1,12 @@
-"""StageInputs - Immutable view of prior stage outputs available to a stage.
+"""StageInputs - Read-only view of prior stage outputs available to a stage.
 
-This module defines StageInputs, an immutable dataclass that provides stages with
+This module defines StageInputs, a read-only dataclass that provides stages with
 access to the original ContextSnapshot and outputs from declared dependency stages.
 This replaces the mutable shared state pattern (ctx.config["data"]).
 
 Key Principles:
-- Immutable: frozen=True prevents accidental mutation
+- Read-only: stages treat inputs as immutable; the dataclass is not frozen so
+  per-stage construction stays cheap on the orchestration hot path
 - Explicit: Only declared dependency outputs are accessible
 - Validated: Strict mode raises errors for undeclared dependencies
 - Typed: StageOutput is already a frozen dataclass with typed fields
@@ -39,6 +40,10 @@ from stageflow.stages.ports import AudioPorts, CorePorts, LLMPorts
 if TYPE_CHECKING:
     from stageflow.context import ContextSnapshot
 
+# Shared default for stages without dependencies; frozensets are immutable so one
+# instance can back every StageInputs instead of allocating an empty set per stage.
+_NO_DECLARED_DEPS: frozenset[str] = frozenset()
+
 
 class UndeclaredDependencyError(Exception):
     """Raised when a stage accesses an undeclared dependency.
@@ -74,9 +79,9 @@ class UndeclaredDependencyError(Exception):
         super().__init__(msg)
 
 
-@dataclass(frozen=True, slots=True)
+@dataclass(slots=True)
 class StageInputs:
-    """Immutable view of prior stage outputs available to a stage.
+    """Read-only view of prior stage outputs available to a stage.
 
     This is the canonical input type for stages that follow the immutable
     data flow pattern. It provides:
@@ -106,10 +111,14 @@ class StageInputs:
 
     snapshot: ContextSnapshot
     prior_outputs: dict[str, StageOutput] = field(default_factory=dict)
-    ports: CorePorts | LLMPorts | AudioPorts | None = field(default_factory=lambda: None)
-    declared_deps: frozenset[str] = field(default_factory=frozenset)
+    ports: CorePorts | LLMPorts | AudioPorts | None = None
+    declared_deps: frozenset[str] = _NO_DECLARED_DEPS
     stage_name: str | None = None
     strict: bool = True
+    # Lazily built key -> producing output index backing get(); first writer wins.
+    _key_index: dict[str, StageOutput] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     @property
     def tool_registry(self):
@@ -137,6 +146,9 @@ class StageInputs:
     @staticmethod
     def _ensure_valid_key(key: str | None) -> str:
         """Validate key arguments provided to StageInputs helpers."""
+        # Plain non-empty strings are the common case; settle them with one check.
+        if type(key) is str and key:
+            return key
         if key is None:
             raise TypeError("StageInputs key must be provided")
         if not isinstance(key, str):
@@ -165,10 +177,22 @@ class StageInputs:
         """
         key = self._ensure_valid_key(key)
 
+        index = self._key_index
+        if index is None:
+            index = self._build_key_index()
+        output = index.get(key)
+        if output is None:
+            return default
+        return output.data[key]
+
+    def _build_key_index(self) -> dict[str, StageOutput]:
+        """Index each data key to the first prior output (in insertion order) providing it."""
+        index: dict[str, StageOutput] = {}
         for output in self.prior_outputs.values():
-            if key in output.data:
-                return output.data[key]
-        return default
+            for data_key in output.data:
+                index.setdefault(data_key, output)
+        self._key_index = index
+        return index
 
     def get_from(self, stage_name: str, key: str, default: Any = None) -> Any:
         """Get a specific value from a specific stage's output.
@@ -193,9 +217,10 @@ class StageInputs:
 
         self._validate_dependency(stage_name)
 
-        if stage_name not in self.prior_outputs:
+        output = self.prior_outputs.get(stage_name)
+        if output is None:
             return default
-        return self.prior_outputs[stage_name].data.get(key, default)
+        return output.data.get(key, default)
 
     def has_output(self, stage_name: str) -> bool:
         """Check if a stage has produced output.
@@ -250,20 +275,20 @@ class StageInputs:
 
         self._validate_dependency(stage_name)
 
-        if stage_name not in self.prior_outputs:
+        output = self.prior_outputs.get(stage_name)
+        if output is None:
             raise KeyError(
                 f"Required dependency '{stage_name}' has no output. "
                 f"Ensure '{stage_name}' executes before this stage."
             )
 
-        output = self.prior_outputs[stage_name]
-        if key not in output.data:
+        try:
+            return output.data[key]
+        except KeyError:
             raise KeyError(
                 f"Required key '{key}' not found in output from '{stage_name}'. "
                 f"Available keys: {list(output.data.keys())}"
-            )
-
-        return output.data[key]
+            ) from None
 
 
 def create_stage_inputs(
@@ -291,8 +316,8 @@ def create_stage_inputs(
         StageInputs instance ready for use by stages.
     """
     deps: frozenset[str]
-    if declared_deps is None:
-        deps = frozenset()
+    if not declared_deps:
+        deps = _NO_DECLARED_DEPS
     elif isinstance(declared_deps, frozenset):
         deps = declared_deps
     else:
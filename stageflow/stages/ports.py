@@ -12,7 +12,7 @@ from dataclasses import dataclass
 from typing import Any
 
 
-@dataclass(frozen=True, slots=True)
+@dataclass(frozen=True, slots=True, kw_only=True)
 class CorePorts:
     """Core capabilities needed by most stages.
 
@@ -20,10 +20,24 @@ class CorePorts:
     - Database access
     - Status updates
     - Basic logging
+
+    ``create_core_ports`` is an alias of this class.
+
+    Attributes:
+        db: Database session for persistence operations.
+        db_lock: Optional lock for preventing concurrent DB access.
+        call_logger_db: Database session for provider call logging.
+        send_status: Callback for status updates.
+        call_logger: Logger for tracking provider API calls.
+        retry_fn: Retry function for failed operations.
+        realtime_bus: Optional named channel bus for real-time stage-to-stage handoff.
     """
 
     # Database and persistence
     db: Any = None
+    # Opt-in single-writer lock. Stageflow never acquires it; leave it None for
+    # drivers with connection pools and set it only for stages sharing a
+    # non-concurrent session (e.g. SQLite), which acquire it themselves.
     db_lock: Lock | None = None
     call_logger_db: Any = None
 
@@ -34,11 +48,19 @@ class CorePorts:
     realtime_bus: Any = None
 
 
-@dataclass(frozen=True, slots=True)
+@dataclass(frozen=True, slots=True, kw_only=True)
 class LLMPorts:
     """Ports for LLM-powered stages.
 
     Provides access to language models and related services.
+
+    ``create_llm_ports`` is an alias of this class.
+
+    Attributes:
+        llm_provider: LLM provider for text generation.
+        chat_service: Chat service for building context and running LLM.
+        llm_chunk_queue: Queue for LLM chunks in streaming pipeline.
+        send_token: Callback for streaming tokens.
     """
 
     llm_provider: Any = None
@@ -64,69 +86,10 @@ class AudioPorts:
     recording: Any = None
 
 
-
-
-# Core ports factory
-def create_core_ports(
-    *,
-    db: Any = None,
-    db_lock: Lock | None = None,
-    call_logger_db: Any = None,
-    send_status: Callable[[str, str, dict[str, Any] | None], Awaitable[None]] | None = None,
-    call_logger: Any = None,
-    retry_fn: Any = None,
-    realtime_bus: Any = None,
-) -> CorePorts:
-    """Create CorePorts with essential capabilities.
-
-    Args:
-        db: Database session for persistence operations
-        db_lock: Optional lock for preventing concurrent DB access
-        call_logger_db: Database session for provider call logging
-        send_status: Callback for status updates
-        call_logger: Logger for tracking provider API calls
-        retry_fn: Retry function for failed operations
-        realtime_bus: Optional named channel bus for real-time stage-to-stage handoff
-
-    Returns:
-        CorePorts instance
-    """
-    return CorePorts(
-        db=db,
-        db_lock=db_lock,
-        call_logger_db=call_logger_db,
-        send_status=send_status,
-        call_logger=call_logger,
-        retry_fn=retry_fn,
-        realtime_bus=realtime_bus,
-    )
-
-
-# LLM ports factory
-def create_llm_ports(
-    *,
-    llm_provider: Any = None,
-    chat_service: Any = None,
-    llm_chunk_queue: Any = None,
-    send_token: Callable[[str], Awaitable[None]] | None = None,
-) -> LLMPorts:
-    """Create LLMPorts for language model operations.
-
-    Args:
-        llm_provider: LLM provider for text generation
-        chat_service: Chat service for building context and running LLM
-        llm_chunk_queue: Queue for LLM chunks in streaming pipeline
-        send_token: Callback for streaming tokens
-
-    Returns:
-        LLMPorts instance
-    """
-    return LLMPorts(
-        llm_provider=llm_provider,
-        chat_service=chat_service,
-        llm_chunk_queue=llm_chunk_queue,
-        send_token=send_token,
-    )
+# Port factories. CorePorts and LLMPorts are keyword-only dataclasses, so their
+# constructors already have the typed keyword-only signatures the factories need.
+create_core_ports = CorePorts
+create_llm_ports = LLMPorts
 
 
 # Audio ports factory
@@ -181,8 +144,6 @@ def create_audio_ports(
     )
 
 
-
-
 __all__ = [
     "CorePorts",
     "LLMPorts",
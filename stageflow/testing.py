@@ -5,19 +5,25 @@ This module provides helpers for testing stages, pipelines, and contexts.
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from collections.abc import Callable, Iterable, Sequence
+from dataclasses import dataclass
+from operator import attrgetter
 from typing import Any
-from uuid import UUID, uuid4
+from uuid import UUID
 
 from stageflow.context import ContextSnapshot, Message
 from stageflow.context.conversation import Conversation
 from stageflow.context.identity import RunIdentity
-from stageflow.core import StageContext, StageOutput
+from stageflow.core import PipelineTimer, StageContext, StageOutput
 from stageflow.events import NoOpEventSink
+from stageflow.helpers.uuid_utils import generate_uuid4
 from stageflow.stages.context import PipelineContext
 from stageflow.stages.inputs import StageInputs, create_stage_inputs
 from stageflow.stages.ports import AudioPorts, CorePorts, LLMPorts
 
+# NoOpEventSink is stateless, so every test context can share one instance.
+_NOOP_EVENT_SINK = NoOpEventSink()
+
 
 def create_test_snapshot(
     *,
@@ -61,25 +67,14 @@ def create_test_snapshot(
             user_id=uuid4(),
         )
     """
-    # Build RunIdentity with all IDs
-    # Use a sentinel to distinguish between "not provided" and "explicitly None"
-    _NOT_PROVIDED = object()
-
-    def _resolve_id(value: UUID | None, default_factory: object = _NOT_PROVIDED) -> UUID | None:
-        # If the value wasn't provided as a kwarg, generate a default
-        # But if explicitly passed as None, keep it None
-        if default_factory is _NOT_PROVIDED:
-            return value if value is not None else uuid4()
-        return value
-
-    # Check if values were explicitly passed in kwargs
+    # session_id and org_id stay None unless given; the other IDs default to fresh UUIDs
     run_id = RunIdentity(
-        pipeline_run_id=pipeline_run_id if pipeline_run_id is not None else uuid4(),
-        request_id=request_id if request_id is not None else uuid4(),
+        pipeline_run_id=pipeline_run_id if pipeline_run_id is not None else generate_uuid4(),
+        request_id=request_id if request_id is not None else generate_uuid4(),
         session_id=session_id,  # Allow explicit None
-        user_id=user_id if user_id is not None else uuid4(),
+        user_id=user_id if user_id is not None else generate_uuid4(),
         org_id=org_id,
-        interaction_id=interaction_id if interaction_id is not None else uuid4(),
+        interaction_id=interaction_id if interaction_id is not None else generate_uuid4(),
     )
 
     # Build Conversation if messages provided
@@ -133,8 +128,6 @@ def create_test_stage_context(
         # Access inputs
         value = ctx.inputs.get("value")  # Returns 42
     """
-    from stageflow.core import PipelineTimer
-
     if snapshot is None:
         snapshot = create_test_snapshot(**snapshot_kwargs)
 
@@ -158,7 +151,7 @@ def create_test_stage_context(
         inputs=inputs,
         stage_name=stage_name,
         timer=PipelineTimer(),
-        event_sink=event_sink or NoOpEventSink(),
+        event_sink=event_sink or _NOOP_EVENT_SINK,
     )
 
 
@@ -204,23 +197,23 @@ def create_test_pipeline_context(
         )
     """
     return PipelineContext.create(
-        pipeline_run_id=pipeline_run_id or uuid4(),
-        request_id=request_id or uuid4(),
-        session_id=session_id or uuid4(),
-        user_id=user_id or uuid4(),
+        pipeline_run_id=pipeline_run_id or generate_uuid4(),
+        request_id=request_id or generate_uuid4(),
+        session_id=session_id or generate_uuid4(),
+        user_id=user_id or generate_uuid4(),
         org_id=org_id,
-        interaction_id=interaction_id or uuid4(),
+        interaction_id=interaction_id or generate_uuid4(),
         topology=topology,
         execution_mode=execution_mode,
         service=service,
-        data=data or {},
-        event_sink=event_sink or NoOpEventSink(),
+        data=data,
+        event_sink=event_sink or _NOOP_EVENT_SINK,
         ports=ports,
         **kwargs,
     )
 
 
-@dataclass
+@dataclass(slots=True)
 class SnapshotValidationError:
     """Represents a validation error in a ContextSnapshot."""
 
@@ -229,18 +222,30 @@ class SnapshotValidationError:
     value: Any = None
 
 
-@dataclass
+@dataclass(slots=True)
 class SnapshotValidationResult:
-    """Result of validating a ContextSnapshot."""
+    """Result of validating a ContextSnapshot.
+
+    Empty ``errors``/``warnings`` are the shared empty tuple rather than
+    fresh lists; convert with ``list(...)`` before mutating.
+    """
 
     valid: bool
-    errors: list[SnapshotValidationError] = field(default_factory=list)
-    warnings: list[SnapshotValidationError] = field(default_factory=list)
+    errors: Sequence[SnapshotValidationError] = ()
+    warnings: Sequence[SnapshotValidationError] = ()
 
     def __bool__(self) -> bool:
         return self.valid
 
 
+# (field, getter, message) for each ``require_*`` flag of validate_snapshot,
+# in the same order as the flags are checked.
+_REQUIRED_FIELD_CHECKS: tuple[tuple[str, Callable[[ContextSnapshot], Any], str], ...] = tuple(
+    (name, attrgetter(name), f"{name} is required but not set")
+    for name in ("pipeline_run_id", "request_id", "user_id", "org_id")
+)
+
+
 def validate_snapshot(
     snapshot: ContextSnapshot,
     *,
@@ -249,6 +254,7 @@ def validate_snapshot(
     require_pipeline_run_id: bool = True,
     require_request_id: bool = False,
     strict: bool = False,
+    early_exit: bool = False,
 ) -> SnapshotValidationResult:
     """Validate a ContextSnapshot for correctness.
 
@@ -262,6 +268,8 @@ def validate_snapshot(
         require_pipeline_run_id: Require pipeline_run_id to be set
         require_request_id: Require request_id to be set
         strict: If True, treat warnings as errors
+        early_exit: If True, stop after the first group of checks that fails
+            and skip the remaining ones. Use when only pass/fail matters.
 
     Returns:
         SnapshotValidationResult with validation status and any errors/warnings
@@ -276,45 +284,45 @@ def validate_snapshot(
     warnings: list[SnapshotValidationError] = []
 
     # Required field checks
-    if require_pipeline_run_id and snapshot.pipeline_run_id is None:
-        errors.append(SnapshotValidationError(
-            field="pipeline_run_id",
-            message="pipeline_run_id is required but not set",
-        ))
-
-    if require_request_id and snapshot.request_id is None:
-        errors.append(SnapshotValidationError(
-            field="request_id",
-            message="request_id is required but not set",
-        ))
-
-    if require_user_id and snapshot.user_id is None:
-        errors.append(SnapshotValidationError(
-            field="user_id",
-            message="user_id is required but not set",
-        ))
+    required = (
+        require_pipeline_run_id,
+        require_request_id,
+        require_user_id,
+        require_org_id,
+    )
+    for enabled, (field_name, get_value, message) in zip(
+        required, _REQUIRED_FIELD_CHECKS, strict=True
+    ):
+        if enabled and get_value(snapshot) is None:
+            errors.append(SnapshotValidationError(field=field_name, message=message))
 
-    if require_org_id and snapshot.org_id is None:
-        errors.append(SnapshotValidationError(
-            field="org_id",
-            message="org_id is required but not set",
-        ))
+    if early_exit and errors:
+        return _validation_result(errors, warnings, strict)
 
     # Type checks for messages
-    if snapshot.messages:
-        for i, msg in enumerate(snapshot.messages):
-            if not isinstance(msg, Message):
-                errors.append(SnapshotValidationError(
-                    field=f"messages[{i}]",
-                    message=f"Expected Message, got {type(msg).__name__}",
-                    value=msg,
-                ))
-            elif not msg.role:
-                warnings.append(SnapshotValidationError(
-                    field=f"messages[{i}].role",
-                    message="Message role is empty",
-                    value=msg,
-                ))
+    messages = snapshot.messages
+    if messages:
+        errors.extend(
+            SnapshotValidationError(
+                field=f"messages[{i}]",
+                message=f"Expected Message, got {type(msg).__name__}",
+                value=msg,
+            )
+            for i, msg in enumerate(messages)
+            if not isinstance(msg, Message)
+        )
+        warnings.extend(
+            SnapshotValidationError(
+                field=f"messages[{i}].role",
+                message="Message role is empty",
+                value=msg,
+            )
+            for i, msg in enumerate(messages)
+            if isinstance(msg, Message) and not msg.role
+        )
+
+        if early_exit and (errors or (strict and warnings)):
+            return _validation_result(errors, warnings, strict)
 
     # Topology/execution_mode consistency warnings
     if snapshot.topology is None and snapshot.execution_mode is not None:
@@ -323,6 +331,9 @@ def validate_snapshot(
             message="execution_mode is set but topology is None",
         ))
 
+    if early_exit and strict and warnings:
+        return _validation_result(errors, warnings, strict)
+
     # Extensions type check
     if not isinstance(snapshot.extensions, dict):
         errors.append(SnapshotValidationError(
@@ -331,21 +342,32 @@ def validate_snapshot(
             value=snapshot.extensions,
         ))
 
-    # In strict mode, warnings become errors
+    return _validation_result(errors, warnings, strict)
+
+
+def _validation_result(
+    errors: list[SnapshotValidationError],
+    warnings: list[SnapshotValidationError],
+    strict: bool,
+) -> SnapshotValidationResult:
+    """Build the final result, promoting warnings to errors in strict mode."""
     if strict:
         errors.extend(warnings)
-        warnings = []
+        return SnapshotValidationResult(valid=not errors, errors=errors or ())
 
     return SnapshotValidationResult(
-        valid=len(errors) == 0,
-        errors=errors,
-        warnings=warnings,
+        valid=not errors,
+        errors=errors or (),
+        warnings=warnings or (),
     )
 
 
 def validate_snapshot_strict(snapshot: ContextSnapshot, **kwargs: Any) -> ContextSnapshot:
     """Validate a snapshot and raise if invalid.
 
+    Validation stops at the first failing group of checks unless
+    ``early_exit=False`` is passed.
+
     Args:
         snapshot: The snapshot to validate
         **kwargs: Passed to validate_snapshot
@@ -360,6 +382,7 @@ def validate_snapshot_strict(snapshot: ContextSnapshot, **kwargs: Any) -> Contex
         # This will raise if snapshot is invalid
         snapshot = validate_snapshot_strict(snapshot, require_user_id=True)
     """
+    kwargs.setdefault("early_exit", True)
     result = validate_snapshot(snapshot, strict=True, **kwargs)
     if not result:
         error_details = "; ".join(f"{e.field}: {e.message}" for e in result.errors)
@@ -390,6 +413,36 @@ def snapshot_from_dict_strict(data: dict[str, Any], **validation_kwargs: Any) ->
     return validate_snapshot_strict(snapshot, **validation_kwargs)
 
 
+def snapshots_from_dicts_strict(
+    data_list: Iterable[dict[str, Any]],
+    **validation_kwargs: Any,
+) -> list[ContextSnapshot]:
+    """Create and validate many ContextSnapshots from dicts.
+
+    Bulk counterpart of snapshot_from_dict_strict for ingestion-style loads.
+    Each snapshot stops at its first failing check unless
+    ``early_exit=False`` is passed.
+
+    Args:
+        data_list: Dictionaries to create snapshots from
+        **validation_kwargs: Passed to validate_snapshot
+
+    Returns:
+        Validated ContextSnapshots, in input order
+
+    Raises:
+        ValueError: If any dict produces an invalid snapshot
+
+    Example:
+        snapshots = snapshots_from_dicts_strict(rows, require_user_id=True)
+    """
+    validation_kwargs.setdefault("early_exit", True)
+    from_dict = ContextSnapshot.from_dict
+    return [
+        validate_snapshot_strict(from_dict(data), **validation_kwargs) for data in data_list
+    ]
+
+
 __all__ = [
     # Snapshot creation
     "create_test_snapshot",
@@ -401,4 +454,5 @@ __all__ = [
     "validate_snapshot",
     "validate_snapshot_strict",
     "snapshot_from_dict_strict",
+    "snapshots_from_dicts_strict",
 ]
@@ -87,6 +87,15 @@ class ApprovalDecision:
         }
 
 
+@dataclass(slots=True)
+class _PendingApproval:
+    """Registry entry bundling a request with its wake-up event and decision."""
+
+    request: ApprovalRequest
+    event: asyncio.Event = field(default_factory=asyncio.Event)
+    decision: ApprovalDecision | None = None
+
+
 class ApprovalService:
     """Service for managing HITL approval requests.
 
@@ -111,9 +120,7 @@ class ApprovalService:
 
     def __init__(self, default_timeout_seconds: float = 60.0) -> None:
         self.default_timeout_seconds = default_timeout_seconds
-        self._requests: dict[UUID, ApprovalRequest] = {}
-        self._decision_events: dict[UUID, asyncio.Event] = {}
-        self._decisions: dict[UUID, ApprovalDecision] = {}
+        self._entries: dict[UUID, _PendingApproval] = {}
         self._lock = asyncio.Lock()
 
     async def request_approval(
@@ -147,8 +154,7 @@ class ApprovalService:
         )
 
         async with self._lock:
-            self._requests[request_id] = request
-            self._decision_events[request_id] = asyncio.Event()
+            self._entries[request_id] = _PendingApproval(request)
 
         return request
 
@@ -183,18 +189,18 @@ class ApprovalService:
         timeout = timeout_seconds if timeout_seconds is not None else self.default_timeout_seconds
 
         async with self._lock:
-            event = self._decision_events.get(request_id)
-            if event is None:
+            entry = self._entries.get(request_id)
+            if entry is None:
                 raise KeyError(f"Approval request {request_id} not found")
 
         try:
-            await asyncio.wait_for(event.wait(), timeout=timeout)
+            await asyncio.wait_for(entry.event.wait(), timeout=timeout)
         except TimeoutError:
             await self._mark_expired(request_id)
             raise
 
         async with self._lock:
-            decision = self._decisions.get(request_id)
+            decision = entry.decision
             if decision is None:
                 return ApprovalDecision(request_id=request_id, granted=False, reason="no_decision")
             return decision
@@ -228,28 +234,26 @@ class ApprovalService:
         )
 
         async with self._lock:
-            request = self._requests.get(request_id)
-            if request is None:
+            entry = self._entries.get(request_id)
+            if entry is None:
                 raise KeyError(f"Approval request {request_id} not found")
 
+            request = entry.request
             request.status = ApprovalStatus.APPROVED if granted else ApprovalStatus.DENIED
             request.decided_by = decided_by
             request.decided_at = datetime.now(UTC).isoformat()
 
-            self._decisions[request_id] = decision
-
-            event = self._decision_events.get(request_id)
-            if event:
-                event.set()
+            entry.decision = decision
+            entry.event.set()
 
         return decision
 
     async def _mark_expired(self, request_id: UUID) -> None:
         """Mark a request as expired."""
         async with self._lock:
-            request = self._requests.get(request_id)
-            if request and request.status == ApprovalStatus.PENDING:
-                request.status = ApprovalStatus.EXPIRED
+            entry = self._entries.get(request_id)
+            if entry and entry.request.status == ApprovalStatus.PENDING:
+                entry.request.status = ApprovalStatus.EXPIRED
 
     async def cancel_request(self, request_id: UUID) -> bool:
         """Cancel a pending approval request.
@@ -261,39 +265,37 @@ class ApprovalService:
             True if cancelled, False if not found or already decided
         """
         async with self._lock:
-            request = self._requests.get(request_id)
-            if request is None or request.status != ApprovalStatus.PENDING:
+            entry = self._entries.get(request_id)
+            if entry is None or entry.request.status != ApprovalStatus.PENDING:
                 return False
 
-            request.status = ApprovalStatus.CANCELLED
-            self._decisions[request_id] = ApprovalDecision(
+            entry.request.status = ApprovalStatus.CANCELLED
+            entry.decision = ApprovalDecision(
                 request_id=request_id,
                 granted=False,
                 reason="cancelled",
             )
-
-            event = self._decision_events.get(request_id)
-            if event:
-                event.set()
+            entry.event.set()
 
             return True
 
     async def get_request(self, request_id: UUID) -> ApprovalRequest | None:
         """Get an approval request by ID."""
         async with self._lock:
-            return self._requests.get(request_id)
+            entry = self._entries.get(request_id)
+            return entry.request if entry else None
 
     async def get_status(self, request_or_action_id: UUID) -> ApprovalStatus | None:
         """Backward-compatible status lookup by request_id or action_id."""
         async with self._lock:
-            request = self._requests.get(request_or_action_id)
-            if request is not None:
-                return request.status
+            entry = self._entries.get(request_or_action_id)
+            if entry is not None:
+                return entry.request.status
 
             # Fall back to action_id lookup.
-            for candidate in reversed(list(self._requests.values())):
-                if candidate.action_id == request_or_action_id:
-                    return candidate.status
+            for candidate in reversed(list(self._entries.values())):
+                if candidate.request.action_id == request_or_action_id:
+                    return candidate.request.status
         return None
 
     async def get_pending_requests(
@@ -310,8 +312,8 @@ class ApprovalService:
         """
         async with self._lock:
             requests = [
-                r for r in self._requests.values()
-                if r.status == ApprovalStatus.PENDING
+                entry.request for entry in self._entries.values()
+                if entry.request.status == ApprovalStatus.PENDING
             ]
             if pipeline_run_id:
                 requests = [r for r in requests if r.pipeline_run_id == pipeline_run_id]
@@ -320,9 +322,7 @@ class ApprovalService:
     async def cleanup(self, request_id: UUID) -> None:
         """Clean up a completed request."""
         async with self._lock:
-            self._requests.pop(request_id, None)
-            self._decision_events.pop(request_id, None)
-            self._decisions.pop(request_id, None)
+            self._entries.pop(request_id, None)
 
 
 # Global approval service instance
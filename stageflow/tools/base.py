@@ -19,14 +19,14 @@ class ActionProtocol(Protocol):
         ...
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ToolInput:
     """Input schema for a tool - wrapped action payload."""
 
     action: ActionProtocol
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ToolOutput:
     """Output from tool execution."""
 
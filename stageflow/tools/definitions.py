@@ -124,11 +124,17 @@ class UndoMetadata:
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> UndoMetadata:
         """Create from dictionary."""
+        if "created_at" not in data:
+            return cls(
+                action_id=UUID(data["action_id"]),
+                tool_name=data["tool_name"],
+                undo_data=data["undo_data"],
+            )
         return cls(
             action_id=UUID(data["action_id"]),
             tool_name=data["tool_name"],
             undo_data=data["undo_data"],
-            created_at=data.get("created_at", datetime.now(UTC).isoformat()),
+            created_at=data["created_at"],
         )
 
 
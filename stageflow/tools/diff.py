@@ -10,9 +10,11 @@ content. Diffs are essential for:
 
 from __future__ import annotations
 
+from collections import Counter
 from dataclasses import dataclass, field
 from difflib import SequenceMatcher, unified_diff
 from enum import Enum
+from operator import attrgetter, itemgetter
 from typing import Any
 
 
@@ -181,13 +183,16 @@ def diff_text(
     matcher = SequenceMatcher(None, old_lines, new_lines)
     similarity = round(matcher.ratio(), 3)
 
+    # Tally change types in a single pass rather than one scan per type.
+    counts = Counter(map(attrgetter("type"), changes))
+
     return DiffResult(
         diff_type=diff_type,
         diff_output=diff_output,
         changes=changes,
-        additions=sum(1 for c in changes if c.type == "add"),
-        deletions=sum(1 for c in changes if c.type == "remove"),
-        unchanged=sum(1 for c in changes if c.type == "equal"),
+        additions=counts["add"],
+        deletions=counts["remove"],
+        unchanged=counts["equal"],
         similarity=similarity,
         old_content=old,
         new_content=new,
@@ -289,8 +294,9 @@ def diff_json(
     diff_output = "\n".join(lines)
 
     # Count operations by type
-    additions = sum(1 for op in patch_ops if op["op"] in ("add", "replace"))
-    deletions = sum(1 for op in patch_ops if op["op"] == "remove")
+    counts = Counter(map(itemgetter("op"), patch_ops))
+    additions = counts["add"] + counts["replace"]
+    deletions = counts["remove"]
 
     return DiffResult(
         diff_type=DiffType.JSON_PATCH,
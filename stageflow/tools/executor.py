@@ -6,6 +6,7 @@ which provides behavior gating, undo semantics, and HITL approval.
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import time
 from dataclasses import dataclass, field
@@ -21,6 +22,8 @@ if TYPE_CHECKING:
     from stageflow.pipeline.subpipeline import SubpipelineResult, SubpipelineSpawner
     from stageflow.stages.context import PipelineContext
 
+    from .base import ToolOutput
+
 logger = logging.getLogger("stageflow.tools.executor")
 
 
@@ -44,7 +47,7 @@ class PlanProtocol(Protocol):
         ...
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolExecutorResult:
     """Result from tool execution stage."""
 
@@ -55,6 +58,15 @@ class ToolExecutorResult:
     error: str | None = None
     subpipeline_runs: list[dict[str, Any]] = field(default_factory=list)
 
+    def reset(self) -> None:
+        """Restore the default field values in place, keeping the list objects."""
+        self.actions_executed = 0
+        self.actions_failed = 0
+        self.artifacts_produced.clear()
+        self.requires_reentry = False
+        self.error = None
+        self.subpipeline_runs.clear()
+
 
 class ToolExecutor:
     """Pipeline stage that executes agent actions.
@@ -80,6 +92,7 @@ class ToolExecutor:
         registry: PipelineRegistry | None = None,
         uuid_monitor: UuidCollisionMonitor | None = None,
         memory_tracker: MemoryTracker | None = None,
+        max_concurrency: int = 1,
     ) -> None:
         """Initialize ToolExecutor.
 
@@ -88,8 +101,19 @@ class ToolExecutor:
             registry: Optional PipelineRegistry for dependency injection (defaults to global).
             uuid_monitor: Optional UUID collision monitor for telemetry.
             memory_tracker: Optional memory tracker for growth metrics.
+            max_concurrency: Maximum number of plan actions running at once.
+                The default of 1 executes actions one after another, in plan
+                order. Raise it only when a plan's actions are independent;
+                an action whose payload sets ``"sequential": True`` still runs
+                on its own, after every earlier action has finished.
+
+        Raises:
+            ValueError: If max_concurrency is less than 1.
         """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
         self.tool_registry = get_tool_registry()
+        self.max_concurrency = max_concurrency
         self._spawner = spawner
         self._pipeline_registry = registry
         self._uuid_monitor = uuid_monitor
@@ -117,57 +141,119 @@ class ToolExecutor:
         self,
         ctx: PipelineContext,
         plan: PlanProtocol | None = None,
+        *,
+        result: ToolExecutorResult | None = None,
     ) -> ToolExecutorResult:
         """Execute all actions in the plan.
 
         Args:
             ctx: Pipeline context with user, session, etc.
             plan: Plan from the agent containing actions
+            result: Optional result to reset and fill in place, letting callers
+                that process plans in a loop reuse one object. The caller must
+                not hold on to data from a previous run of the same result.
 
         Returns:
             ToolExecutorResult with execution results and artifacts
         """
-        if plan is None:
-            return ToolExecutorResult()
+        if result is None:
+            result = ToolExecutorResult()
+        else:
+            result.reset()
 
-        result = ToolExecutorResult()
-
-        for action in plan.actions:
-            try:
-                output = await self.tool_registry.execute(action, ctx.to_dict())
+        # Nothing to dispatch: skip building the context dict and result bookkeeping.
+        if plan is None or not plan.actions:
+            return result
 
-                if output is None:
-                    result.actions_failed += 1
-                    logger.warning(f"No tool available for action type: {action.type}")
-                    continue
+        actions = plan.actions
+        # Serialize the context once per plan; each tool still gets its own
+        # shallow copy so one tool's mutations can't leak into another's.
+        ctx_dict = ctx.to_dict()
+
+        # Actions run in plan order unless max_concurrency allows overlap, in which
+        # case consecutive non-sequential actions are dispatched together. Outputs
+        # are always folded back in plan order.
+        outputs: list[ToolOutput | None | BaseException] = []
+        batch: list[ActionProtocol] = []
+        for action in actions:
+            if self.max_concurrency > 1 and not action.payload.get("sequential"):
+                batch.append(action)
+                continue
+            outputs.extend(await self._execute_batch(batch, ctx_dict))
+            batch = []
+            outputs.extend(await self._execute_batch([action], ctx_dict))
+        outputs.extend(await self._execute_batch(batch, ctx_dict))
+
+        # Fold into locals and write the totals back once.
+        executed = 0
+        failed = 0
+        requires_reentry = False
+        extend_artifacts = result.artifacts_produced.extend
+        for action, output in zip(actions, outputs, strict=True):
+            if isinstance(output, Exception):
+                failed += 1
+                logger.error(
+                    "Error executing action %s: %s",
+                    action.type,
+                    output,
+                    exc_info=output,
+                )
+                continue
+            if isinstance(output, BaseException):
+                raise output
 
-                if output.success:
-                    result.actions_executed += 1
+            if output is None:
+                failed += 1
+                logger.warning("No tool available for action type: %s", action.type)
+                continue
 
-                    # Collect artifacts from tool output
-                    if output.artifacts:
-                        result.artifacts_produced.extend(output.artifacts)
+            if output.success:
+                executed += 1
 
-                    # Check if action requires re-entry
-                    if action.payload.get("requires_reentry"):
-                        result.requires_reentry = True
-                else:
-                    result.actions_failed += 1
-                    logger.error(f"Action {action.type} failed: {output.error}")
+                # Collect artifacts from tool output
+                if output.artifacts:
+                    extend_artifacts(output.artifacts)
 
-            except Exception as e:
-                result.actions_failed += 1
-                logger.error(
-                    f"Error executing action {action.type}: {e}",
-                    exc_info=True,
-                )
+                # Check if action requires re-entry
+                if action.payload.get("requires_reentry"):
+                    requires_reentry = True
+            else:
+                failed += 1
+                logger.error("Action %s failed: %s", action.type, output.error)
 
-        # Determine if re-entry is needed based on failed actions
-        if result.actions_failed > 0:
-            result.requires_reentry = True
+        result.actions_executed = executed
+        result.actions_failed = failed
+        # Failed actions always require re-entry
+        result.requires_reentry = requires_reentry or failed > 0
 
         return result
 
+    async def _execute_batch(
+        self,
+        actions: list[ActionProtocol],
+        ctx_dict: dict[str, Any],
+    ) -> list[ToolOutput | None | BaseException]:
+        """Run actions together (at most max_concurrency at once), returning outputs in order."""
+        registry = self.tool_registry
+        if not actions:
+            return []
+        if len(actions) == 1:
+            try:
+                return [await registry.execute(actions[0], dict(ctx_dict))]
+            except Exception as exc:
+                return [exc]
+        if len(actions) <= self.max_concurrency:
+            calls = [registry.execute(action, dict(ctx_dict)) for action in actions]
+        else:
+            semaphore = asyncio.Semaphore(self.max_concurrency)
+
+            async def _run(action: ActionProtocol) -> ToolOutput | None:
+                async with semaphore:
+                    return await registry.execute(action, dict(ctx_dict))
+
+            calls = [_run(action) for action in actions]
+        return await asyncio.gather(*calls, return_exceptions=True)
+
     async def spawn_subpipeline(
         self,
         pipeline_name: str,
@@ -212,7 +298,7 @@ class ToolExecutor:
             if result.success:
                 validated_data = result.data
             else:
-                logger.error(f"Validation failed: {result.error}")
+                logger.error("Validation failed: %s", result.error)
             ```
         """
         from stageflow.pipeline.subpipeline import MaxDepthExceededError
@@ -245,7 +331,8 @@ class ToolExecutor:
             pipeline = self.pipeline_registry.get(pipeline_name)
         except KeyError:
             logger.error(
-                f"Pipeline '{pipeline_name}' not found in registry",
+                "Pipeline '%s' not found in registry",
+                pipeline_name,
                 extra={
                     "pipeline_name": pipeline_name,
                     "parent_run_id": str(parent_run_id) if parent_run_id else None,
@@ -318,7 +405,8 @@ class ToolExecutor:
             if self._memory_tracker:
                 self._memory_tracker.observe(label="subpipeline:error")
             logger.error(
-                f"Subpipeline spawn failed: {e}",
+                "Subpipeline spawn failed: %s",
+                e,
                 extra={
                     "pipeline_name": pipeline_name,
                     "parent_run_id": str(parent_run_id) if parent_run_id else None,
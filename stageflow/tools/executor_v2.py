@@ -16,6 +16,7 @@ Follows SOLID principles:
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import time
 from dataclasses import dataclass
@@ -48,6 +49,8 @@ from .events import (
 from .undo import UndoStore, get_undo_store
 
 if TYPE_CHECKING:
+    from collections.abc import Awaitable
+
     from stageflow.protocols import ExecutionContext
 
 logger = logging.getLogger("stageflow.tools.executor")
@@ -108,7 +111,8 @@ class AdvancedToolExecutor:
     ) -> None:
         self.config = config or ToolExecutorConfig()
         self._tools: dict[str, ToolDefinition] = {}
-        self._undo_store = undo_store or get_undo_store()
+        # UndoStore defines __len__, so an empty store passed in is falsy.
+        self._undo_store = undo_store if undo_store is not None else get_undo_store()
         self._approval_service = approval_service or get_approval_service()
 
     def register(self, tool: ToolDefinition) -> None:
@@ -185,11 +189,16 @@ class AdvancedToolExecutor:
             output = await tool.handler(tool_input)
             duration_ms = (time.perf_counter() - start_time) * 1000
 
-            await self._emit_tool_completed(tool, tool_input, ctx, output, duration_ms)
+            completed = self._emit_tool_completed(tool, tool_input, ctx, output, duration_ms)
 
-            # Store undo metadata if undoable and successful
+            # Store undo metadata if undoable and successful; it does not depend on
+            # the completion event, so both side effects run concurrently.
             if tool.undoable and output.success and output.undo_metadata:
-                await self._store_undo_metadata(tool, tool_input, output)
+                await _gather_side_effects(
+                    completed, self._store_undo_metadata(tool, tool_input, output)
+                )
+            else:
+                await completed
 
             return output
 
@@ -234,8 +243,10 @@ class AdvancedToolExecutor:
             await tool.undo_handler(metadata)
             duration_ms = (time.perf_counter() - start_time) * 1000
 
-            await self._emit_tool_undone(tool, action_id, ctx, metadata, duration_ms)
-            await self._undo_store.delete(action_id)
+            await _gather_side_effects(
+                self._emit_tool_undone(tool, action_id, ctx, metadata, duration_ms),
+                self._undo_store.delete(action_id),
+            )
 
             return True
 
@@ -527,6 +538,18 @@ class AdvancedToolExecutor:
             logger.warning(f"Failed to emit event {event_type}: {e}")
 
 
+async def _gather_side_effects(*aws: Awaitable[Any]) -> None:
+    """Run independent side effects concurrently, then raise the first failure.
+
+    Unlike a bare gather, every awaitable is allowed to finish before an error
+    propagates, so events emitted by the caller's error path never race ahead
+    of a still-running completion event.
+    """
+    for result in await asyncio.gather(*aws, return_exceptions=True):
+        if isinstance(result, BaseException):
+            raise result
+
+
 def _summarize_payload(payload: dict[str, Any], max_length: int = 200) -> dict[str, Any]:
     """Create a summary of a payload for event emission."""
     summary: dict[str, Any] = {}
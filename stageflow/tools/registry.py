@@ -69,6 +69,8 @@ class ToolRegistry:
     - Execution of actions through their corresponding tools
     """
 
+    __slots__ = ("_tools", "_factories")
+
     def __init__(self) -> None:
         self._tools: dict[str, Tool] = {}
         self._factories: dict[str, Callable[..., Tool]] = {}
@@ -83,15 +85,17 @@ class ToolRegistry:
 
     def get_tool(self, action_type: str) -> Tool | None:
         """Get a tool for the given action type."""
-        if action_type in self._tools:
-            return self._tools[action_type]
-
-        if action_type in self._factories:
-            tool = self._factories[action_type]()
-            self._tools[action_type] = tool
+        tool = self._tools.get(action_type)
+        if tool is not None:
             return tool
 
-        return None
+        factory = self._factories.get(action_type)
+        if factory is None:
+            return None
+
+        tool = factory()
+        self._tools[action_type] = tool
+        return tool
 
     # Backward-compatible aliases
     def get(self, action_type: str) -> Tool | None:
@@ -108,11 +112,12 @@ class ToolRegistry:
 
     async def execute(self, action: ActionProtocol, ctx: dict[str, Any]) -> ToolOutput | None:
         """Execute an action using its registered tool."""
-        tool = self.get_tool(action.type)
+        action_type = action.type
+        tool = self.get_tool(action_type)
         if tool is None:
             return ToolOutput(
                 success=False,
-                error=f"No tool registered for action type: {action.type}",
+                error=f"No tool registered for action type: {action_type}",
             )
 
         input = ToolInput(action=action)
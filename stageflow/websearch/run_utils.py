@@ -43,6 +43,7 @@ from contextlib import asynccontextmanager
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from functools import partial
+from operator import itemgetter
 from typing import Any
 
 from stageflow.websearch.client import WebSearchClient, WebSearchConfig
@@ -417,7 +418,7 @@ async def search_and_extract(
 
     # Score relevance based on query keywords
     query_terms = set(query.lower().split())
-    relevant_pages: list[WebPage] = []
+    scored_pages: list[tuple[int, WebPage]] = []
 
     for page in pages:
         if not page.success:
@@ -425,20 +426,16 @@ async def search_and_extract(
 
         # Calculate simple relevance score
         content = f"{page.title or ''} {page.plain_text}".lower()
-        matches = sum(1 for term in query_terms if term in content)
+        matches = sum(map(content.__contains__, query_terms))
         score = matches / len(query_terms) if query_terms else 0
 
         if score >= relevance_threshold:
-            relevant_pages.append(page)
-
-    # Sort by relevance (pages with more keyword matches first)
-    relevant_pages.sort(
-        key=lambda p: sum(
-            1 for term in query_terms
-            if term in f"{p.title or ''} {p.plain_text}".lower()
-        ),
-        reverse=True,
-    )
+            scored_pages.append((matches, page))
+
+    # Sort by relevance (pages with more keyword matches first), reusing the match
+    # counts from scoring instead of lowercasing and rescanning every page again.
+    scored_pages.sort(key=itemgetter(0), reverse=True)
+    relevant_pages = [page for _, page in scored_pages]
 
     total_words = sum(p.word_count for p in relevant_pages)
     duration_ms = (datetime.now(UTC) - start_time).total_seconds() * 1000
@@ -565,22 +562,18 @@ async def fetch_with_retry(
     """
     last_error: str | None = None
 
-    for attempt in range(max_retries + 1):
-        page = await fetch_page(
-            url,
-            timeout=timeout,
-            headers=headers,
-            config=config,
-            client_factory=client_factory,
-        )
+    # One client for every attempt, so retries reuse its connection pool.
+    async with _client_context(config, client_factory) as client:
+        for attempt in range(max_retries + 1):
+            page = await client.fetch(url, timeout=timeout, headers=headers)
 
-        if page.success:
-            return page
+            if page.success:
+                return page
 
-        last_error = page.error
+            last_error = page.error
 
-        if attempt < max_retries:
-            await asyncio.sleep(retry_delay * (attempt + 1))  # Exponential backoff
+            if attempt < max_retries:
+                await asyncio.sleep(retry_delay * (attempt + 1))  # Exponential backoff
 
     return WebPage.error_result(
         url,
@@ -317,6 +317,32 @@ class TestPipeline:
         assert set(pipeline.stages.keys()) == {"a", "b"}
         assert pipeline.stages["b"].dependencies == ("a",)
 
+    def test_with_stages_matches_chained_with_stage(self):
+        """with_stages should build the same pipeline as chained with_stage calls."""
+        base = Pipeline(name="demo").with_stage("a", SimpleStage)
+        specs = (
+            stage("b", TransformStage, after="a"),
+            stage("c", EnrichStage, dependencies=("a", "b")),
+            stage("b", TransformStage, after="a", conditional=True),
+        )
+
+        batched = base.with_stages(*specs)
+        chained = base
+        for spec in specs:
+            chained = chained.with_stage(
+                spec.name,
+                spec.runner,
+                spec.kind,
+                spec.dependencies,
+                conditional=spec.conditional,
+                config=spec.config,
+            )
+
+        assert batched == chained
+        assert list(batched.stages) == ["a", "b", "c"]
+        assert batched.stages["b"].conditional is True
+        assert list(base.stages) == ["a"]
+
     def test_from_stages_classmethod(self):
         """Pipeline.from_stages should support concise declarative definitions."""
         pipeline = Pipeline.from_stages(
@@ -504,6 +530,24 @@ class TestPipeline:
         graph = pipeline.build()
         assert graph is not None
 
+    def test_build_reuses_graph_specs_until_stages_change(self):
+        """Repeated builds share validated specs but return fresh graphs."""
+        pipeline = Pipeline().with_stage("test", SimpleStage, StageKind.TRANSFORM)
+
+        first = pipeline.build()
+        second = pipeline.build()
+
+        assert first is not second
+        assert first.stage_specs[0] is second.stage_specs[0]
+        assert first._dependents is second._dependents
+        assert first._root_stages == ("test",)
+
+        pipeline.stages["other"] = Pipeline().with_stage(
+            "other", TransformStage, StageKind.TRANSFORM, dependencies=("missing",)
+        ).stages["other"]
+        with pytest.raises(PipelineValidationError, match="does not exist"):
+            pipeline.build()
+
     @pytest.mark.asyncio
     async def test_run_executes_pipeline_with_pipeline_context(self):
         """Pipeline.run should wrap build().run(...) for the common path."""
@@ -591,6 +635,9 @@ class TestPipeline:
         assert results.require("ok_stage").data["answer"] == 42
         assert results.require_ok("ok_stage").data["answer"] == 42
         assert results.data("ok_stage")["answer"] == 42
+        assert results.value("ok_stage", "answer") == 42
+        assert results.value("ok_stage", "missing", "fallback") == "fallback"
+        assert results.value("missing", "answer") is None
         assert results.ok("ok_stage") is True
         assert results.ok("failed_stage") is False
         assert results.failed() == ["failed_stage"]
@@ -3,17 +3,20 @@
 Tests the StageGraph DAG executor.
 """
 
+from datetime import UTC, datetime
 from typing import Any
 from uuid import uuid4
 
 import pytest
 
 from stageflow.core import StageOutput
+from stageflow.observability.wide_events import WideEventEmitter
 from stageflow.pipeline.dag import (
     StageGraph,
     StageSpec,
 )
 from stageflow.stages.context import PipelineContext
+from stageflow.stages.result import StageResult
 
 # === Test Fixtures ===
 
@@ -291,6 +294,28 @@ class TestStageGraphExecution:
         assert event["pipeline_name"] == ctx.topology
         assert event["stage_count"] == 2
 
+    def test_pipeline_wide_payload_derives_status_from_counts(self):
+        """Pipeline payload status and counts come from the same per-status tally."""
+        now = datetime.now(UTC)
+        stage_results = {
+            "a": StageResult(name="a", status="completed", started_at=now, ended_at=now, data={"y": 1, "x": 2}),
+            "b": StageResult(name="b", status="failed", started_at=now, ended_at=now, error="boom"),
+        }
+
+        payload = WideEventEmitter.build_pipeline_payload(
+            ctx=create_context(), stage_results=stage_results
+        )
+
+        assert payload["status"] == "failed"
+        assert payload["stage_counts"] == {"completed": 1, "failed": 1}
+        assert [d["data_keys"] for d in payload["stage_details"]] == [["x", "y"], []]
+
+        del stage_results["b"]
+        payload = WideEventEmitter.build_pipeline_payload(
+            ctx=create_context(), stage_results=stage_results
+        )
+        assert payload["status"] == "completed"
+
 
 # === Test Error Handling ===
 
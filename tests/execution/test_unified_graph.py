@@ -581,6 +581,132 @@ class TestUnifiedStageGraphExecution:
         # d should be last
         assert execution_order.index("d") == 3
 
+    @pytest.mark.asyncio
+    async def test_duplicate_dependency_entries_schedule_once(self):
+        """Repeated dependency names count once toward a stage's in-degree."""
+        execution_order = []
+
+        async def make_runner(name: str):
+            async def runner(_ctx: StageContext) -> StageOutput:
+                execution_order.append(name)
+                return StageOutput.ok(data={"stage": name})
+            return runner
+
+        specs = [
+            UnifiedStageSpec(name="a", runner=await make_runner("a"), kind=StageKind.TRANSFORM),
+            UnifiedStageSpec(name="b", runner=await make_runner("b"), dependencies=("a", "a"), kind=StageKind.TRANSFORM),
+            UnifiedStageSpec(name="c", runner=await make_runner("c"), dependencies=("a", "b"), kind=StageKind.TRANSFORM),
+        ]
+        graph = UnifiedStageGraph(specs=specs)
+
+        await graph.run(create_context())
+
+        assert execution_order == ["a", "b", "c"]
+
+    @pytest.mark.asyncio
+    async def test_graph_reruns_with_fresh_scheduling_state(self):
+        """Running a graph does not consume its precomputed in-degree map."""
+        execution_order = []
+
+        async def make_runner(name: str):
+            async def runner(_ctx: StageContext) -> StageOutput:
+                execution_order.append(name)
+                return StageOutput.ok(data={"stage": name})
+            return runner
+
+        specs = [
+            UnifiedStageSpec(name="a", runner=await make_runner("a"), kind=StageKind.TRANSFORM),
+            UnifiedStageSpec(name="b", runner=await make_runner("b"), dependencies=("a",), kind=StageKind.TRANSFORM),
+        ]
+        graph = UnifiedStageGraph(specs=specs)
+
+        await graph.run(create_context())
+        await graph.run(create_context())
+
+        assert execution_order == ["a", "b", "a", "b"]
+        assert graph._in_degree == {"a": 0, "b": 1}
+
+    @pytest.mark.asyncio
+    async def test_stages_share_one_snapshot_per_run(self):
+        """Every stage's context and inputs reference the run's snapshot, not a rebuilt copy."""
+        seen = []
+
+        async def runner(ctx: StageContext) -> StageOutput:
+            seen.append((ctx.snapshot, ctx.inputs.snapshot))
+            return StageOutput.ok()
+
+        specs = [
+            UnifiedStageSpec(name="a", runner=runner, kind=StageKind.TRANSFORM),
+            UnifiedStageSpec(name="b", runner=runner, dependencies=("a",), kind=StageKind.TRANSFORM),
+            UnifiedStageSpec(name="c", runner=runner, dependencies=("a",), kind=StageKind.TRANSFORM),
+        ]
+        graph = UnifiedStageGraph(specs=specs)
+
+        await graph.run(create_pipeline_context())
+
+        snapshot = seen[0][0]
+        assert len(seen) == 3
+        assert all(ctx_snap is snapshot and inputs_snap is snapshot for ctx_snap, inputs_snap in seen)
+
+    @pytest.mark.asyncio
+    async def test_ready_stages_start_in_critical_path_order(self):
+        """Stages with more downstream work start first when ready together."""
+        execution_order = []
+
+        async def make_runner(name: str):
+            async def runner(_ctx: StageContext) -> StageOutput:
+                execution_order.append(name)
+                return StageOutput.ok(data={"stage": name})
+            return runner
+
+        specs = [
+            UnifiedStageSpec(name="leaf", runner=await make_runner("leaf"), kind=StageKind.TRANSFORM),
+            UnifiedStageSpec(name="root", runner=await make_runner("root"), kind=StageKind.TRANSFORM),
+            UnifiedStageSpec(name="side", runner=await make_runner("side"), dependencies=("root",), kind=StageKind.TRANSFORM),
+            UnifiedStageSpec(name="mid", runner=await make_runner("mid"), dependencies=("root",), kind=StageKind.TRANSFORM),
+            UnifiedStageSpec(name="tail", runner=await make_runner("tail"), dependencies=("mid",), kind=StageKind.TRANSFORM),
+        ]
+        graph = UnifiedStageGraph(specs=specs)
+
+        await graph.run(create_context())
+
+        assert execution_order[:2] == ["root", "leaf"]
+        assert execution_order.index("mid") < execution_order.index("side")
+
+    @pytest.mark.asyncio
+    async def test_ready_stage_dispatched_before_slow_sibling_finishes(self):
+        """A dependent stage starts as soon as its own dependencies finish."""
+        slow_release = asyncio.Event()
+
+        async def slow(_ctx: StageContext) -> StageOutput:
+            await asyncio.wait_for(slow_release.wait(), timeout=1.0)
+            return StageOutput.ok(data={"stage": "slow"})
+
+        async def fast(_ctx: StageContext) -> StageOutput:
+            return StageOutput.ok(data={"stage": "fast"})
+
+        async def downstream(_ctx: StageContext) -> StageOutput:
+            # Only reachable while "slow" is still blocked; releasing it here
+            # proves no wave barrier waits on the slow root.
+            slow_release.set()
+            return StageOutput.ok(data={"stage": "downstream"})
+
+        specs = [
+            UnifiedStageSpec(name="slow", runner=slow, kind=StageKind.TRANSFORM),
+            UnifiedStageSpec(name="fast", runner=fast, kind=StageKind.TRANSFORM),
+            UnifiedStageSpec(
+                name="downstream",
+                runner=downstream,
+                dependencies=("fast",),
+                kind=StageKind.TRANSFORM,
+            ),
+        ]
+        graph = UnifiedStageGraph(specs=specs)
+
+        results = await graph.run(create_context())
+
+        assert set(results) == {"slow", "fast", "downstream"}
+
     @pytest.mark.asyncio
     async def test_run_preserves_stage_kind(self):
         """Test that StageKind is preserved."""
@@ -868,6 +994,21 @@ class TestUnifiedStageGraphErrors:
         assert exc_info.value.stage == "canceler"
         assert "User requested cancel" in exc_info.value.reason
 
+    @pytest.mark.asyncio
+    async def test_cancel_without_reason_uses_default(self):
+        """A CANCEL output without cancel_reason reports the default reason."""
+        async def cancel_runner(_ctx: StageContext) -> StageOutput:
+            return StageOutput(status=StageStatus.CANCEL, data={})
+
+        graph = UnifiedStageGraph(
+            specs=[UnifiedStageSpec(name="canceler", runner=cancel_runner, kind=StageKind.GUARD)]
+        )
+
+        with pytest.raises(UnifiedPipelineCancelled) as exc_info:
+            await graph.run(create_context())
+
+        assert exc_info.value.reason == "Pipeline cancelled"
+
     @pytest.mark.asyncio
     async def test_cancelled_exception_contains_partial_results(self):
         """Test UnifiedPipelineCancelled contains completed stage results."""
@@ -969,6 +1110,49 @@ class TestUnifiedStageGraphErrors:
         # Only one stage should have run
         assert error_raised["count"] == 1
 
+    @pytest.mark.asyncio
+    async def test_failure_cancels_running_siblings(self):
+        """Test that a failing stage cancels siblings still in flight."""
+        sibling_cancelled = asyncio.Event()
+
+        async def error_runner(_ctx: StageContext) -> StageOutput:
+            raise ValueError("Error")
+
+        async def slow_runner(_ctx: StageContext) -> StageOutput:
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                sibling_cancelled.set()
+                raise
+            return StageOutput.ok()
+
+        specs = [
+            UnifiedStageSpec(name="a", runner=error_runner, kind=StageKind.TRANSFORM),
+            UnifiedStageSpec(name="b", runner=slow_runner, kind=StageKind.TRANSFORM),
+        ]
+        graph = UnifiedStageGraph(specs=specs)
+
+        with pytest.raises(UnifiedStageExecutionError) as exc_info:
+            await graph.run(create_pipeline_context())
+
+        assert isinstance(exc_info.value.original, ValueError)
+        assert sibling_cancelled.is_set()
+
+    @pytest.mark.asyncio
+    async def test_stage_raising_cancelled_error_does_not_hang(self):
+        """Test that a stage raising CancelledError propagates instead of stalling."""
+
+        async def cancelling_runner(_ctx: StageContext) -> StageOutput:
+            raise asyncio.CancelledError()
+
+        specs = [
+            UnifiedStageSpec(name="a", runner=cancelling_runner, kind=StageKind.TRANSFORM),
+        ]
+        graph = UnifiedStageGraph(specs=specs)
+
+        with pytest.raises(asyncio.CancelledError):
+            await asyncio.wait_for(graph.run(create_pipeline_context()), timeout=3)
+
 
 # === Test Cancellation ===
 
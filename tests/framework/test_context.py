@@ -10,6 +10,7 @@ from uuid import uuid4
 
 from stageflow.events import NoOpEventSink
 from stageflow.stages.context import (
+    IdBundle,
     PipelineContext,
     extract_service,
 )
@@ -244,6 +245,24 @@ class TestPipelineContext:
         assert root.inputs.ports is not None
         assert root.inputs.ports.db is db
 
+    def test_db_fallback_ports_reused_until_db_changes(self):
+        """Derived contexts share one CorePorts until the legacy db slot changes."""
+        ctx = PipelineContext(
+            pipeline_run_id=uuid4(),
+            request_id=uuid4(),
+            db=object(),
+        )
+
+        first = ctx.derive_root_stage_context().inputs.ports
+        second = ctx.derive_root_stage_context().inputs.ports
+        assert first is second
+
+        new_db = object()
+        ctx.db = new_db
+        third = ctx.derive_root_stage_context().inputs.ports
+        assert third is not first
+        assert third.db is new_db
+
     def test_fork_preserves_ports(self):
         """Child PipelineContext should retain the parent ports bundle."""
         ports = create_core_ports(db=object())
@@ -341,6 +360,23 @@ class TestPipelineContext:
         assert data["stage"] == "test_stage"
         assert data["status"] == "started"
 
+    def test_record_stage_event_reuses_event_type(self):
+        """Repeated stage events share one interned event type string."""
+        ctx = PipelineContext(pipeline_run_id=uuid4())
+        emitted_types = []
+
+        class MockEventSink:
+            def try_emit(self, *, type, data):  # noqa: ARG002
+                emitted_types.append(type)
+
+        ctx.event_sink = MockEventSink()
+
+        ctx.record_stage_event(stage="test_stage", status="completed")
+        ctx.record_stage_event(stage="test_stage", status="completed")
+
+        assert emitted_types == ["stage.test_stage.completed"] * 2
+        assert emitted_types[0] is emitted_types[1]
+
     def test_record_stage_event_with_payload(self):
         """Test record_stage_event with payload."""
         ctx = PipelineContext(
@@ -603,6 +639,30 @@ class TestPipelineContext:
 
         assert result["service"] == "custom"
 
+    def test_to_dict_reflects_reassigned_ids(self):
+        """Test cached identifier rendering is invalidated when IDs change."""
+        ctx = PipelineContext(request_id=uuid4())
+        first = ctx.to_dict()
+
+        new_request_id = uuid4()
+        ctx.request_id = new_request_id
+        second = ctx.to_dict()
+
+        assert first["request_id"] != second["request_id"]
+        assert second["request_id"] == str(new_request_id)
+
+    def test_id_bundle(self):
+        """Test id_bundle exposes the correlation identifiers."""
+        run_id = uuid4()
+        org_id = uuid4()
+        ctx = PipelineContext(pipeline_run_id=run_id, org_id=org_id)
+
+        bundle = ctx.id_bundle
+
+        assert bundle == IdBundle(run_id, None, None, None, org_id)
+        assert bundle.as_dict()["org_id"] == str(org_id)
+        assert bundle.as_dict()["user_id"] is None
+
     # === now() classmethod tests ===
 
     def test_now_returns_datetime(self):
@@ -153,6 +153,14 @@ class TestStageInputsIntegration:
         with pytest.raises(TypeError, match="StageInputs key must be provided"):
             inputs.require_from("llm_stage", None)
 
+        # str subclasses are still accepted as keys
+        class Key(str):
+            pass
+
+        assert inputs.get_from("llm_stage", Key("model")) == "gpt-4"
+        with pytest.raises(ValueError, match="StageInputs key cannot be empty"):
+            inputs.get(Key(""))
+
     def test_error_messages_are_helpful_for_debugging(self):
         """Test that error messages provide helpful debugging information."""
         prior_outputs = {
@@ -168,6 +168,17 @@ class TestBackpressureMonitor:
 
         assert monitor.is_overloaded
 
+    def test_latency_window_keeps_most_recent_samples(self):
+        """Only the newest 1000 latency samples feed the p95 estimate."""
+        monitor = BackpressureMonitor()
+
+        for latency in range(1500):
+            monitor.release(latency_ms=float(latency))
+
+        assert len(monitor._latencies) == 1000
+        assert monitor._latencies[0] == 500.0
+        assert monitor.get_metrics()["p95_latency_ms"] == 1450.0
+
     def test_metrics(self):
         """Test metrics reporting."""
         monitor = BackpressureMonitor()
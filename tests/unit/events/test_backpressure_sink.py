@@ -170,6 +170,30 @@ class TestBackpressureAwareEventSink:
         # All events should have been processed
         assert len(events_received) == 5
 
+    @pytest.mark.asyncio
+    async def test_drain_forwards_events_already_taken_by_worker(self):
+        """stop(drain=True) waits for the batch the worker already dequeued."""
+        events_received: list[str] = []
+
+        class YieldingSink:
+            async def emit(self, *, type: str, data: dict[str, Any] | None) -> None:  # noqa: ARG002
+                await asyncio.sleep(0)
+                events_received.append(type)
+
+        sink = BackpressureAwareEventSink(YieldingSink(), max_queue_size=100)
+        await sink.start()
+        for i in range(10):
+            sink.try_emit(type=f"event.{i}", data=None)
+
+        # Let the worker move the whole burst into its batch before stopping.
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        assert sink.queue_size == 0
+
+        await sink.stop(drain=True, timeout=5.0)
+
+        assert events_received == [f"event.{i}" for i in range(10)]
+
     @pytest.mark.asyncio
     async def test_queue_size_property(self):
         """queue_size returns current queue size."""
@@ -226,6 +250,23 @@ class TestBackpressureAwareEventSink:
 
         await sink.stop()
 
+    @pytest.mark.asyncio
+    async def test_try_emit_starts_single_worker(self):
+        """try_emit() starts one worker synchronously, even across a burst."""
+        downstream = AsyncMock()
+        sink = BackpressureAwareEventSink(downstream, max_queue_size=100)
+
+        for i in range(20):
+            assert sink.try_emit(type="burst", data={"i": i}) is True
+        worker = sink._worker_task
+        assert sink.is_running is True
+        assert worker is not None
+
+        await sink.stop(drain=True, timeout=1.0)
+
+        assert downstream.emit.await_count == 20
+        assert worker.done()
+
     @pytest.mark.asyncio
     async def test_downstream_error_handling(self):
         """Errors from downstream are logged but don't crash worker."""
@@ -250,6 +291,32 @@ class TestBackpressureAwareEventSink:
         finally:
             await sink.stop()
 
+    @pytest.mark.asyncio
+    async def test_burst_forwarded_in_order_despite_errors(self):
+        """Queued bursts are forwarded in order and one failure doesn't drop the rest."""
+        received: list[str] = []
+
+        class FlakySink:
+            async def emit(self, *, type: str, data: dict[str, Any] | None) -> None:  # noqa: ARG002
+                received.append(type)
+                if type == "event.2":
+                    raise RuntimeError("boom")
+
+            def try_emit(self, *, type: str, data: dict[str, Any] | None) -> None:  # noqa: ARG002
+                pass
+
+        sink = BackpressureAwareEventSink(FlakySink(), max_queue_size=10)
+        await sink.start()
+        try:
+            for i in range(5):
+                sink.try_emit(type=f"event.{i}", data=None)
+            await asyncio.wait_for(sink._queue.join(), timeout=1.0)
+
+            assert received == [f"event.{i}" for i in range(5)]
+            assert sink.queue_size == 0
+        finally:
+            await sink.stop()
+
     @pytest.mark.asyncio
     async def test_high_throughput_stress(self):
         """Sink handles high event throughput without crashing."""
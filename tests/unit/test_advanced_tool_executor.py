@@ -1,5 +1,6 @@
 """Tests for AdvancedToolExecutor with ExecutionContext."""
 
+import asyncio
 from dataclasses import dataclass
 from typing import Any
 from uuid import UUID, uuid4
@@ -9,7 +10,7 @@ import pytest
 from stageflow.context import ContextSnapshot, RunIdentity
 from stageflow.core import StageContext
 from stageflow.core.timer import PipelineTimer
-from stageflow.events import NoOpEventSink
+from stageflow.events import NoOpEventSink, clear_event_sink, set_event_sink
 from stageflow.stages.context import PipelineContext
 from stageflow.stages.inputs import StageInputs
 from stageflow.tools import (
@@ -21,6 +22,7 @@ from stageflow.tools import (
     ToolInput,
     ToolNotFoundError,
     ToolOutput,
+    UndoStore,
 )
 
 
@@ -342,6 +344,59 @@ class TestAdvancedToolExecutorErrors:
         assert result.success
 
 
+class TestAdvancedToolExecutorUndo:
+    """Test undo side effects in AdvancedToolExecutor."""
+
+    @pytest.mark.asyncio
+    async def test_completion_event_and_undo_store_run_concurrently(self):
+        """Undo metadata storage should not wait for the completion event."""
+        stored = asyncio.Event()
+        events: list[str] = []
+
+        class BlockingSink:
+            async def emit(self, *, type: str, data: dict[str, Any] | None) -> None:  # noqa: ARG002
+                events.append(type)
+                if type == "tool.completed":
+                    try:
+                        await asyncio.wait_for(stored.wait(), timeout=1.0)
+                    except TimeoutError:
+                        events.append("timeout")
+
+            def try_emit(self, *, type: str, data: dict[str, Any] | None) -> None:  # noqa: ARG002
+                events.append(type)
+
+        class SignallingUndoStore(UndoStore):
+            async def store(self, **kwargs: Any) -> Any:
+                result = await super().store(**kwargs)
+                stored.set()
+                return result
+
+        async def undoable_handler(_input: ToolInput) -> ToolOutput:
+            return ToolOutput.ok(data={}, undo_metadata={"path": "/tmp/x"})
+
+        undo_store = SignallingUndoStore()
+        executor = AdvancedToolExecutor(undo_store=undo_store)
+        executor.register(ToolDefinition(
+            name="write_file",
+            action_type="WRITE_FILE",
+            handler=undoable_handler,
+            undoable=True,
+        ))
+        action = MockAction(id=uuid4(), type="WRITE_FILE", payload={})
+        context = _make_stage_context(_make_snapshot(pipeline_run_id=uuid4()))
+
+        set_event_sink(BlockingSink())
+        try:
+            result = await executor.execute(action, context)
+        finally:
+            clear_event_sink()
+
+        assert result.success
+        assert "tool.completed" in events
+        assert "timeout" not in events
+        assert len(await undo_store.get_all()) == 1
+
+
 class TestToolInputFromAction:
     """Test ToolInput.from_action with different context types."""
 
@@ -246,6 +246,16 @@ class TestStageOutput:
         assert tagged.data == original.data
         assert tagged.status == original.status
 
+    def test_with_version_preserves_duration(self):
+        """with_version should keep every other field, including duration."""
+        original = StageOutput.fail(error="boom").with_duration(42)
+        tagged = original.with_version("v2")
+
+        assert tagged.duration_ms == 42
+        assert tagged.error == "boom"
+        assert tagged.status == StageStatus.FAIL
+        assert tagged.version == "v2"
+
     # === Duration tracking tests ===
 
     def test_duration_ms_default_none(self):
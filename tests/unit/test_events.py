@@ -16,6 +16,7 @@ from stageflow.events import (
     NoOpEventSink,
     clear_event_sink,
     get_event_sink,
+    reset_event_sink,
     set_event_sink,
     wait_for_event_sink_tasks,
 )
@@ -235,6 +236,19 @@ class TestEventSinkContextVariable:
         # Verify in current context
         assert get_event_sink() is sink1
 
+    def test_reset_restores_previous_sink(self):
+        """Test that reset_event_sink restores the sink active before set."""
+        outer = NoOpEventSink()
+        inner = LoggingEventSink()
+
+        set_event_sink(outer)
+        token = set_event_sink(inner)
+        assert get_event_sink() is inner
+
+        reset_event_sink(token)
+        assert get_event_sink() is outer
+        clear_event_sink()
+
     def test_event_sink_inheritance(self):
         """Test that event sink is inherited in new tasks."""
         set_event_sink(NoOpEventSink())
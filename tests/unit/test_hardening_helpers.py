@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import asyncio
-from uuid import uuid4
+from uuid import RFC_4122, uuid4
 
 import pytest
 
@@ -14,6 +14,7 @@ from stageflow.helpers.run_utils import PipelineRunner
 from stageflow.helpers.uuid_utils import (
     ClockSkewDetector,
     UuidCollisionMonitor,
+    generate_uuid4,
     generate_uuid7,
 )
 from stageflow.pipeline import Pipeline
@@ -32,6 +33,11 @@ class TestUuidHardening:
         uid = generate_uuid7()
         assert isinstance(uid, uuid4().__class__)
 
+    def test_generate_uuid4_is_random_v4(self):
+        uids = [generate_uuid4() for _ in range(600)]
+        assert all(uid.version == 4 and uid.variant == RFC_4122 for uid in uids)
+        assert len(set(uids)) == len(uids)
+
     def test_collision_monitor_basic(self):
         monitor = UuidCollisionMonitor(ttl_seconds=1, category="test")
         uid = uuid4()
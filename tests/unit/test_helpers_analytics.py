@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import json
 import tempfile
+from datetime import UTC, datetime
 from pathlib import Path
 from uuid import uuid4
 
@@ -107,6 +108,9 @@ class TestJSONFileExporter:
                 lines = f.readlines()
 
             assert len(lines) == 5
+            assert [json.loads(line)["event_type"] for line in lines] == [
+                f"event.{i}" for i in range(5)
+            ]
             assert exporter.event_count == 5
         finally:
             Path(path).unlink(missing_ok=True)
@@ -141,6 +145,40 @@ class TestConsoleExporter:
 
         assert exporter.event_count == 2
 
+    @pytest.mark.asyncio
+    async def test_export_batch_matches_single_exports(self, capsys):
+        """A batch prints the same output as exporting each event in turn."""
+        events = [
+            AnalyticsEvent(event_type="stage.started", stage_name="a"),
+            AnalyticsEvent(event_type="stage.completed", stage_name="a", duration_ms=1.5),
+        ]
+        exporter = ConsoleExporter(colorize=False)
+        for event in events:
+            await exporter.export(event)
+        expected = capsys.readouterr().out
+
+        batch_exporter = ConsoleExporter(colorize=False)
+        await batch_exporter.export_batch(events)
+        await batch_exporter.export_batch([])
+
+        assert capsys.readouterr().out == expected
+        assert batch_exporter.event_count == 2
+
+    def test_colorized_header_uses_type_color(self):
+        """Header color follows the event type and wraps only the header line."""
+        exporter = ConsoleExporter(colorize=True)
+        ts = datetime(2024, 1, 1, 12, 30, 45, 123456, tzinfo=UTC)
+
+        failed = exporter._format_event(
+            AnalyticsEvent(event_type="stage.failed", stage_name="a", timestamp=ts)
+        )
+        started = exporter._format_event(AnalyticsEvent(event_type="stage.started", timestamp=ts))
+        other = exporter._format_event(AnalyticsEvent(event_type="custom", timestamp=ts))
+
+        assert failed == "\033[91m[12:30:45.123] stage.failed\033[0m\n  stage: a"
+        assert started == "\033[94m[12:30:45.123] stage.started\033[0m"
+        assert other == "\033[96m[12:30:45.123] custom\033[0m"
+
 
 class TestBufferedExporter:
     """Tests for BufferedExporter."""
@@ -380,6 +418,61 @@ class TestAnalyticsSink:
 
         assert len(exporter.events) == 1
 
+    def test_patterns_match_as_literal_substrings(self):
+        """Include/exclude patterns are literal substrings, with excludes winning."""
+        sink = AnalyticsSink(
+            ConsoleExporter(),
+            include_patterns=["stage.", "tool[1]"],
+            exclude_patterns=["*.debug"],
+        )
+
+        assert sink._should_export("stage.llm.completed")
+        assert sink._should_export("call.tool[1].done")
+        assert not sink._should_export("call.tool1.done")
+        assert not sink._should_export("pipeline.started")
+        assert not sink._should_export("stage.*.debug")
+        assert sink._should_export("stage.x.debug")
+
+    @pytest.mark.asyncio
+    async def test_try_emit_drains_in_order_through_one_task(self):
+        """try_emit() queues events for a single drainer that batches them."""
+
+        class TrackingExporter:
+            def __init__(self):
+                self.batches = []
+                self.closed = False
+
+            async def export(self, event):
+                self.batches.append([event])
+
+            async def export_batch(self, events):
+                self.batches.append(list(events))
+
+            async def flush(self):
+                pass
+
+            async def close(self):
+                self.closed = True
+
+        exporter = TrackingExporter()
+        sink = AnalyticsSink(exporter, max_pending=3)
+
+        for i in range(5):
+            sink.try_emit(type=f"stage.e{i}", data={"stage": "s"})
+        drainer = sink._drain_task
+
+        await sink.close()
+
+        assert [e.event_type for batch in exporter.batches for e in batch] == [
+            "stage.e0",
+            "stage.e1",
+            "stage.e2",
+        ]
+        assert len(exporter.batches) == 1
+        assert sink.dropped_count == 2
+        assert drainer is not None and drainer.done()
+        assert exporter.closed is True
+
 
 class TestBufferedExporterOverflow:
     """Tests for BufferedExporter overflow callback functionality."""
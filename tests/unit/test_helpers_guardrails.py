@@ -9,6 +9,7 @@ from stageflow.helpers.guardrails import (
     ContentFilter,
     ContentLengthCheck,
     GuardrailConfig,
+    GuardrailResult,
     GuardrailStage,
     InjectionDetector,
     PIIDetector,
@@ -121,6 +122,15 @@ class TestContentFilter:
         assert not result.passed
         assert any(v.type == ViolationType.PROFANITY for v in result.violations)
 
+    def test_profanity_matches_whole_words_case_insensitively(self):
+        """Should report each whole-word match once, lowercased."""
+        filter = ContentFilter(profanity_list={"darn", "heck"})
+
+        result = filter.check("DARN it, darn it! Heckle the hecking heck.")
+
+        assert [v.metadata["word"] for v in result.violations] == ["darn", "heck"]
+        assert filter.check("Darnedest heckler").passed
+
 
 class TestInjectionDetector:
     """Tests for InjectionDetector."""
@@ -168,6 +178,16 @@ class TestInjectionDetector:
 
         assert not result.passed
 
+    def test_custom_pattern_with_backreference(self):
+        """Patterns that cannot share one alternation are still checked individually."""
+        detector = InjectionDetector(additional_patterns=[r"(repeat)\s+\1"])
+
+        assert detector._any_pattern is None
+        assert detector.check("hello there").passed
+        result = detector.check("please repeat repeat this")
+        assert not result.passed
+        assert result.violations[0].metadata["matched_pattern"] == r"(repeat)\s+\1"
+
     def test_detects_trust_building_pattern(self):
         """Should detect social engineering trust-building attempts."""
         detector = InjectionDetector()
@@ -287,6 +307,30 @@ class TestGuardrailStage:
         assert "transformed_content" in result.data
         assert "test@example.com" not in result.data["transformed_content"]
 
+    @pytest.mark.asyncio
+    async def test_each_check_gets_fresh_context(self):
+        """Checks should see the snapshot identity without sharing one mutable dict."""
+        seen: list[dict[str, object]] = []
+
+        class MutatingCheck:
+            def check(self, content, context=None):
+                seen.append(dict(context))
+                context["user_id"] = "tampered"
+                return GuardrailResult(passed=True, transformed_content=content)
+
+        snapshot = create_test_snapshot(input_text="Hello world")
+        stage = GuardrailStage(checks=[MutatingCheck(), MutatingCheck()])
+        ctx = create_test_stage_context(snapshot=snapshot)
+
+        result = await stage.execute(ctx)
+
+        assert result.status == StageStatus.OK
+        expected = {
+            "user_id": str(snapshot.user_id) if snapshot.user_id else None,
+            "session_id": str(snapshot.session_id) if snapshot.session_id else None,
+        }
+        assert seen == [expected, expected]
+
     @pytest.mark.asyncio
     async def test_skips_without_content(self):
         """Should skip if no content to check."""
@@ -0,0 +1,164 @@
+"""Tests for the LLM response caching helper."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from stageflow.helpers.llm_cache import CachingLLMClient
+
+
+class _CountingClient:
+    """Chat client that records calls and can be gated or made to fail."""
+
+    def __init__(self, *, fail: bool = False) -> None:
+        self.calls = 0
+        self.fail = fail
+        self.gate: asyncio.Event | None = None
+
+    async def chat(self, *, messages, model, **kwargs):  # noqa: ARG002
+        self.calls += 1
+        if self.gate is not None:
+            await self.gate.wait()
+        if self.fail:
+            raise RuntimeError("provider down")
+        return {"content": f"reply {self.calls}", "model": model}
+
+
+MESSAGES = [{"role": "user", "content": "hi"}]
+
+
+class TestCachingLLMClient:
+    """Tests for CachingLLMClient."""
+
+    @pytest.mark.asyncio
+    async def test_identical_request_is_served_from_cache(self):
+        inner = _CountingClient()
+        client = CachingLLMClient(inner)
+
+        first = await client.chat(messages=MESSAGES, model="m", temperature=0.0)
+        second = await client.chat(messages=list(MESSAGES), model="m", temperature=0.0)
+
+        assert first is second
+        assert inner.calls == 1
+        assert (client.hits, client.misses) == (1, 1)
+
+    @pytest.mark.asyncio
+    async def test_key_includes_model_messages_and_kwargs(self):
+        inner = _CountingClient()
+        client = CachingLLMClient(inner)
+
+        await client.chat(messages=MESSAGES, model="a")
+        await client.chat(messages=MESSAGES, model="b")
+        await client.chat(messages=[{"role": "user", "content": "bye"}], model="a")
+        await client.chat(messages=MESSAGES, model="a", max_tokens=10)
+
+        assert inner.calls == 4
+
+    @pytest.mark.asyncio
+    async def test_positive_temperature_bypasses_cache(self):
+        inner = _CountingClient()
+        client = CachingLLMClient(inner)
+
+        await client.chat(messages=MESSAGES, model="m", temperature=0.7)
+        await client.chat(messages=MESSAGES, model="m", temperature=0.7)
+        assert inner.calls == 2
+
+        opted_in = CachingLLMClient(_CountingClient(), cache_nondeterministic=True)
+        await opted_in.chat(messages=MESSAGES, model="m", temperature=0.7)
+        await opted_in.chat(messages=MESSAGES, model="m", temperature=0.7)
+        assert opted_in.hits == 1
+
+    @pytest.mark.asyncio
+    async def test_concurrent_identical_requests_share_one_call(self):
+        inner = _CountingClient()
+        inner.gate = asyncio.Event()
+        client = CachingLLMClient(inner)
+
+        tasks = [asyncio.create_task(client.chat(messages=MESSAGES, model="m")) for _ in range(5)]
+        await asyncio.sleep(0)
+        inner.gate.set()
+        results = await asyncio.gather(*tasks)
+
+        assert inner.calls == 1
+        assert all(result is results[0] for result in results)
+
+    @pytest.mark.asyncio
+    async def test_failures_are_not_cached(self):
+        inner = _CountingClient(fail=True)
+        inner.gate = asyncio.Event()
+        client = CachingLLMClient(inner)
+
+        tasks = [asyncio.create_task(client.chat(messages=MESSAGES, model="m")) for _ in range(2)]
+        await asyncio.sleep(0)
+        inner.gate.set()
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        assert all(isinstance(result, RuntimeError) for result in results)
+        assert inner.calls == 1
+
+        inner.fail = False
+        inner.gate = None
+        response = await client.chat(messages=MESSAGES, model="m")
+        assert response["content"] == "reply 2"
+
+    @pytest.mark.asyncio
+    async def test_least_recently_used_entry_is_evicted(self):
+        inner = _CountingClient()
+        client = CachingLLMClient(inner, maxsize=2)
+
+        await client.chat(messages=MESSAGES, model="a")
+        await client.chat(messages=MESSAGES, model="b")
+        await client.chat(messages=MESSAGES, model="a")
+        await client.chat(messages=MESSAGES, model="c")
+        await client.chat(messages=MESSAGES, model="a")
+        await client.chat(messages=MESSAGES, model="b")
+
+        assert inner.calls == 4
+
+    @pytest.mark.asyncio
+    async def test_unhashable_arguments_skip_cache(self):
+        inner = _CountingClient()
+        client = CachingLLMClient(inner)
+
+        await client.chat(messages=MESSAGES, model="m", tools=[object()])
+        await client.chat(messages=MESSAGES, model="m", tools=[object()])
+
+        assert inner.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_cancelling_first_caller_does_not_cancel_waiters(self):
+        inner = _CountingClient()
+        inner.gate = asyncio.Event()
+        client = CachingLLMClient(inner)
+
+        first = asyncio.create_task(client.chat(messages=MESSAGES, model="m"))
+        second = asyncio.create_task(client.chat(messages=MESSAGES, model="m"))
+        await asyncio.sleep(0)
+        first.cancel()
+        await asyncio.sleep(0)
+        inner.gate.set()
+
+        assert (await second)["content"] == "reply 1"
+        assert first.cancelled()
+        assert inner.calls == 1
+        await client.chat(messages=MESSAGES, model="m")
+        assert inner.calls == 1
+
+    def test_unknown_attributes_are_forwarded(self):
+        inner = _CountingClient()
+        client = CachingLLMClient(inner)
+
+        assert client.calls == 0
+        with pytest.raises(AttributeError):
+            _ = client._missing
+
+    def test_private_lookup_before_init_does_not_recurse(self):
+        bare = CachingLLMClient.__new__(CachingLLMClient)
+
+        with pytest.raises(AttributeError):
+            _ = bare.chat_model
+
+    def test_rejects_non_positive_maxsize(self):
+        with pytest.raises(ValueError):
+            CachingLLMClient(_CountingClient(), maxsize=0)
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from uuid import uuid4
 
 import pytest
@@ -152,6 +154,31 @@ class TestInMemoryStore:
         assert result_b[0].content == "B"
 
 
+    def test_shared_across_event_loops_in_threads(self):
+        """One store should serve pipelines running on separate threads/loops."""
+        store = InMemoryStore()
+        session_id = uuid4()
+
+        async def write_batch(worker: int) -> None:
+            for i in range(50):
+                await store.write(
+                    MemoryEntry(
+                        id=f"{worker}-{i}",
+                        session_id=session_id,
+                        role="user",
+                        content=f"{worker}:{i}",
+                    )
+                )
+                await asyncio.sleep(0)
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            list(pool.map(lambda worker: asyncio.run(write_batch(worker)), range(4)))
+
+        result = asyncio.run(store.fetch(session_id, MemoryConfig(max_entries=0, max_tokens=0)))
+        assert len(result) == 200
+        assert store.get_all_sessions() == [session_id]
+
+
 class TestMemoryFetchStage:
     """Tests for MemoryFetchStage."""
 
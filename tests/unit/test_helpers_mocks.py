@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
+import asyncio
 from datetime import UTC, datetime, timedelta
 
 import pytest
 
+from stageflow.helpers import mocks
 from stageflow.helpers.mocks import (
     MockAuthProvider,
     MockJWTClaims,
@@ -16,6 +18,12 @@ from stageflow.helpers.mocks import (
 )
 
 
+@pytest.fixture(autouse=True)
+def _real_mock_delays(monkeypatch):
+    """Keep simulated delays real so timing assertions hold under STAGEFLOW_FAST_MOCKS=1."""
+    monkeypatch.setattr(mocks, "_FAST_MOCKS", False)
+
+
 class TestMockLLMProvider:
     """Tests for MockLLMProvider."""
 
@@ -72,6 +80,22 @@ class TestMockLLMProvider:
 
         assert elapsed >= 90  # Some tolerance
 
+    @pytest.mark.asyncio
+    async def test_fast_mocks_skip_simulated_latency(self, monkeypatch):
+        """Fast mode should only yield to the event loop instead of sleeping."""
+        monkeypatch.setattr(mocks, "_FAST_MOCKS", True)
+        llm = MockLLMProvider(responses=["Hello world"], latency_ms=5000, chunk_delay_ms=5000)
+        stt = MockSTTProvider(latency_ms=5000)
+        tools = MockToolExecutor(latency_ms=5000)
+
+        async def exercise():
+            await llm.complete("test")
+            _ = [chunk async for chunk in llm.stream("test")]
+            await stt.transcribe(b"audio")
+            await tools.execute("lookup", {})
+
+        await asyncio.wait_for(exercise(), timeout=2)
+
     @pytest.mark.asyncio
     async def test_streaming(self):
         """Should stream response in chunks."""
@@ -83,6 +107,18 @@ class TestMockLLMProvider:
 
         assert "".join(chunks) == "Hello world"
 
+    @pytest.mark.asyncio
+    async def test_streaming_chunk_delay_is_opt_in(self):
+        """Chunk delay only applies when configured."""
+        llm = MockLLMProvider(responses=["Hello world"], chunk_delay_ms=40)
+
+        start = datetime.now(UTC)
+        chunks = [chunk async for chunk in llm.stream("test", chunk_size=5)]
+        elapsed = (datetime.now(UTC) - start).total_seconds() * 1000
+
+        assert chunks == ["Hello", " worl", "d"]
+        assert elapsed >= 100  # Three chunks, some tolerance
+
     @pytest.mark.asyncio
     async def test_tracks_call_history(self):
         """Should track call history."""
@@ -2,12 +2,27 @@
 
 from __future__ import annotations
 
+import json
+import logging
+import re
+from datetime import UTC, datetime
 from uuid import uuid4
 
 import pytest
 
-from stageflow import Pipeline, PipelineContext, StageContext, StageKind, StageOutput
+from stageflow import (
+    LoggingEventSink,
+    Pipeline,
+    PipelineContext,
+    StageContext,
+    StageKind,
+    StageOutput,
+    clear_event_sink,
+    get_event_sink,
+    set_event_sink,
+)
 from stageflow.helpers.run_utils import (
+    JsonLogFormatter,
     ObservableEventSink,
     PipelineRunner,
     RunResult,
@@ -62,6 +77,91 @@ class TestObservableEventSink:
         assert "elapsed_ms" in sink.events[0]
         assert sink.events[0]["elapsed_ms"] >= 0
 
+    def test_timestamps_follow_elapsed_time(self):
+        """Timestamps are ISO UTC strings offset from the sink start by elapsed_ms."""
+        before = datetime.now(UTC)
+        sink = ObservableEventSink(verbose=False)
+        for i in range(3):
+            sink.try_emit(type=f"event.{i}", data=None)
+        after = datetime.now(UTC)
+
+        first, *_, last = sink.events
+        assert isinstance(first["timestamp"], str)
+        assert first["timestamp"].endswith("+00:00")
+        first_at = datetime.fromisoformat(first["timestamp"])
+        last_at = datetime.fromisoformat(last["timestamp"])
+        assert before <= first_at <= last_at <= after
+        offset = (last_at - first_at).total_seconds() * 1000
+        assert offset == pytest.approx(last["elapsed_ms"] - first["elapsed_ms"], abs=0.01)
+        json.dumps(list(sink.events))
+
+    def test_elapsed_is_monotonic_and_quiet_sink_skips_work(self, capsys):
+        """Elapsed times never go backwards; a non-capturing quiet sink records nothing."""
+        sink = ObservableEventSink(verbose=False, capture=True)
+        for i in range(5):
+            sink.try_emit(type=f"event.{i}", data=None)
+        elapsed = [event["elapsed_ms"] for event in sink.events]
+        assert elapsed == sorted(elapsed)
+
+        quiet = ObservableEventSink(verbose=False, capture=False)
+        quiet.try_emit(type="event", data={})
+        assert not quiet.events
+        assert capsys.readouterr().out == ""
+
+    def test_verbose_output_matches_with_and_without_capture(self, capsys):
+        """Printing without capture produces the same lines as capturing sinks."""
+        outputs = []
+        for capture in (True, False):
+            sink = ObservableEventSink(verbose=True, colorize=False, capture=capture)
+            sink.try_emit(type="stage.llm.failed", data={"stage": "llm", "error": "x" * 100})
+            sink.try_emit(type="stage.llm.skipped", data=None)
+            outputs.append(re.sub(r"\[\s*[\d.]+ms\]", "[t]", capsys.readouterr().out))
+
+        assert outputs[0] == outputs[1]
+        assert "stage: llm" in outputs[1]
+        assert "error: " + "x" * 80 + "..." in outputs[1]
+
+    def test_colorized_header_follows_event_type(self, capsys):
+        """Header color is chosen from substrings of the event type."""
+        sink = ObservableEventSink(verbose=True, colorize=True, capture=False)
+
+        for event_type in ("stage.llm.failed", "tool.invoked", "stage.x.skipped", "custom"):
+            sink.try_emit(type=event_type, data=None)
+        lines = capsys.readouterr().out.splitlines()
+
+        colors = [line[: line.index("m[") + 1] for line in lines]
+        assert colors == ["\033[91m", "\033[93m", "\033[90m", "\033[96m"]
+        assert all(line.endswith("\033[0m") for line in lines)
+        assert lines[1].endswith("ms] tool.invoked\033[0m")
+
+    def test_max_events_keeps_most_recent(self, capsys, caplog):
+        """Captured events are capped, dropping the oldest first."""
+        sink = ObservableEventSink(verbose=False, max_events=3)
+
+        with caplog.at_level(logging.WARNING, logger="stageflow.helpers.run_utils"):
+            for i in range(5):
+                sink.try_emit(type=f"event.{i}", data={})
+
+        assert [e["type"] for e in sink.events] == ["event.2", "event.3", "event.4"]
+        assert sink.dropped_count == 2
+        assert len(caplog.records) == 1
+        sink.print_summary()
+        assert "Total events: 3" in capsys.readouterr().out
+
+        sink.clear()
+        assert sink.dropped_count == 0
+
+    def test_events_are_uncapped_by_default(self):
+        """Without max_events every captured event is kept."""
+        sink = ObservableEventSink(verbose=False)
+
+        for i in range(5):
+            sink.try_emit(type=f"event.{i}", data={})
+
+        assert sink.events.maxlen is None
+        assert len(sink.events) == 5
+        assert sink.dropped_count == 0
+
     def test_clear(self):
         """Should clear captured events."""
         sink = ObservableEventSink(verbose=False)
@@ -178,6 +278,29 @@ class TestPipelineRunner:
         assert snapshot.user_id == user_id
         assert snapshot.org_id == org_id
 
+    def test_create_snapshot_keeps_runner_identity_across_runs(self):
+        """Session and user IDs stay stable per runner; run IDs are fresh."""
+        runner = PipelineRunner(verbose=False)
+
+        first = runner.create_snapshot(input_text="one")
+        second = runner.create_snapshot(input_text="two")
+
+        assert first.session_id == second.session_id
+        assert first.user_id == second.user_id
+        assert first.pipeline_run_id != second.pipeline_run_id
+        assert first.interaction_id != second.interaction_id
+        assert PipelineRunner(verbose=False).create_snapshot().session_id != first.session_id
+
+    def test_runner_identity_can_be_pinned(self):
+        session_id = uuid4()
+        user_id = uuid4()
+        runner = PipelineRunner(verbose=False, session_id=session_id, user_id=user_id)
+
+        snapshot = runner.create_snapshot()
+
+        assert snapshot.session_id == session_id
+        assert snapshot.user_id == user_id
+
     @pytest.mark.asyncio
     async def test_runs_pipeline(self):
         """Should run a pipeline and return results.
@@ -256,6 +379,21 @@ class TestPipelineRunner:
         assert result.pipeline_run_id == pipeline_ctx.pipeline_run_id
         assert result.get_stage_data("test", "message") == "success"
 
+    @pytest.mark.asyncio
+    async def test_restores_caller_event_sink(self):
+        """The runner's sink should only be active for the duration of the run."""
+        runner = PipelineRunner(verbose=False, capture_events=True)
+        pipeline = Pipeline().with_stage("test", MockStage, StageKind.TRANSFORM)
+        caller_sink = LoggingEventSink()
+
+        set_event_sink(caller_sink)
+        try:
+            result = await runner.run(pipeline, input_text="hello")
+            assert result.success is True
+            assert get_event_sink() is caller_sink
+        finally:
+            clear_event_sink()
+
     @pytest.mark.asyncio
     async def test_rejects_snapshot_and_pipeline_context_together(self):
         """Should fail fast when both context entrypoints are provided."""
@@ -287,6 +425,34 @@ class TestSetupLogging:
         # Verify no errors
 
 
+class TestJsonLogFormatter:
+    """Tests for JsonLogFormatter."""
+
+    @staticmethod
+    def _record(**extra: object) -> logging.LogRecord:
+        record = logging.LogRecord(
+            "stageflow.test", logging.INFO, __file__, 1, "ran %s", ("x",), None
+        )
+        for key, value in extra.items():
+            setattr(record, key, value)
+        return record
+
+    def test_formats_json_line(self):
+        stage_id = uuid4()
+        line = JsonLogFormatter().format(self._record(stage=stage_id, duration_ms=12))
+
+        data = json.loads(line)
+        assert data["message"] == "ran x"
+        assert data["level"] == "INFO"
+        assert data["stage"] == str(stage_id)
+        assert data["duration_ms"] == 12
+
+    def test_falls_back_for_values_orjson_rejects(self):
+        line = JsonLogFormatter().format(self._record(event=2**70))
+
+        assert json.loads(line)["event"] == 2**70
+
+
 class TestRunSimplePipeline:
     """Tests for run_simple_pipeline convenience function."""
 
@@ -219,6 +219,13 @@ class TestPortFactories:
         assert ports.llm_provider is llm_mock
         assert ports.send_token is token_cb
 
+    def test_core_and_llm_factories_reject_positional_arguments(self):
+        """Factories only accept keyword arguments, as before they became aliases."""
+        with pytest.raises(TypeError):
+            create_core_ports(object())  # type: ignore[misc]
+        with pytest.raises(TypeError):
+            create_llm_ports(object())  # type: ignore[misc]
+
     def test_create_audio_ports(self):
         """Test create_audio_ports factory."""
         tts_mock = object()
@@ -238,6 +245,21 @@ class TestPortFactories:
         assert ports.send_audio_chunk is audio_cb
         assert ports.audio_data == audio
 
+    def test_create_audio_ports_aliases(self):
+        """Legacy alias names fill in the canonical AudioPorts fields."""
+        tts_mock = object()
+        stt_mock = object()
+        ports = create_audio_ports(tts_client=tts_mock, stt_client=stt_mock)
+        assert ports.tts_provider is tts_mock
+        assert ports.stt_provider is stt_mock
+
+    def test_factories_reject_unknown_ports(self):
+        """Unknown port names raise like the dataclass constructors."""
+        with pytest.raises(TypeError):
+            create_core_ports(database=object())
+        with pytest.raises(TypeError):
+            create_llm_ports(provider=object())
+
 
 # === Test StageInputs ===
 
@@ -270,24 +292,14 @@ class TestStageInputs:
         assert inputs.prior_outputs == prior_outputs
         assert inputs.ports is ports
 
-    def test_frozen_immutable(self):
-        """Test StageInputs is frozen/immutable."""
-        snapshot = _make_snapshot()
-        inputs = StageInputs(snapshot=snapshot)
-        with pytest.raises(FrozenInstanceError):
-            inputs.snapshot = object()
-
     def test_slots_optimization(self):
         """Test StageInputs uses __slots__ for memory efficiency."""
         snapshot = _make_snapshot()
         inputs = StageInputs(snapshot=snapshot)
         assert hasattr(inputs, '__slots__')
-        # Frozen dataclasses with slots prevent attribute addition
-        try:
+        # Slotted dataclasses prevent attribute addition
+        with pytest.raises(AttributeError):
             inputs.new_attribute = "test"
-            raise AssertionError("Should have raised an exception")
-        except (AttributeError, FrozenInstanceError, TypeError):
-            pass  # Expected for frozen dataclass with slots
 
     def test_get(self):
         """Test StageInputs.get method."""
@@ -409,6 +421,15 @@ class TestStageInputsFactory:
         assert inputs.prior_outputs == {}
         assert inputs.ports is None
 
+    def test_create_stage_inputs_shares_empty_deps(self):
+        """Stages without dependencies share one empty declared_deps set."""
+        snapshot = _make_snapshot()
+        first = create_stage_inputs(snapshot=snapshot)
+        second = create_stage_inputs(snapshot=snapshot, declared_deps=[])
+        assert first.declared_deps == frozenset()
+        assert first.declared_deps is second.declared_deps
+        assert StageInputs(snapshot=snapshot).declared_deps is first.declared_deps
+
     def test_create_stage_inputs_with_all(self):
         """Test create_stage_inputs with all arguments."""
         snapshot = _make_snapshot()
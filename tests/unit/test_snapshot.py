@@ -545,6 +545,24 @@ class TestContextSnapshotExtensions:
         assert result["extensions"]["deal_stage"] == "negotiation"
         assert result["extensions_type"] == "SalesExtensions"
 
+    def test_extension_serialization_nested_dataclass(self):
+        """Nested dataclasses without to_dict serialize field by field."""
+
+        @dataclass(frozen=True)
+        class Deal:
+            deal_id: object
+            tags: list[str] = field(default_factory=list)
+
+        @dataclass(frozen=True)
+        class DealExtensions(ExtensionBundle):
+            deal: Deal | None = None
+
+        deal_id = uuid4()
+        ext = DealExtensions(deal=Deal(deal_id=deal_id, tags=["hot"]))
+
+        assert ext.to_dict() == {"deal": {"deal_id": str(deal_id), "tags": ["hot"]}}
+        assert ext.to_dict() == ext.to_dict()
+
     def test_extension_deserialization(self):
         """Test extension bundle deserialization with registry."""
 
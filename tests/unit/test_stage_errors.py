@@ -0,0 +1,77 @@
+"""Tests for stage error handling utilities."""
+
+from __future__ import annotations
+
+import time
+
+import pytest
+
+from stageflow.pipeline.dag import StageExecutionError
+from stageflow.stages.context import PipelineContext
+from stageflow.stages.errors import StageRunner, _is_recoverable_error, create_error_context
+
+
+class HTTPError(Exception):
+    pass
+
+
+@pytest.mark.parametrize(
+    "error",
+    [
+        RuntimeError("Connection refused"),
+        RuntimeError("read TIMEOUT after 30s"),
+        RuntimeError("network unreachable"),
+        RuntimeError("Server disconnected without response"),
+        ConnectionError("boom"),
+        TimeoutError(),
+        HTTPError("502"),
+    ],
+)
+def test_recoverable_errors(error: Exception) -> None:
+    assert _is_recoverable_error(error) is True
+
+
+@pytest.mark.parametrize(
+    "error",
+    [
+        ValueError("invalid payload"),
+        KeyError("missing"),
+        RuntimeError(""),
+    ],
+)
+def test_non_recoverable_errors(error: Exception) -> None:
+    assert _is_recoverable_error(error) is False
+
+
+def test_create_error_context_adds_timestamp() -> None:
+    before = time.time()
+    context = create_error_context(stage="fetch", attempt=2)
+    after = time.time()
+
+    assert before <= context["error_timestamp"] <= after
+    assert context["stage"] == "fetch"
+    assert context["attempt"] == 2
+
+
+@pytest.mark.asyncio
+async def test_stage_runner_wraps_failures() -> None:
+    runner = StageRunner(stage_name="fetch", ctx=PipelineContext.create())
+
+    async def fail() -> None:
+        raise ConnectionError("connection reset")
+
+    with pytest.raises(StageExecutionError) as exc_info:
+        await runner.run(fail)
+
+    assert exc_info.value.stage == "fetch"
+    assert exc_info.value.recoverable is True
+
+
+@pytest.mark.asyncio
+async def test_stage_runner_returns_result() -> None:
+    runner = StageRunner(stage_name="fetch", ctx=PipelineContext.create())
+
+    result = await runner.run(lambda: {"rows": 3})
+
+    assert result.status == "completed"
+    assert result.data == {"rows": 3}
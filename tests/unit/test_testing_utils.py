@@ -0,0 +1,154 @@
+"""Tests for snapshot validation helpers in stageflow.testing."""
+
+from __future__ import annotations
+
+import pytest
+
+from stageflow.context import ContextSnapshot, Message, RunIdentity
+from stageflow.events import LoggingEventSink, NoOpEventSink
+from stageflow.testing import (
+    create_test_pipeline_context,
+    create_test_snapshot,
+    create_test_stage_context,
+    snapshots_from_dicts_strict,
+    validate_snapshot,
+    validate_snapshot_strict,
+)
+
+
+def test_default_ids_are_unique_v4_uuids():
+    snapshots = [create_test_snapshot() for _ in range(300)]
+    ids = [s.pipeline_run_id for s in snapshots] + [s.request_id for s in snapshots]
+    ids.append(create_test_pipeline_context().pipeline_run_id)
+
+    assert len(set(ids)) == len(ids)
+    assert {u.version for u in ids} == {4}
+
+
+def test_test_contexts_default_to_noop_sink():
+    stage_ctx = create_test_stage_context()
+    pipeline_ctx = create_test_pipeline_context()
+
+    assert isinstance(stage_ctx.event_sink, NoOpEventSink)
+    assert isinstance(pipeline_ctx.event_sink, NoOpEventSink)
+
+    sink = LoggingEventSink()
+    assert create_test_stage_context(event_sink=sink).event_sink is sink
+
+
+class TestValidateSnapshot:
+    """Tests for validate_snapshot."""
+
+    def test_valid_snapshot(self):
+        result = validate_snapshot(create_test_snapshot(extensions={}))
+
+        assert result.valid is True
+        assert result.errors == ()
+        assert result.warnings == ()
+
+    def test_required_fields_reported_in_flag_order(self):
+        snapshot = ContextSnapshot(run_id=RunIdentity(), extensions={})
+
+        result = validate_snapshot(
+            snapshot,
+            require_user_id=True,
+            require_org_id=True,
+            require_request_id=True,
+        )
+
+        assert [e.field for e in result.errors] == [
+            "pipeline_run_id",
+            "request_id",
+            "user_id",
+            "org_id",
+        ]
+        assert result.errors[0].message == "pipeline_run_id is required but not set"
+
+    def test_disabled_required_checks_are_skipped(self):
+        snapshot = ContextSnapshot(run_id=RunIdentity(), extensions={})
+
+        result = validate_snapshot(snapshot, require_pipeline_run_id=False)
+
+        assert result.valid is True
+
+    def test_message_errors_and_warnings(self):
+        snapshot = create_test_snapshot(
+            messages=[
+                Message(role="user", content="a"),
+                "bad",
+                Message(role="", content="b"),
+            ],
+            extensions={},
+        )
+
+        result = validate_snapshot(snapshot)
+
+        assert [e.field for e in result.errors] == ["messages[1]"]
+        assert result.errors[0].message == "Expected Message, got str"
+        assert [w.field for w in result.warnings] == ["messages[2].role"]
+
+    def test_strict_promotes_warnings(self):
+        snapshot = create_test_snapshot(
+            messages=[Message(role="", content="b")],
+            topology=None,
+            extensions={},
+        )
+
+        result = validate_snapshot(snapshot, strict=True)
+
+        assert result.valid is False
+        assert [e.field for e in result.errors] == ["messages[0].role", "topology"]
+        assert result.warnings == ()
+
+    def test_validate_snapshot_strict_raises(self):
+        snapshot = ContextSnapshot(run_id=RunIdentity(), extensions={})
+
+        with pytest.raises(ValueError, match="pipeline_run_id is required"):
+            validate_snapshot_strict(snapshot)
+
+    def test_early_exit_skips_later_checks(self):
+        snapshot = ContextSnapshot(
+            run_id=RunIdentity(),
+            conversation=None,
+            topology=None,
+            execution_mode="x",
+            extensions=None,
+        )
+
+        full = validate_snapshot(snapshot)
+        short = validate_snapshot(snapshot, early_exit=True)
+
+        assert [e.field for e in full.errors] == ["pipeline_run_id", "extensions"]
+        assert short.valid is False
+        assert [e.field for e in short.errors] == ["pipeline_run_id"]
+
+    def test_early_exit_in_strict_mode_stops_on_warning(self):
+        snapshot = create_test_snapshot(topology=None, extensions=None)
+
+        result = validate_snapshot(snapshot, strict=True, early_exit=True)
+
+        assert [e.field for e in result.errors] == ["topology"]
+
+    def test_validate_snapshot_strict_reports_all_errors_on_request(self):
+        snapshot = ContextSnapshot(run_id=RunIdentity(), extensions=None)
+
+        with pytest.raises(ValueError, match="extensions must be a dict"):
+            validate_snapshot_strict(snapshot, early_exit=False)
+
+
+class TestSnapshotsFromDictsStrict:
+    """Tests for snapshots_from_dicts_strict."""
+
+    def test_builds_snapshots_in_order(self):
+        originals = [create_test_snapshot(input_text=str(i), extensions={}) for i in range(3)]
+
+        snapshots = snapshots_from_dicts_strict(s.to_dict() for s in originals)
+
+        assert [s.pipeline_run_id for s in snapshots] == [o.pipeline_run_id for o in originals]
+        assert [s.input_text for s in snapshots] == ["0", "1", "2"]
+
+    def test_raises_on_invalid_row(self):
+        rows = [create_test_snapshot(extensions={}).to_dict(), {"extensions": {}}]
+
+        with pytest.raises(ValueError, match="pipeline_run_id is required"):
+            snapshots_from_dicts_strict(rows)
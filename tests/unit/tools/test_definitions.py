@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from datetime import datetime
 from uuid import uuid4
 
 from stageflow.tools import (
@@ -123,6 +124,17 @@ class TestUndoMetadata:
         metadata = UndoMetadata.from_dict(data)
         assert metadata.action_id == action_id
         assert metadata.tool_name == "test_tool"
+        assert metadata.created_at == "2024-01-01T00:00:00Z"
+
+    def test_undo_metadata_from_dict_defaults_created_at(self) -> None:
+        """UndoMetadata stamps created_at when the stored dict lacks it."""
+        data = {
+            "action_id": str(uuid4()),
+            "tool_name": "test_tool",
+            "undo_data": {},
+        }
+        metadata = UndoMetadata.from_dict(data)
+        assert datetime.fromisoformat(metadata.created_at).tzinfo is not None
 
 
 class TestToolDefinition:
@@ -253,6 +253,7 @@ class TestDiffText:
         change_types = {c.type for c in result.changes}
         assert "remove" in change_types
         assert "add" in change_types
+        assert (result.additions, result.deletions, result.unchanged) == (1, 1, 2)
 
 
 class TestDiffJson:
@@ -292,6 +293,7 @@ class TestDiffJson:
         result = diff_json(old, new)
         assert result.has_changes is True
         assert '"op": "replace"' in result.diff_output
+        assert (result.additions, result.deletions) == (1, 0)
 
     def test_nested_dict(self) -> None:
         """diff_json handles nested dicts."""
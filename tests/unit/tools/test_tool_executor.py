@@ -0,0 +1,273 @@
+"""Tests for ToolExecutor.execute action dispatch."""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass, field
+from typing import Any
+from uuid import uuid4
+
+import pytest
+
+from stageflow.events import NoOpEventSink
+from stageflow.stages.context import PipelineContext
+from stageflow.tools.base import ToolInput, ToolOutput
+from stageflow.tools.executor import ToolExecutor, ToolExecutorResult
+from stageflow.tools.registry import ToolRegistry
+
+
+@dataclass
+class FakeAction:
+    type: str
+    payload: dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class FakePlan:
+    actions: list[FakeAction]
+
+
+class RecordingTool:
+    """Tool that echoes its action payload as an artifact."""
+
+    def __init__(self, action_type: str, *, gate: asyncio.Event | None = None) -> None:
+        self.action_type = action_type
+        self.name = action_type.lower()
+        self.description = "test tool"
+        self.gate = gate
+        self.contexts: list[dict[str, Any]] = []
+
+    async def execute(self, input: ToolInput, ctx: dict[str, Any]) -> ToolOutput:
+        self.contexts.append(ctx)
+        if self.gate is not None:
+            await asyncio.wait_for(self.gate.wait(), timeout=1.0)
+        payload = input.action.payload
+        if payload.get("fail"):
+            return ToolOutput(success=False, error="requested failure")
+        if payload.get("raise"):
+            raise RuntimeError("tool exploded")
+        return ToolOutput(success=True, artifacts=[{"id": payload.get("id")}])
+
+
+class ReleasingTool(RecordingTool):
+    """Tool that releases a gate other tools are waiting on."""
+
+    async def execute(self, input: ToolInput, ctx: dict[str, Any]) -> ToolOutput:  # noqa: ARG002
+        assert self.gate is not None
+        self.gate.set()
+        return ToolOutput(success=True, artifacts=[{"id": input.action.payload.get("id")}])
+
+
+def _make_context() -> PipelineContext:
+    return PipelineContext(
+        pipeline_run_id=uuid4(),
+        request_id=uuid4(),
+        topology="test",
+        execution_mode="practice",
+        event_sink=NoOpEventSink(),
+    )
+
+
+class ConcurrencyProbeTool(RecordingTool):
+    """Tool that records the peak number of concurrent executions."""
+
+    def __init__(self, action_type: str) -> None:
+        super().__init__(action_type)
+        self.active = 0
+        self.peak = 0
+
+    async def execute(self, input: ToolInput, ctx: dict[str, Any]) -> ToolOutput:  # noqa: ARG002
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        self.active -= 1
+        return ToolOutput(success=True, artifacts=[{"id": input.action.payload.get("id")}])
+
+
+def _make_executor(*tools: RecordingTool, **kwargs: Any) -> ToolExecutor:
+    executor = ToolExecutor(**kwargs)
+    registry = ToolRegistry()
+    for tool in tools:
+        registry.register(tool)
+    executor.tool_registry = registry
+    return executor
+
+
+class TestToolExecutorExecute:
+    """Tests for ToolExecutor.execute."""
+
+    @pytest.mark.asyncio
+    async def test_empty_plan(self):
+        executor = _make_executor()
+
+        result = await executor.execute(_make_context(), FakePlan(actions=[]))
+
+        assert result.actions_executed == 0
+        assert result.actions_failed == 0
+        assert result.requires_reentry is False
+
+    @pytest.mark.asyncio
+    async def test_actions_dispatch_concurrently(self):
+        """A blocked action should not hold up later actions in the plan."""
+        gate = asyncio.Event()
+        executor = _make_executor(
+            RecordingTool("WAIT", gate=gate),
+            ReleasingTool("RELEASE", gate=gate),
+            max_concurrency=2,
+        )
+        plan = FakePlan(
+            actions=[
+                FakeAction("WAIT", {"id": 1}),
+                FakeAction("RELEASE", {"id": 2}),
+            ]
+        )
+
+        result = await executor.execute(_make_context(), plan)
+
+        assert result.actions_executed == 2
+        assert result.artifacts_produced == [{"id": 1}, {"id": 2}]
+
+    @pytest.mark.asyncio
+    async def test_actions_run_in_plan_order_by_default(self):
+        """Without max_concurrency, each action finishes before the next starts."""
+        tool = ConcurrencyProbeTool("PROBE")
+        executor = _make_executor(tool)
+        plan = FakePlan(actions=[FakeAction("PROBE", {"id": i}) for i in range(4)])
+
+        result = await executor.execute(_make_context(), plan)
+
+        assert executor.max_concurrency == 1
+        assert tool.peak == 1
+        assert result.artifacts_produced == [{"id": i} for i in range(4)]
+
+    @pytest.mark.asyncio
+    async def test_sequential_action_waits_for_earlier_actions(self):
+        """A sequential action runs alone, after everything before it has finished."""
+        gate = asyncio.Event()
+        executor = _make_executor(
+            RecordingTool("WAIT", gate=gate),
+            ReleasingTool("RELEASE", gate=gate),
+            max_concurrency=4,
+        )
+        plan = FakePlan(
+            actions=[
+                FakeAction("WAIT", {"id": 1}),
+                FakeAction("RELEASE", {"id": 2, "sequential": True}),
+            ]
+        )
+
+        result = await executor.execute(_make_context(), plan)
+
+        # WAIT times out because RELEASE could not start until it finished.
+        assert result.actions_failed == 1
+        assert result.artifacts_produced == [{"id": 2}]
+
+    @pytest.mark.asyncio
+    async def test_aggregates_failures_in_plan_order(self):
+        executor = _make_executor(RecordingTool("WRITE"))
+        plan = FakePlan(
+            actions=[
+                FakeAction("WRITE", {"id": 1}),
+                FakeAction("WRITE", {"fail": True}),
+                FakeAction("WRITE", {"raise": True}),
+                FakeAction("MISSING"),
+                FakeAction("WRITE", {"id": 5}),
+            ]
+        )
+
+        result = await executor.execute(_make_context(), plan)
+
+        assert result.actions_executed == 2
+        assert result.actions_failed == 3
+        assert result.artifacts_produced == [{"id": 1}, {"id": 5}]
+        assert result.requires_reentry is True
+
+    @pytest.mark.asyncio
+    async def test_requires_reentry_from_payload(self):
+        executor = _make_executor(RecordingTool("WRITE"))
+        plan = FakePlan(actions=[FakeAction("WRITE", {"id": 1, "requires_reentry": True})])
+
+        result = await executor.execute(_make_context(), plan)
+
+        assert result.actions_failed == 0
+        assert result.requires_reentry is True
+
+    @pytest.mark.asyncio
+    async def test_each_action_gets_its_own_context_dict(self):
+        tool = RecordingTool("WRITE")
+        executor = _make_executor(tool)
+        ctx = _make_context()
+        plan = FakePlan(actions=[FakeAction("WRITE", {"id": 1}), FakeAction("WRITE", {"id": 2})])
+
+        await executor.execute(ctx, plan)
+
+        first, second = tool.contexts
+        assert first == second == ctx.to_dict()
+        assert first is not second
+
+    @pytest.mark.asyncio
+    async def test_max_concurrency_bounds_in_flight_actions(self):
+        tool = ConcurrencyProbeTool("PROBE")
+        executor = _make_executor(tool, max_concurrency=3)
+        plan = FakePlan(actions=[FakeAction("PROBE", {"id": i}) for i in range(10)])
+
+        result = await executor.execute(_make_context(), plan)
+
+        assert tool.peak == 3
+        assert result.actions_executed == 10
+        assert result.artifacts_produced == [{"id": i} for i in range(10)]
+
+    @pytest.mark.asyncio
+    async def test_max_concurrency_one_runs_serially(self):
+        tool = ConcurrencyProbeTool("PROBE")
+        executor = _make_executor(tool, max_concurrency=1)
+        plan = FakePlan(actions=[FakeAction("PROBE", {"id": i}) for i in range(4)])
+
+        await executor.execute(_make_context(), plan)
+
+        assert tool.peak == 1
+
+    def test_rejects_non_positive_max_concurrency(self):
+        with pytest.raises(ValueError, match="max_concurrency"):
+            ToolExecutor(max_concurrency=0)
+
+    @pytest.mark.asyncio
+    async def test_reuses_caller_result(self):
+        executor = _make_executor(RecordingTool("WRITE"))
+        ctx = _make_context()
+        result = ToolExecutorResult()
+
+        first = await executor.execute(
+            ctx, FakePlan(actions=[FakeAction("WRITE", {"fail": True})]), result=result
+        )
+        assert first is result
+        assert result.actions_failed == 1
+        assert result.requires_reentry is True
+
+        artifacts = result.artifacts_produced
+        second = await executor.execute(
+            ctx, FakePlan(actions=[FakeAction("WRITE", {"id": 7})]), result=result
+        )
+
+        assert second is result
+        assert result.actions_executed == 1
+        assert result.actions_failed == 0
+        assert result.requires_reentry is False
+        assert result.artifacts_produced is artifacts
+        assert artifacts == [{"id": 7}]
+
+        await executor.execute(ctx, FakePlan(actions=[]), result=result)
+        assert result == ToolExecutorResult()
+
+
+class TestToolRecords:
+    def test_tool_input_and_output_are_slotted(self):
+        action = FakeAction("WRITE", {"id": 1})
+        tool_input = ToolInput(action=action)
+        output = ToolOutput(success=True, data={"id": 1})
+
+        assert not hasattr(tool_input, "__dict__")
+        assert not hasattr(output, "__dict__")
+        assert tool_input.action is action
+        assert output == ToolOutput(success=True, data={"id": 1})
@@ -13,6 +13,7 @@ from stageflow.websearch.run_utils import (
     extract_all_links,
     fetch_page,
     fetch_pages,
+    fetch_with_retry,
     map_site,
     search_and_extract,
     shutdown_extraction_pool,
@@ -189,6 +190,28 @@ class TestFetchWithRetry:
 
         assert page.success
 
+    @pytest.mark.asyncio
+    async def test_retries_share_one_client(self) -> None:
+        """All attempts should go through a single client."""
+        created: list[WebSearchClient] = []
+        factory = make_client_factory({})
+
+        def counting_factory() -> WebSearchClient:
+            client = factory()
+            created.append(client)
+            return client
+
+        page = await fetch_with_retry(
+            "https://missing.example.com",
+            max_retries=2,
+            retry_delay=0,
+            client_factory=counting_factory,
+        )
+
+        assert not page.success
+        assert "Failed after 3 attempts" in (page.error or "")
+        assert len(created) == 1
+
 
 class TestSearchAndExtract:
     """Tests for search_and_extract function."""
@@ -248,6 +271,18 @@ class TestSearchAndExtract:
         assert len(result.pages) >= 1
         assert len(result.relevant_pages) >= 1
 
+        ranked = await search_and_extract(
+            start_url="https://example.com",
+            query="asyncio tutorial",
+            max_pages=10,
+            max_depth=1,
+            relevance_threshold=0.0,
+            client_factory=make_client_factory(responses),
+        )
+
+        assert len(ranked.relevant_pages) == 3
+        assert ranked.relevant_pages[-1].url == "https://example.com/other"
+
 
 class TestMapSite:
     """Tests for map_site function."""